@@ -1,15 +1,55 @@
 from collections.abc import AsyncGenerator
+from typing import Any
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
 from app.config import settings
+from app.utils.db_health import DatabaseHealthCheck
+from app.utils.db_pool import InstrumentedAsyncQueuePool
+from app.utils.replica import ReplicaMonitor
 
-# The engine manages a pool of DB connections.
-# echo=True logs SQL in debug mode — useful for learning what SQLAlchemy generates.
-engine = create_async_engine(
-    settings.database_url,
-    echo=settings.debug,
-)
+
+def _connect_args() -> dict[str, Any]:
+    """asyncpg connection options from settings."""
+    connect_args: dict[str, Any] = {
+        "prepared_statement_cache_size": settings.db_prepared_statement_cache_size,
+    }
+    if settings.db_statement_timeout_ms > 0:
+        # Sent as a startup parameter, so it applies to every statement on
+        # the connection without an extra SET round trip.
+        connect_args["server_settings"] = {
+            "statement_timeout": str(settings.db_statement_timeout_ms),
+        }
+    return connect_args
+
+
+def _create_engine(url: str) -> AsyncEngine:
+    """Engine with the pool settings from `Settings.db_*`.
+
+    The instrumented pool records checkout wait times for
+    GET /admin/diagnostics/pool.
+    echo=True logs SQL in debug mode — useful for learning what SQLAlchemy generates.
+    """
+    return create_async_engine(
+        url,
+        echo=settings.debug,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout_seconds,
+        pool_recycle=settings.db_pool_recycle_seconds,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        connect_args=_connect_args(),
+    )
+
+
+# The engine manages a pool of DB connections to the primary.
+engine = _create_engine(settings.database_url)
 
 # Session factory — each request gets its own session (unit of work pattern).
 # expire_on_commit=False lets us access attributes after commit without re-querying.
@@ -19,6 +59,30 @@ async_session = async_sessionmaker(
     expire_on_commit=False,
 )
 
+# Optional read replica for the storefront's read-only routes. The monitor
+# decides per request (from a cached probe) whether the replica is usable.
+read_engine: AsyncEngine | None = None
+read_session: async_sessionmaker[AsyncSession] | None = None
+replica_monitor: ReplicaMonitor | None = None
+if settings.read_database_url:
+    read_engine = _create_engine(settings.read_database_url)
+    read_session = async_sessionmaker(read_engine, class_=AsyncSession, expire_on_commit=False)
+    replica_monitor = ReplicaMonitor(
+        read_engine,
+        max_lag_seconds=settings.replica_max_lag_seconds,
+        check_interval=settings.replica_check_interval_seconds,
+        check_timeout=settings.replica_check_timeout_seconds,
+    )
+
+# Cached primary health for the readiness endpoint; the app lifespan starts
+# its background refresh. It also keeps the replica verdict fresh.
+db_health = DatabaseHealthCheck(
+    engine,
+    interval=settings.health_check_interval_seconds,
+    timeout=settings.health_check_timeout_seconds,
+    replica_monitor=replica_monitor,
+)
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """FastAPI dependency that provides a DB session per request.
@@ -30,3 +94,33 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     async with async_session() as session:
         yield session
+
+
+def record_primary_write() -> None:
+    """Note a committed write, so this process reads its own writes.
+
+    Called by services after committing changes that read-only routes
+    serve (see `ReplicaMonitor.record_write`). No-op without a replica.
+    """
+    if replica_monitor is not None:
+        replica_monitor.record_write()
+
+
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """FastAPI dependency for read-only routes: a replica session when possible.
+
+    Falls back to the primary when no replica is configured, or when the
+    replica is down or lagging (see `app.utils.replica`). Only use it for
+    routes that never write, and that can tolerate data a few seconds old.
+    """
+    if (
+        read_session is not None
+        and replica_monitor is not None
+        and await replica_monitor.use_replica()
+    ):
+        async with read_session() as session:
+            yield session
+        return
+
+    async with async_session() as session:
+        yield session
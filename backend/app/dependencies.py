@@ -21,17 +21,17 @@ FastAPI resolves the dependency chain automatically:
 which would create a cycle if database.py imported models).
 """
 
-import uuid
+from functools import lru_cache
 
-import jwt
+import stripe
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
 from app.database import get_db
 from app.models.admin_user import AdminUser
-from app.utils.security import decode_token
+from app.services.auth import get_admin_for_token
 
 # HTTPBearer extracts the token from the `Authorization: Bearer <token>` header.
 # `auto_error=True` (default) means FastAPI returns 403 if the header is missing.
@@ -44,33 +44,43 @@ async def get_current_admin(
 ) -> AdminUser:
     """Dependency that extracts and validates the JWT, then returns the admin user.
 
+    Verified tokens and admin rows are cached per process (see
+    `app.services.auth`), so a repeat request usually costs neither a
+    signature check nor a DB query. The returned admin may be a shared,
+    detached instance — treat it as read-only.
+
     Raises HTTPException 401 if:
     - The token is expired or tampered with
     - The token's `sub` claim doesn't match any admin user
     """
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Invalid or expired token",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-
-    try:
-        payload = decode_token(credentials.credentials)
-        subject = payload.get("sub")
-        if subject is None:
-            raise credentials_exception
-    except jwt.PyJWTError:
-        raise credentials_exception from None
-
-    try:
-        admin_id = uuid.UUID(subject)
-    except ValueError:
-        raise credentials_exception from None
-
-    result = await db.execute(select(AdminUser).where(AdminUser.id == admin_id))
-    admin = result.scalar_one_or_none()
+    admin = await get_admin_for_token(db, credentials.credentials)
 
     if admin is None:
-        raise credentials_exception
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
 
     return admin
+
+
+@lru_cache(maxsize=1)
+def _stripe_client(api_key: str) -> stripe.StripeClient:
+    # The httpx client supports the async methods (`create_async`), so a
+    # Stripe call never blocks the event loop. One client per process
+    # reuses its connection pool across requests.
+    return stripe.StripeClient(api_key, http_client=stripe.HTTPXClient())
+
+
+def get_stripe_client() -> stripe.StripeClient:
+    """Dependency for routes that call Stripe. Tests override it with a stub.
+
+    Raises HTTPException 503 if no Stripe key is configured.
+    """
+    if not settings.stripe_secret_key:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Payments are not configured",
+        )
+    return _stripe_client(settings.stripe_secret_key)
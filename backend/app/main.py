@@ -9,12 +9,29 @@ from slowapi.errors import RateLimitExceeded
 from sqlalchemy import text
 
 from app.config import settings
-from app.database import engine
+from app.database import async_session, db_health, engine, read_engine
 from app.rate_limit import limiter
-from app.routers import admin_products, auth, health, products
+from app.routers import (
+    admin_products,
+    auth,
+    checkout,
+    diagnostics,
+    health,
+    products,
+    webhooks,
+)
+from app.services.reservation import ReservationSweeper
+from app.services.webhook import webhook_workers
+from app.utils.request_timing import RequestTimingMiddleware, install_query_hooks
 
 logger = logging.getLogger(__name__)
 
+reservation_sweeper = ReservationSweeper(
+    async_session,
+    interval=settings.reservation_sweep_interval_seconds,
+    batch_size=settings.reservation_sweep_batch_size,
+)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
@@ -26,12 +43,21 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     Here we verify the DB is reachable. If it's not, the app will fail
     to start rather than accepting requests and failing on every one.
+    Then the background health check keeps GET /health/ready current,
+    the reservation sweeper returns expired checkout holds to stock, and
+    the webhook workers handle stored Stripe events.
     """
     # Verify DB connection on startup
     async with engine.connect() as conn:
         await conn.execute(text("SELECT 1"))
     logger.info("Database connection verified")
+    db_health.start()
+    reservation_sweeper.start()
+    webhook_workers.start()
     yield
+    await webhook_workers.stop()
+    await reservation_sweeper.stop()
+    await db_health.stop()
 
 
 app = FastAPI(
@@ -41,7 +67,7 @@ app = FastAPI(
 
 # Rate limiting — prevents brute-force attacks on login.
 # slowapi stores hit counts in memory by default. For multi-process
-# production deployments, switch to a Redis backend.
+# deployments, set RATE_LIMIT_STORAGE_URI (see app/rate_limit.py).
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
@@ -55,8 +81,19 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Server-Timing (query count, DB time, total) on every response. Added
+# last, so it's the outermost middleware and times everything inside it.
+if settings.request_timing_enabled:
+    install_query_hooks(engine)
+    if read_engine is not None:
+        install_query_hooks(read_engine)
+    app.add_middleware(RequestTimingMiddleware, log_min_ms=settings.request_timing_log_min_ms)
+
 # Register routers
 app.include_router(health.router, prefix=settings.api_v1_prefix)
 app.include_router(auth.router, prefix=settings.api_v1_prefix)
 app.include_router(products.router, prefix=settings.api_v1_prefix)
 app.include_router(admin_products.router, prefix=settings.api_v1_prefix)
+app.include_router(diagnostics.router, prefix=settings.api_v1_prefix)
+app.include_router(checkout.router, prefix=settings.api_v1_prefix)
+app.include_router(webhooks.router, prefix=settings.api_v1_prefix)
@@ -9,6 +9,8 @@ from app.models.admin_user import AdminUser
 from app.models.base import Base
 from app.models.order import Order, OrderItem, OrderStatus
 from app.models.product import Product, ProductCategory, ProductCondition
+from app.models.reservation import ProductReservation
+from app.models.webhook_event import WebhookEvent, WebhookEventStatus
 
 __all__ = [
     "AdminUser",
@@ -19,4 +21,7 @@ __all__ = [
     "Product",
     "ProductCategory",
     "ProductCondition",
+    "ProductReservation",
+    "WebhookEvent",
+    "WebhookEventStatus",
 ]
@@ -15,15 +15,37 @@ Key patterns introduced here:
 
 3. **unique=True on slug**: Enforced at the DB level. Even if our app code
    has a bug, the DB will reject duplicate slugs. Defense in depth.
+
+4. **Composite index via `__table_args__`**: `(created_at, id)` backs the
+   listing sort order, so keyset pagination can seek straight to a cursor
+   instead of scanning past OFFSET rows. Multi-column indexes can't be
+   declared with `index=True` on a single column — they go in `__table_args__`.
+
+5. **Trigram GIN index on name**: A btree index can't help `ILIKE '%miku%'`
+   because the match can start anywhere. pg_trgm's GIN index stores every
+   3-character chunk of each name, so Postgres can look up candidate rows
+   by the chunks of the search term instead of scanning the table.
+   Requires the `pg_trgm` extension (created by the migration).
+
+6. **Generated tsvector column**: `search_vector` is computed by Postgres
+   (`GENERATED ALWAYS AS ... STORED`) from name + description on every
+   INSERT/UPDATE, so it can never drift from the text it indexes. It's
+   `deferred` — only full-text queries read it, regular loads skip it.
 """
 
 import enum
 
-from sqlalchemy import Boolean, Enum, Integer, String, Text
+from sqlalchemy import Boolean, Computed, Enum, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models.base import Base
 
+# Postgres text search configuration: controls stemming ("figures" → "figur")
+# and stop words. Must be a literal in the generated column — only the
+# two-argument form of to_tsvector() is immutable.
+FTS_CONFIG = "english"
+
 
 class ProductCondition(str, enum.Enum):
     """Condition of the figurine.
@@ -48,6 +70,16 @@ class ProductCategory(str, enum.Enum):
 
 class Product(Base):
     __tablename__ = "products"
+    __table_args__ = (
+        Index("ix_products_created_at_id", "created_at", "id"),
+        Index(
+            "ix_products_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index("ix_products_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     name: Mapped[str] = mapped_column(String(255))
     slug: Mapped[str] = mapped_column(String(255), unique=True, index=True)
@@ -71,3 +103,14 @@ class Product(Base):
 
     # Usually 1 for resale items. Kept for flexibility.
     quantity: Mapped[int] = mapped_column(Integer, default=1)
+
+    # Weighted so name matches (A) rank above description-only matches (B).
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(
+            f"setweight(to_tsvector('{FTS_CONFIG}', coalesce(name, '')), 'A') || "
+            f"setweight(to_tsvector('{FTS_CONFIG}', coalesce(description, '')), 'B')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
@@ -0,0 +1,37 @@
+"""ProductReservation model — a unit of stock held for a checkout in progress.
+
+Key patterns:
+
+1. **Reserve = decrement + row, in one transaction**: reserving takes one unit
+   of `Product.quantity` and records who holds it. Releasing (expiry, failed
+   checkout) deletes the row and gives the unit back. So for every product,
+   `quantity` + its reservation rows = the stock we actually have.
+
+2. **hold_id groups a cart**: every product reserved by one checkout shares a
+   `hold_id`. It is sent to Stripe as the session's `client_reference_id`, so
+   the webhook can find (and consume or release) the whole hold at once.
+
+3. **expires_at is set by the database**: `now() + ttl` on insert, and the
+   sweeper compares against `now()` — one clock, whatever the app servers' are.
+
+4. **Index on expires_at**: the sweeper's lookup is "oldest expired first",
+   which this index answers without scanning live reservations.
+"""
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class ProductReservation(Base):
+    __tablename__ = "product_reservations"
+
+    hold_id: Mapped[uuid.UUID] = mapped_column(index=True)
+    product_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("products.id", ondelete="CASCADE"), index=True
+    )
+    expires_at: Mapped[datetime] = mapped_column(index=True)
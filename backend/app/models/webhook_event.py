@@ -0,0 +1,61 @@
+"""WebhookEvent model — a Stripe event received, waiting to be (or already) handled.
+
+Key patterns:
+
+1. **Unique stripe_event_id**: Stripe delivers events at least once and
+   retries anything it didn't see acknowledged. The unique constraint makes
+   storing an event idempotent — a redelivery hits `ON CONFLICT DO NOTHING`
+   and is acknowledged without being queued twice.
+
+2. **The table is the queue**: rows are `pending` until a worker handles
+   them. `next_attempt_at` is when a worker may (re)try one: now for new
+   events, later after a failure (backoff), and a lease into the future
+   while a worker holds it — so an event claimed by a crashed process
+   becomes visible again once the lease runs out.
+
+3. **Partial index for claiming**: workers only ever look for pending rows
+   due soonest. Indexing `next_attempt_at` just for `status = 'pending'`
+   keeps the index the size of the backlog, not of the event history.
+"""
+
+import enum
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import Enum, Index, Integer, String, Text, func, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class WebhookEventStatus(str, enum.Enum):
+    """Where an event is in processing."""
+
+    PENDING = "pending"
+    PROCESSED = "processed"
+    FAILED = "failed"  # gave up after webhook_max_attempts
+
+
+class WebhookEvent(Base):
+    __tablename__ = "webhook_events"
+    __table_args__ = (
+        Index(
+            "ix_webhook_events_pending_next_attempt_at",
+            "next_attempt_at",
+            postgresql_where=text("status = 'pending'"),
+        ),
+    )
+
+    stripe_event_id: Mapped[str] = mapped_column(String(255), unique=True)
+    type: Mapped[str] = mapped_column(String(255))
+    payload: Mapped[dict[str, Any]] = mapped_column(JSONB)
+
+    status: Mapped[WebhookEventStatus] = mapped_column(
+        Enum(WebhookEventStatus, values_callable=lambda e: [x.value for x in e]),
+        default=WebhookEventStatus.PENDING,
+    )
+    attempts: Mapped[int] = mapped_column(Integer, default=0)
+    next_attempt_at: Mapped[datetime] = mapped_column(server_default=func.now())
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    processed_at: Mapped[datetime | None] = mapped_column(nullable=True)
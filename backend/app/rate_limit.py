@@ -9,7 +9,8 @@ Flask-Limiter if you've used that.
 - When the limit is exceeded, slowapi raises `RateLimitExceeded`, which
   the exception handler in main.py converts to a 429 Too Many Requests response.
 - Hit counts are stored in memory by default (fine for single-process dev).
-  For production with multiple workers, use Redis as the storage backend.
+  With multiple workers on one host, set `RATE_LIMIT_STORAGE_URI` to a
+  `sqlite:///` file so they share counters; across hosts, use Redis.
 
 **Why a separate module?**
 The limiter instance needs to be imported by both `main.py` (to register
@@ -20,7 +21,22 @@ Putting it in main.py would create circular imports.
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
+# Imported for its side effect: registers the `sqlite://` storage scheme.
+import app.utils.rate_limit_storage  # noqa: F401
+from app.config import settings
+
 # get_remote_address extracts the client IP from the request.
 # Behind a reverse proxy (Railway, Vercel), you'd use a header like
 # X-Forwarded-For instead. We'll update this at deploy time (Phase 7).
-limiter = Limiter(key_func=get_remote_address)
+limiter = Limiter(
+    key_func=get_remote_address,
+    storage_uri=settings.rate_limit_storage_uri,
+    # Only the sqlite:// backend knows this option; others reject unknown ones.
+    storage_options=(
+        {"busy_timeout_ms": str(settings.rate_limit_sqlite_busy_timeout_ms)}
+        if settings.rate_limit_storage_uri.startswith("sqlite:")
+        else {}
+    ),
+    strategy=settings.rate_limit_strategy,
+    swallow_errors=settings.rate_limit_fail_open,
+)
@@ -0,0 +1,72 @@
+"""Rendered-response cache for the public catalog endpoints.
+
+The catalog changes a few times a day but is read on every storefront
+page view. Caching the *serialized JSON bytes* (not ORM objects or Pydantic
+models) means a hit skips the DB queries, `model_validate`, and JSON
+encoding entirely — the route just writes the bytes back out.
+
+Each entry carries its ETag and Last-Modified alongside the body, so a
+conditional request that hits the cache is answered (304 or 200) without
+touching the DB.
+
+**Invalidation:** every product write in `app/services/product.py` calls
+`invalidate_product_caches()`, which clears this cache. With several
+uvicorn workers, only the worker that handled the write is cleared
+immediately; the others serve their cached copy until the TTL expires.
+
+**Why a separate module?**
+Same reason as `rate_limit.py`: both the routers (read/fill) and the
+product service (invalidate) need the singleton, and putting it in either
+one would create a circular import.
+"""
+
+from collections.abc import Mapping
+from datetime import datetime
+from typing import NamedTuple
+
+from fastapi import Response
+
+from app.config import settings
+from app.schemas.product import ProductListParams
+from app.utils.cache import TTLCache
+from app.utils.http_cache import is_not_modified, not_modified, validator_headers
+
+
+class CachedResponse(NamedTuple):
+    """A rendered JSON body plus the validators that describe it."""
+
+    etag: str
+    last_modified: datetime | None
+    body: bytes
+
+
+catalog_cache: TTLCache[str, CachedResponse] = TTLCache(
+    maxsize=settings.catalog_cache_size,
+    ttl_seconds=settings.catalog_cache_ttl_seconds,
+)
+
+
+def list_cache_key(params: ProductListParams) -> str:
+    """Cache key for a product list page.
+
+    `model_dump_json()` on the validated params is a normalized key:
+    defaults are filled in and fields always serialize in declaration
+    order, so `?page=1&category=plush` and `?category=plush` share an entry.
+    """
+    return f"list:{params.model_dump_json()}"
+
+
+def detail_cache_key(slug: str) -> str:
+    """Cache key for a single product page."""
+    return f"detail:{slug}"
+
+
+def render(cached: CachedResponse, request_headers: Mapping[str, str]) -> Response:
+    """Answer from a cached entry: 304 if the client's copy is current, else the body."""
+    if is_not_modified(request_headers, cached.etag, cached.last_modified):
+        return not_modified(cached.etag, cached.last_modified)
+    return Response(
+        content=cached.body,
+        media_type="application/json",
+        headers=validator_headers(cached.etag, cached.last_modified),
+    )
@@ -11,8 +11,11 @@ might change the slug during an edit.
 """
 
 import uuid
+from collections.abc import AsyncIterator
+from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from sqlalchemy import Row
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -21,19 +24,40 @@ from app.dependencies import get_current_admin
 from app.models.admin_user import AdminUser
 from app.schemas.product import (
     PaginatedProductResponse,
+    ProductBulkIds,
+    ProductBulkResponse,
+    ProductBulkUpdate,
     ProductCreate,
+    ProductImportResponse,
     ProductListParams,
+    ProductReprice,
     ProductResponse,
     ProductUpdate,
 )
 from app.services.product import (
+    InvalidCursorError,
+    bulk_soft_delete_products,
+    bulk_update_products,
     calculate_pages,
     create_product,
     get_product_by_id,
     list_products,
+    reprice_products,
     soft_delete_product,
     update_product,
 )
+from app.services.product_import import (
+    REQUIRED_COLUMNS,
+    ConflictMode,
+    ProductImportTooLargeError,
+    import_products,
+)
+from app.utils.record_stream import (
+    Record,
+    RecordFormatError,
+    iter_csv_records,
+    iter_ndjson_records,
+)
 
 router = APIRouter(prefix="/admin/products", tags=["admin-products"])
 
@@ -50,16 +74,24 @@ async def admin_list_products(
     use the admin object in this route — we only need the dependency
     to run for its auth side effect (rejecting unauthenticated requests).
     """
-    # Admins see all products, including unavailable ones
+    # Admins see all products, including unavailable ones, with every field
     params.available_only = False
-    products, total = await list_products(db, params)
+    params.fields = "full"
+    try:
+        rows, total, next_cursor = await list_products(db, params)
+    except InvalidCursorError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor",
+        ) from exc
 
     return PaginatedProductResponse(
-        items=[ProductResponse.model_validate(p) for p in products],
+        items=[ProductResponse.model_validate(row) for row in rows],
         total=total,
         page=params.page,
         per_page=params.per_page,
-        pages=calculate_pages(total, params.per_page),
+        pages=calculate_pages(total, params.per_page) if total is not None else None,
+        next_cursor=next_cursor,
     )
 
 
@@ -80,6 +112,84 @@ async def admin_create_product(
     return ProductResponse.model_validate(product)
 
 
+@router.post("/bulk", response_model=ProductImportResponse)
+async def admin_import_products(
+    request: Request,
+    on_conflict: ConflictMode = "skip",
+    _admin: AdminUser = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_db),
+) -> ProductImportResponse:
+    """Import many products from a CSV or NDJSON request body.
+
+    The body is parsed as it streams in (`Content-Type: text/csv` with a
+    header row, or `application/x-ndjson`). Each row is validated like
+    `POST /admin/products`; invalid rows are reported, valid ones written.
+    `on_conflict=update` overwrites products whose slug already exists
+    instead of skipping them.
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    records: AsyncIterator[Record]
+    if content_type == "text/csv":
+        records = iter_csv_records(request.stream(), required_columns=REQUIRED_COLUMNS)
+    elif content_type in ("application/x-ndjson", "application/jsonl"):
+        records = iter_ndjson_records(request.stream())
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Send text/csv or application/x-ndjson",
+        )
+
+    try:
+        return await import_products(db, records, on_conflict)
+    except RecordFormatError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    except ProductImportTooLargeError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=str(exc)
+        ) from exc
+
+
+def _bulk_response(rows: list[Row[Any]], not_found: list[uuid.UUID]) -> ProductBulkResponse:
+    return ProductBulkResponse(
+        updated=len(rows),
+        items=[ProductResponse.model_validate(row) for row in rows],
+        not_found=not_found,
+    )
+
+
+@router.patch("/bulk", response_model=ProductBulkResponse)
+async def admin_bulk_update_products(
+    body: ProductBulkUpdate,
+    _admin: AdminUser = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_db),
+) -> ProductBulkResponse:
+    """Apply the same partial update to every product in `ids`."""
+    rows, not_found = await bulk_update_products(db, body.ids, body.changes)
+    return _bulk_response(rows, not_found)
+
+
+@router.post("/bulk/delete", response_model=ProductBulkResponse)
+async def admin_bulk_delete_products(
+    body: ProductBulkIds,
+    _admin: AdminUser = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_db),
+) -> ProductBulkResponse:
+    """Soft-delete every product in `ids` (a POST: DELETE bodies are poorly supported)."""
+    rows, not_found = await bulk_soft_delete_products(db, body.ids)
+    return _bulk_response(rows, not_found)
+
+
+@router.post("/bulk/reprice", response_model=ProductBulkResponse)
+async def admin_reprice_products(
+    body: ProductReprice,
+    _admin: AdminUser = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_db),
+) -> ProductBulkResponse:
+    """Raise or lower prices by a percentage, by ids and/or category."""
+    rows, not_found = await reprice_products(db, body.percent, body.ids, body.category)
+    return _bulk_response(rows, not_found)
+
+
 @router.get("/{product_id}", response_model=ProductResponse)
 async def admin_get_product(
     product_id: uuid.UUID,
@@ -106,7 +216,13 @@ async def admin_update_product(
     db: AsyncSession = Depends(get_db),
 ) -> ProductResponse:
     """Update a product (partial update — send only changed fields)."""
-    product = await get_product_by_id(db, product_id)
+    try:
+        product = await update_product(db, product_id, body)
+    except IntegrityError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A product with this slug already exists",
+        ) from exc
 
     if product is None:
         raise HTTPException(
@@ -114,8 +230,7 @@ async def admin_update_product(
             detail="Product not found",
         )
 
-    updated = await update_product(db, product, body)
-    return ProductResponse.model_validate(updated)
+    return ProductResponse.model_validate(product)
 
 
 @router.delete("/{product_id}", response_model=ProductResponse)
@@ -128,7 +243,7 @@ async def admin_delete_product(
 
     Products are never hard-deleted because existing orders might reference them.
     """
-    product = await get_product_by_id(db, product_id)
+    product = await soft_delete_product(db, product_id)
 
     if product is None:
         raise HTTPException(
@@ -136,5 +251,4 @@ async def admin_delete_product(
             detail="Product not found",
         )
 
-    deleted = await soft_delete_product(db, product)
-    return ProductResponse.model_validate(deleted)
+    return ProductResponse.model_validate(product)
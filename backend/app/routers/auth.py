@@ -16,7 +16,7 @@ from app.database import get_db
 from app.rate_limit import limiter
 from app.schemas.auth import LoginRequest, TokenResponse
 from app.services.auth import authenticate_admin
-from app.utils.security import create_access_token
+from app.utils.security import PasswordHasherBusyError, create_access_token
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
@@ -33,8 +33,18 @@ async def login(
     The generic "Invalid email or password" message is intentional —
     we don't reveal whether the email exists. This is a security
     best practice to prevent user enumeration attacks.
+
+    503 means too many password checks are already queued — the client
+    should retry shortly.
     """
-    admin = await authenticate_admin(db, body.email, body.password)
+    try:
+        admin = await authenticate_admin(db, body.email, body.password)
+    except PasswordHasherBusyError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many login attempts in progress, try again shortly",
+            headers={"Retry-After": "1"},
+        ) from exc
 
     if admin is None:
         raise HTTPException(
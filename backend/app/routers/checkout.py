@@ -0,0 +1,76 @@
+"""Checkout routes — start a Stripe Checkout payment for a cart.
+
+Thin on purpose: the checkout service validates the cart and talks to
+Stripe; this router maps its errors to status codes the frontend handles:
+- 404: some products don't exist
+- 409: some products were sold or taken down (the frontend shows
+  "item unavailable" and lets the customer remove them)
+- 409 also covers items another customer has reserved (is checking out)
+- 422: the same product is in the cart twice
+- 502: Stripe failed
+- 503: too many checkouts for the same items at once; retry shortly
+"""
+
+import logging
+import uuid
+
+import stripe
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_db
+from app.dependencies import get_stripe_client
+from app.schemas.order import CheckoutRequest, CheckoutResponse
+from app.services.checkout import CheckoutItemsError, create_checkout_session
+from app.services.reservation import ReservationBusyError
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/checkout", tags=["checkout"])
+
+
+def _ids(ids: list[uuid.UUID]) -> list[str]:
+    return [str(product_id) for product_id in ids]
+
+
+@router.post("/create-session", response_model=CheckoutResponse)
+async def create_session(
+    body: CheckoutRequest,
+    db: AsyncSession = Depends(get_db),
+    stripe_client: stripe.StripeClient = Depends(get_stripe_client),
+) -> CheckoutResponse:
+    """Create a Stripe Checkout Session and return its URL to redirect to.
+
+    On a bad cart, `detail` lists every offending id by reason, so the
+    frontend can fix the whole cart at once.
+    """
+    try:
+        return await create_checkout_session(db, body.items, stripe_client)
+    except CheckoutItemsError as exc:
+        if exc.missing:
+            status_code = status.HTTP_404_NOT_FOUND
+        elif exc.unavailable:
+            status_code = status.HTTP_409_CONFLICT
+        else:
+            status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+        raise HTTPException(
+            status_code=status_code,
+            detail={
+                "message": str(exc),
+                "missing": _ids(exc.missing),
+                "unavailable": _ids(exc.unavailable),
+                "duplicates": _ids(exc.duplicates),
+            },
+        ) from exc
+    except ReservationBusyError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="These items are in high demand, try again shortly",
+            headers={"Retry-After": "1"},
+        ) from exc
+    except stripe.StripeError as exc:
+        logger.warning("Stripe checkout session failed: %s", exc)
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail="Payment provider error, try again shortly",
+        ) from exc
@@ -0,0 +1,76 @@
+"""Admin diagnostics routes — runtime internals for monitoring.
+
+Everything here describes the *worker process that served the request*.
+With several uvicorn workers, each one has its own caches, so repeated
+calls may land on different workers and show different numbers.
+
+Admin-only: these numbers reveal traffic patterns and aren't for the public.
+"""
+
+from typing import Any
+
+from fastapi import APIRouter, Depends
+
+from app.database import engine
+from app.dependencies import get_current_admin
+from app.models.admin_user import AdminUser
+from app.response_cache import catalog_cache
+from app.schemas.diagnostics import CacheStatsResponse, PoolStatsResponse
+from app.services.auth import admin_cache, token_cache
+from app.services.product import product_count_cache
+from app.utils.cache import TTLCache
+from app.utils.db_pool import InstrumentedAsyncQueuePool
+
+router = APIRouter(prefix="/admin/diagnostics", tags=["admin-diagnostics"])
+
+
+def _cache_stats(cache: TTLCache[Any, Any]) -> CacheStatsResponse:
+    return CacheStatsResponse(
+        size=len(cache),
+        maxsize=cache.maxsize,
+        ttl_seconds=cache.ttl_seconds,
+        hits=cache.stats.hits,
+        misses=cache.stats.misses,
+        evictions=cache.stats.evictions,
+        hit_ratio=cache.stats.hit_ratio,
+    )
+
+
+@router.get("/caches", response_model=dict[str, CacheStatsResponse])
+async def cache_stats(
+    _admin: AdminUser = Depends(get_current_admin),
+) -> dict[str, CacheStatsResponse]:
+    """Hit/miss/eviction counters for every in-process cache."""
+    caches: dict[str, TTLCache[Any, Any]] = {
+        "catalog_responses": catalog_cache,
+        "product_counts": product_count_cache,
+        "auth_tokens": token_cache,
+        "admin_users": admin_cache,
+    }
+    return {name: _cache_stats(cache) for name, cache in caches.items()}
+
+
+def _pool_stats(pool: InstrumentedAsyncQueuePool) -> PoolStatsResponse:
+    wait_ms = pool.checkout_stats.wait_ms
+    return PoolStatsResponse(
+        size=pool.size(),
+        checked_out=pool.checkedout(),
+        checked_in=pool.checkedin(),
+        overflow=max(pool.overflow(), 0),
+        max_overflow=pool._max_overflow,
+        timeout_seconds=pool.timeout(),
+        checkouts=wait_ms.count,
+        checkout_timeouts=pool.checkout_stats.timeouts,
+        wait_ms_mean=wait_ms.mean,
+        wait_ms_buckets=wait_ms.buckets(),
+    )
+
+
+@router.get("/pool", response_model=PoolStatsResponse)
+async def pool_stats(
+    _admin: AdminUser = Depends(get_current_admin),
+) -> PoolStatsResponse:
+    """Connection pool occupancy and checkout wait times for the app engine."""
+    pool = engine.sync_engine.pool
+    assert isinstance(pool, InstrumentedAsyncQueuePool)  # configured in app/database.py
+    return _pool_stats(pool)
@@ -1,26 +1,67 @@
-"""Health check endpoint.
+"""Health check endpoints — liveness and readiness, split.
 
-Performs a real DB query (`SELECT 1`) to verify the async connection is alive.
-This catches problems like the DB container not running, connection pool
-exhaustion, or network issues between backend and DB.
+- **GET /health/live** — the process is up and its event loop responds.
+  Zero I/O: a slow or down database must not get the worker restarted.
+- **GET /health/ready** — the worker can serve traffic. Reports the
+  cached result of the background `SELECT 1` (see `app.utils.db_health`)
+  and answers 503 when it failed or has gone stale, so load balancers stop
+  routing here. Probes never check out a pool connection themselves.
+- **GET /health** — kept as an alias of readiness for existing scripts.
+
+Readiness also reports pool saturation, the last check's latency, and,
+with a read replica configured, whether storefront reads currently go to
+it ("ok") or fall back to the primary ("fallback"). A down replica
+doesn't fail readiness — the primary can serve reads on its own.
 """
 
-from fastapi import APIRouter, Depends
-from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Response, status
+from sqlalchemy.pool import QueuePool
 
-from app.database import get_db
+from app import database
+from app.schemas.health import PoolSaturation, ReadinessResponse
 
 router = APIRouter(tags=["health"])
 
 
-@router.get("/health")
-async def health_check(db: AsyncSession = Depends(get_db)) -> dict[str, str]:
-    """Liveness check with DB ping.
+def _pool_saturation() -> PoolSaturation:
+    pool = database.engine.sync_engine.pool
+    assert isinstance(pool, QueuePool)  # configured in app/database.py
+    capacity = pool.size() + max(pool._max_overflow, 0)
+    checked_out = pool.checkedout()
+    return PoolSaturation(
+        checked_out=checked_out,
+        capacity=capacity,
+        saturation=round(checked_out / capacity, 3) if capacity else 0.0,
+    )
+
+
+@router.get("/health/live")
+async def liveness() -> dict[str, str]:
+    """Liveness check — answers as long as the event loop is running."""
+    return {"status": "ok"}
+
+
+@router.get("/health/ready", response_model=ReadinessResponse)
+@router.get("/health", response_model=ReadinessResponse)
+async def readiness(response: Response) -> ReadinessResponse:
+    """Readiness check from the cached background DB check (no I/O here)."""
+    health = database.db_health
+    ready = health.is_ready()
+    if not ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+
+    age = health.age_seconds()
+    latency = health.last_latency_ms
+    replica = "disabled"
+    if database.replica_monitor is not None:
+        replica = "ok" if database.replica_monitor.healthy else "fallback"
 
-    Uses `Depends(get_db)` — the same dependency injection pattern every
-    route will use. FastAPI calls `get_db()`, which yields an AsyncSession,
-    passes it to this function, then closes the session when done.
-    """
-    await db.execute(text("SELECT 1"))
-    return {"status": "ok", "database": "connected"}
+    return ReadinessResponse(
+        status="ok" if ready else "unavailable",
+        database="connected" if health.healthy else "unreachable",
+        last_check_age_seconds=round(age, 3) if age is not None else None,
+        last_check_latency_ms=round(latency, 3) if latency is not None else None,
+        last_error=health.last_error,
+        pool=_pool_saturation(),
+        replica=replica,
+    )
@@ -3,44 +3,158 @@
 These endpoints are unauthenticated — anyone can browse products.
 Products are fetched by slug (URL-friendly identifier) for public
 routes, keeping UUIDs internal.
+
+All of them only read, so they use `get_read_db`: a read replica when one
+is configured and healthy, the primary otherwise.
+
+**Response caching:** the list and detail endpoints serve from
+`app.response_cache.catalog_cache` when they can. On a hit the route
+returns the cached JSON bytes in a plain `Response` — FastAPI passes a
+`Response` through untouched, skipping `response_model` validation and
+encoding. `response_model` is still declared so the OpenAPI docs stay
+accurate. The injected session never touches the pool on a hit: an
+AsyncSession only checks out a connection on its first query.
+
+**Serialization:** on a list miss, the service returns plain column rows
+and the route encodes them with orjson (`app.utils.serialization`) —
+no ORM objects, no per-row `model_validate`, no second validation pass.
+
+**Conditional requests:** both endpoints send a strong `ETag` and
+`Last-Modified`, and answer `If-None-Match` / `If-Modified-Since` with a
+bodyless 304. On a cache miss, a request with one of those headers gets
+a cheap version probe first (the page's `(id, updated_at)` pairs, or one
+product's), so an unchanged page returns 304 without loading or
+serializing full rows. Requests without them skip the probe: the list
+validators are computed from the page just loaded.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import get_read_db
+from app.response_cache import (
+    CachedResponse,
+    catalog_cache,
+    detail_cache_key,
+    list_cache_key,
+    render,
+)
 from app.schemas.product import (
     PaginatedProductResponse,
+    PaginatedProductSearchResponse,
+    PaginatedProductSummaryResponse,
     ProductListParams,
     ProductResponse,
+    ProductSearchParams,
+    ProductSearchResult,
 )
-from app.services.product import calculate_pages, get_product_by_slug, list_products
+from app.services.product import (
+    LIST_FIELDS,
+    InvalidCursorError,
+    calculate_pages,
+    get_listing_version,
+    get_product_by_slug,
+    get_product_version,
+    list_products,
+    page_version,
+    search_products,
+)
+from app.utils.http_cache import is_conditional, is_not_modified, make_etag, not_modified
+from app.utils.serialization import dumps, rows_to_dicts
 
 router = APIRouter(prefix="/products", tags=["products"])
 
 
-@router.get("", response_model=PaginatedProductResponse)
+@router.get("", response_model=PaginatedProductResponse | PaginatedProductSummaryResponse)
 async def get_products(
+    request: Request,
     params: ProductListParams = Depends(),
-    db: AsyncSession = Depends(get_db),
-) -> PaginatedProductResponse:
+    db: AsyncSession = Depends(get_read_db),
+) -> Response:
     """List products with pagination and optional filters.
 
     Query params (all optional):
     - page, per_page: pagination
+    - cursor: keyset pagination — pass a previous response's `next_cursor`
     - category: filter by ProductCategory
     - condition: filter by ProductCondition
     - search: case-insensitive name search
     - available_only: defaults to true (hides sold items)
+    - include_total: set false to skip counting (total/pages come back null)
+    - fields: `summary` for slim card-sized items (no description/timestamps)
 
     `Depends()` on a Pydantic model tells FastAPI to pull each field
     from query parameters. So `?page=2&category=nendoroid` populates
     the ProductListParams model automatically.
     """
-    products, total = await list_products(db, params)
+    cache_key = list_cache_key(params)
+    cached = catalog_cache.get(cache_key)
+    if cached is not None:
+        return render(cached, request.headers)
+
+    # The ETag covers the params (which page of which filters) and the
+    # version of the rows on the page, so any change to them changes it.
+    try:
+        if is_conditional(request.headers):
+            last_modified, fingerprint = await get_listing_version(db, params)
+            etag = make_etag(cache_key, *fingerprint)
+            if is_not_modified(request.headers, etag, last_modified):
+                return not_modified(etag, last_modified)
+
+        rows, total, next_cursor = await list_products(db, params)
+    except InvalidCursorError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor",
+        ) from exc
+
+    # Validators come from the loaded page, in case it changed since the probe.
+    last_modified, fingerprint = page_version(rows, total, next_cursor is not None)
+    etag = make_etag(cache_key, *fingerprint)
+
+    # Fast path: the rows are plain column tuples in schema field order, so
+    # they go straight to orjson without building a Pydantic model per row.
+    # The shape matches the response models (tests pin this).
+    body = dumps(
+        {
+            "items": rows_to_dicts(LIST_FIELDS[params.fields], rows),
+            "total": total,
+            "page": params.page,
+            "per_page": params.per_page,
+            "pages": calculate_pages(total, params.per_page) if total is not None else None,
+            "next_cursor": next_cursor,
+        }
+    )
+    cached = CachedResponse(etag, last_modified, body)
+    catalog_cache.set(cache_key, cached)
+    return render(cached, request.headers)
+
+
+# Registered before `/{slug}` — FastAPI matches routes in order, so
+# otherwise "search" would be treated as a product slug.
+@router.get("/search", response_model=PaginatedProductSearchResponse)
+async def search(
+    params: ProductSearchParams = Depends(),
+    db: AsyncSession = Depends(get_read_db),
+) -> PaginatedProductSearchResponse:
+    """Full-text search across product names and descriptions.
+
+    Unlike `?search=` on the list endpoint (substring match on the name),
+    this matches whole words with stemming ("figures" finds "figure"),
+    searches descriptions too, and orders by relevance. Each result has a
+    highlighted `snippet` of the description.
+    """
+    results, total = await search_products(db, params)
 
-    return PaginatedProductResponse(
-        items=[ProductResponse.model_validate(p) for p in products],
+    return PaginatedProductSearchResponse(
+        items=[
+            ProductSearchResult(
+                **ProductResponse.model_validate(product).model_dump(),
+                rank=rank,
+                snippet=snippet,
+            )
+            for product, rank, snippet in results
+        ],
         total=total,
         page=params.page,
         per_page=params.per_page,
@@ -50,15 +164,30 @@ async def get_products(
 
 @router.get("/{slug}", response_model=ProductResponse)
 async def get_product(
+    request: Request,
     slug: str,
-    db: AsyncSession = Depends(get_db),
-) -> ProductResponse:
+    db: AsyncSession = Depends(get_read_db),
+) -> Response:
     """Get a single product by slug.
 
     The slug is the URL-friendly identifier used in the storefront URL:
     /products/hatsune-miku-nendoroid-2024
+
+    404s aren't cached, so a newly created product shows up immediately.
     """
-    product = await get_product_by_slug(db, slug)
+    cache_key = detail_cache_key(slug)
+    cached = catalog_cache.get(cache_key)
+    if cached is not None:
+        return render(cached, request.headers)
+
+    version = await get_product_version(db, slug)
+    product = None
+    if version is not None:
+        product_id, last_modified = version
+        etag = make_etag(product_id, last_modified)
+        if is_not_modified(request.headers, etag, last_modified):
+            return not_modified(etag, last_modified)
+        product = await get_product_by_slug(db, slug)
 
     if product is None:
         raise HTTPException(
@@ -66,4 +195,9 @@ async def get_product(
             detail="Product not found",
         )
 
-    return ProductResponse.model_validate(product)
+    # Validators come from the loaded row, in case it changed since the probe.
+    etag = make_etag(product.id, product.updated_at)
+    body = ProductResponse.model_validate(product).model_dump_json().encode("utf-8")
+    cached = CachedResponse(etag, product.updated_at, body)
+    catalog_cache.set(cache_key, cached)
+    return render(cached, request.headers)
@@ -0,0 +1,46 @@
+"""Webhook routes — receive Stripe events.
+
+`POST /webhooks/stripe` only verifies and stores the event, then answers
+200 — the work it triggers (creating the order, releasing a hold) runs in
+the background workers (see app/services/webhook.py). Responses:
+- 200: stored, already stored (a redelivery), or a type we don't handle
+- 400: missing or invalid signature — Stripe will retry, and it should
+  never happen with the right `STRIPE_WEBHOOK_SECRET`
+- 503: no webhook secret configured
+"""
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import get_db
+from app.services.webhook import InvalidWebhookError, record_event, verify_event, webhook_workers
+
+router = APIRouter(prefix="/webhooks", tags=["webhooks"])
+
+
+@router.post("/stripe")
+async def stripe_webhook(
+    request: Request,
+    stripe_signature: str | None = Header(default=None),
+    db: AsyncSession = Depends(get_db),
+) -> dict[str, bool]:
+    """Store a Stripe event for the workers and acknowledge it.
+
+    Reads the raw body: the signature covers the exact bytes Stripe sent,
+    so it can't go through a Pydantic model first.
+    """
+    if not settings.stripe_webhook_secret:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Stripe webhooks are not configured",
+        )
+    payload = await request.body()
+    try:
+        event = verify_event(payload, stripe_signature, settings.stripe_webhook_secret)
+    except InvalidWebhookError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+    if await record_event(db, event):
+        webhook_workers.notify()
+    return {"received": True}
@@ -1,20 +1,60 @@
 """Pydantic schemas for request/response validation."""
 
 from app.schemas.auth import LoginRequest, TokenResponse
+from app.schemas.diagnostics import CacheStatsResponse, PoolStatsResponse
+from app.schemas.health import PoolSaturation, ReadinessResponse
+from app.schemas.order import (
+    CheckoutLineItem,
+    CheckoutRequest,
+    CheckoutResponse,
+    OrderItemResponse,
+    OrderResponse,
+)
 from app.schemas.product import (
     PaginatedProductResponse,
+    PaginatedProductSearchResponse,
+    PaginatedProductSummaryResponse,
+    ProductBulkIds,
+    ProductBulkResponse,
+    ProductBulkUpdate,
     ProductCreate,
+    ProductImportResponse,
+    ProductImportRowError,
     ProductListParams,
+    ProductReprice,
     ProductResponse,
+    ProductSearchParams,
+    ProductSearchResult,
+    ProductSummaryResponse,
     ProductUpdate,
 )
 
 __all__ = [
+    "CacheStatsResponse",
+    "CheckoutLineItem",
+    "CheckoutRequest",
+    "CheckoutResponse",
     "LoginRequest",
+    "OrderItemResponse",
+    "OrderResponse",
     "PaginatedProductResponse",
+    "PaginatedProductSearchResponse",
+    "PaginatedProductSummaryResponse",
+    "PoolSaturation",
+    "PoolStatsResponse",
+    "ProductBulkIds",
+    "ProductBulkResponse",
+    "ProductBulkUpdate",
     "ProductCreate",
+    "ProductImportResponse",
+    "ProductImportRowError",
     "ProductListParams",
+    "ProductReprice",
     "ProductResponse",
+    "ProductSearchParams",
+    "ProductSearchResult",
+    "ProductSummaryResponse",
     "ProductUpdate",
+    "ReadinessResponse",
     "TokenResponse",
 ]
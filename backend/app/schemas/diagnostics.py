@@ -0,0 +1,38 @@
+"""Pydantic schemas for the admin diagnostics endpoints."""
+
+from pydantic import BaseModel
+
+
+class CacheStatsResponse(BaseModel):
+    """Size and effectiveness counters for one in-process cache.
+
+    Counters are per worker process and reset on restart.
+    """
+
+    size: int
+    maxsize: int
+    ttl_seconds: float
+    hits: int
+    misses: int
+    evictions: int
+    hit_ratio: float
+
+
+class PoolStatsResponse(BaseModel):
+    """Connection pool state plus cumulative checkout timings.
+
+    `checked_out` near `size + max_overflow` means requests are queueing
+    for connections; `wait_ms_buckets` shows how long they queued.
+    """
+
+    size: int
+    checked_out: int
+    checked_in: int
+    overflow: int
+    max_overflow: int
+    timeout_seconds: float
+    checkouts: int
+    checkout_timeouts: int
+    wait_ms_mean: float
+    # Upper bound in ms → count, plus "+Inf".
+    wait_ms_buckets: dict[str, int]
@@ -0,0 +1,29 @@
+"""Pydantic schemas for the health endpoints."""
+
+from typing import Literal
+
+from pydantic import BaseModel
+
+
+class PoolSaturation(BaseModel):
+    """How much of the primary's connection pool is in use right now.
+
+    `saturation` is `checked_out / capacity`; near 1.0 new requests queue
+    for a connection (see GET /admin/diagnostics/pool for wait times).
+    """
+
+    checked_out: int
+    capacity: int
+    saturation: float
+
+
+class ReadinessResponse(BaseModel):
+    """Cached database health for load balancers and orchestrators."""
+
+    status: Literal["ok", "unavailable"]
+    database: Literal["connected", "unreachable"]
+    last_check_age_seconds: float | None
+    last_check_latency_ms: float | None
+    last_error: str | None
+    pool: PoolSaturation
+    replica: Literal["disabled", "ok", "fallback"]
@@ -23,7 +23,8 @@ class CheckoutLineItem(BaseModel):
 class CheckoutRequest(BaseModel):
     """Request body for POST /checkout/create-session."""
 
-    items: list[CheckoutLineItem] = Field(min_length=1)
+    # Stripe allows at most 100 line items in a payment-mode session.
+    items: list[CheckoutLineItem] = Field(min_length=1, max_length=100)
 
 
 class CheckoutResponse(BaseModel):
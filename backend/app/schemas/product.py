@@ -16,8 +16,10 @@ Key Pydantic v2 patterns:
 
 import uuid
 from datetime import datetime
+from decimal import Decimal
+from typing import Literal, Self
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from app.models.product import ProductCategory, ProductCondition
 
@@ -82,15 +84,53 @@ class ProductResponse(BaseModel):
     updated_at: datetime
 
 
+class ProductSummaryResponse(BaseModel):
+    """Slim product shape for listing cards (`?fields=summary`).
+
+    Drops `description` (unbounded text) and the bookkeeping columns a
+    card never shows, so large pages read, send and hold far less data.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: uuid.UUID
+    name: str
+    slug: str
+    price_cents: int
+    condition: ProductCondition
+    category: ProductCategory
+    image_url: str
+    is_available: bool
+
+
 class ProductListParams(BaseModel):
     """Query parameters for the product list endpoint.
 
     Using a Pydantic model for query params keeps validation clean.
     FastAPI can inject this via `Depends(ProductListParams)`.
+
+    Two pagination modes:
+    - Offset (default): `page` + `per_page`. Simple, but page N makes
+      Postgres read and discard every row on pages 1..N-1.
+    - Cursor (opt-in): pass the `next_cursor` from a previous response as
+      `cursor`. The query seeks straight to that position via the
+      `(created_at, id)` index, so every page costs the same. `page` is
+      ignored when `cursor` is set.
+
+    `include_total=false` skips counting matching rows (`total` and `pages`
+    come back as null). Cursor clients only need `next_cursor`, and the
+    count is often the most expensive part of a filtered listing.
+
+    `fields=summary` returns `ProductSummaryResponse` items instead of the
+    full `ProductResponse` — only the columns a product card needs are
+    selected.
     """
 
     page: int = Field(ge=1, default=1)
     per_page: int = Field(ge=1, le=100, default=20)
+    cursor: str | None = None
+    include_total: bool = True
+    fields: Literal["full", "summary"] = "full"
     category: ProductCategory | None = None
     condition: ProductCondition | None = None
     search: str | None = None
@@ -98,10 +138,157 @@ class ProductListParams(BaseModel):
 
 
 class PaginatedProductResponse(BaseModel):
-    """Paginated response wrapper for product lists."""
+    """Paginated response wrapper for product lists.
+
+    `next_cursor` is an opaque token pointing just past the last item.
+    It's None on the last page. Clients can pass it back as `?cursor=`
+    to switch to keyset pagination from any page.
+    """
 
     items: list[ProductResponse]
+    total: int | None
+    page: int
+    per_page: int
+    pages: int | None
+    next_cursor: str | None = None
+
+
+class PaginatedProductSummaryResponse(BaseModel):
+    """`PaginatedProductResponse` with summary items (`?fields=summary`)."""
+
+    items: list[ProductSummaryResponse]
+    total: int | None
+    page: int
+    per_page: int
+    pages: int | None
+    next_cursor: str | None = None
+
+
+class ProductSearchParams(BaseModel):
+    """Query parameters for full-text search (`GET /products/search`).
+
+    `q` accepts web-search syntax: `miku -racing`, `"scale figure"`,
+    `nendoroid or figma`. Only available products are searched.
+    """
+
+    q: str = Field(min_length=1, max_length=200)
+    page: int = Field(ge=1, default=1)
+    per_page: int = Field(ge=1, le=100, default=20)
+    category: ProductCategory | None = None
+    condition: ProductCondition | None = None
+
+
+class ProductSearchResult(ProductResponse):
+    """A product plus its relevance to the query.
+
+    `snippet` is a short excerpt of the description with matching words
+    wrapped in `<mark>...</mark>`. Descriptions are admin-authored, but
+    render it as sanitized HTML anyway.
+    """
+
+    rank: float
+    snippet: str
+
+
+class PaginatedProductSearchResponse(BaseModel):
+    """Paginated response wrapper for full-text search results (best match first)."""
+
+    items: list[ProductSearchResult]
     total: int
     page: int
     per_page: int
     pages: int
+
+
+class ProductImportRowError(BaseModel):
+    """Why one row of a bulk import wasn't written.
+
+    `row` counts data records from 1 (a CSV header isn't counted), so it
+    matches the line number in a spreadsheet minus the header.
+    """
+
+    row: int
+    slug: str | None
+    errors: list[str]
+
+
+class ProductImportResponse(BaseModel):
+    """Outcome of `POST /admin/products/bulk`.
+
+    `received` = `inserted` + `updated` + `skipped` + `failed`. Rows
+    skipped because their slug already exists are listed in `errors` too.
+    Only the first few hundred errors are listed; `errors_truncated` says
+    whether more were dropped.
+    """
+
+    received: int
+    inserted: int
+    updated: int
+    skipped: int
+    failed: int
+    errors: list[ProductImportRowError]
+    errors_truncated: bool
+
+
+# Most ids one bulk request may name; keeps each UPDATE and its response bounded.
+MAX_BULK_IDS = 1000
+
+
+class ProductBulkIds(BaseModel):
+    """Body for `POST /admin/products/bulk/delete`: the products to act on."""
+
+    ids: list[uuid.UUID] = Field(min_length=1, max_length=MAX_BULK_IDS)
+
+
+class ProductBulkUpdate(ProductBulkIds):
+    """Body for `PATCH /admin/products/bulk`: one partial update for many products.
+
+    `changes` works like the single-product `ProductUpdate`, except the
+    slug can't be set — it's unique, so no two products can share one —
+    and a field can't be set to null: every product column is required.
+    """
+
+    changes: ProductUpdate
+
+    @model_validator(mode="after")
+    def check_changes(self) -> Self:
+        changed = self.changes.model_fields_set
+        if not changed:
+            raise ValueError("changes must set at least one field")
+        if "slug" in changed:
+            raise ValueError("slug can't be changed in bulk")
+        nulls = sorted(field for field in changed if getattr(self.changes, field) is None)
+        if nulls:
+            raise ValueError(f"changes can't set {', '.join(nulls)} to null")
+        return self
+
+
+class ProductReprice(BaseModel):
+    """Body for `POST /admin/products/bulk/reprice`.
+
+    Selects products by `ids`, by `category`, or both (products must
+    match both), and scales their price by `percent`: `10` is +10%,
+    `-25` is 25% off. New prices are rounded to whole cents and never
+    drop below 1 cent.
+    """
+
+    percent: Decimal = Field(gt=-100, le=1000, decimal_places=2)
+    ids: list[uuid.UUID] | None = Field(default=None, min_length=1, max_length=MAX_BULK_IDS)
+    category: ProductCategory | None = None
+
+    @model_validator(mode="after")
+    def check_selector(self) -> Self:
+        if self.ids is None and self.category is None:
+            raise ValueError("give ids, category, or both")
+        return self
+
+
+class ProductBulkResponse(BaseModel):
+    """Result of a bulk update: the products as they are now.
+
+    `not_found` lists requested ids that matched no product.
+    """
+
+    updated: int
+    items: list[ProductResponse]
+    not_found: list[uuid.UUID]
@@ -1,14 +1,44 @@
 """Auth service — admin authentication logic.
 
-Handles authenticating admin users by email + password.
+Handles authenticating admin users by email + password, and resolving a
+bearer token back to its admin for `get_current_admin`.
 The route calls this service; the service queries the DB and verifies credentials.
+
+**Auth caches:** an admin dashboard fires dozens of requests per page view,
+each carrying the same token. Two per-process TTL caches skip the repeated
+work:
+- `token_cache`: verified token → admin id. An entry never outlives the
+  token's own `exp`, so an expired token is always re-checked (and rejected).
+- `admin_cache`: admin id → `AdminUser`, replacing one SELECT per request.
+
+Any code that deletes an admin or rotates their password in-process must
+call `invalidate_admin()` after committing. Rotating `SECRET_KEY` needs a
+restart anyway, which starts with empty caches.
 """
 
+import time
+import uuid
+
+import jwt
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
 from app.models.admin_user import AdminUser
-from app.utils.security import verify_password
+from app.utils.cache import TTLCache
+from app.utils.security import decode_token, verify_password_async
+
+token_cache: TTLCache[str, uuid.UUID] = TTLCache(
+    maxsize=settings.auth_cache_size,
+    ttl_seconds=settings.auth_cache_ttl_seconds,
+)
+
+# Cached admins are detached from any session (see `get_admin_for_token`),
+# so they're safe to share between requests — but treat them as read-only.
+admin_cache: TTLCache[uuid.UUID, AdminUser] = TTLCache(
+    maxsize=settings.auth_cache_size,
+    ttl_seconds=settings.auth_cache_ttl_seconds,
+)
 
 
 async def authenticate_admin(
@@ -21,6 +51,10 @@ async def authenticate_admin(
     Returns None if the email doesn't exist or the password is wrong.
     We intentionally don't distinguish between "user not found" and
     "wrong password" — this prevents attackers from enumerating valid emails.
+
+    Raises:
+        PasswordHasherBusyError: If the bcrypt pool is saturated (see
+            `app.utils.security`).
     """
     result = await session.execute(select(AdminUser).where(AdminUser.email == email))
     admin = result.scalar_one_or_none()
@@ -28,7 +62,74 @@ async def authenticate_admin(
     if admin is None:
         return None
 
-    if not verify_password(password, admin.password_hash):
+    # End the read transaction so the connection goes back to the pool while
+    # bcrypt runs — a login burst would otherwise pin one connection per
+    # queued login and starve the catalog. expire_on_commit=False keeps
+    # `admin` readable.
+    await session.commit()
+
+    if not await verify_password_async(password, admin.password_hash):
+        return None
+
+    return admin
+
+
+def _admin_id_from_token(token: str) -> uuid.UUID | None:
+    """Verify a JWT and return its subject as an admin id, or None if invalid."""
+    admin_id = token_cache.get(token)
+    if admin_id is not None:
+        return admin_id
+
+    try:
+        payload = decode_token(token)
+        admin_id = uuid.UUID(payload["sub"])
+        # Never cache past the token's expiry — once it's expired, the next
+        # request must go through `decode_token` again and be rejected. A
+        # token without `exp` would never expire, so it's rejected outright.
+        remaining = float(payload["exp"]) - time.time()
+    except (jwt.PyJWTError, KeyError, ValueError):
+        return None
+
+    token_cache.set(token, admin_id, ttl_seconds=min(token_cache.ttl_seconds, remaining))
+    return admin_id
+
+
+async def get_admin_for_token(session: AsyncSession, token: str) -> AdminUser | None:
+    """Resolve a bearer token to its admin user.
+
+    Returns None if the token is expired, tampered with, or malformed, or
+    if its `sub` doesn't match any admin user.
+    """
+    admin_id = _admin_id_from_token(token)
+    if admin_id is None:
         return None
 
+    admin = admin_cache.get(admin_id)
+    if admin is not None:
+        return admin
+
+    result = await session.execute(select(AdminUser).where(AdminUser.id == admin_id))
+    admin = result.scalar_one_or_none()
+    if admin is None:
+        return None
+
+    # Detach before caching: the object outlives this request's session, and
+    # a session-bound instance can't be shared with other sessions.
+    session.expunge(admin)
+    admin_cache.set(admin_id, admin)
     return admin
+
+
+def invalidate_admin(admin_id: uuid.UUID) -> None:
+    """Drop a cached admin so the next request re-reads (or fails to find) the row.
+
+    Cached tokens for this admin can stay: they only map to the id, and the
+    id lookup now goes back to the DB.
+    """
+    admin_cache.pop(admin_id)
+
+
+def invalidate_auth_caches() -> None:
+    """Clear every cached token and admin."""
+    token_cache.clear()
+    admin_cache.clear()
@@ -0,0 +1,229 @@
+"""Checkout — turns a cart into a Stripe Checkout Session.
+
+The flow (docs/phase-5-plan.md, 5B):
+1. The frontend sends only product ids — prices always come from the DB.
+2. We look the products up, and refuse the cart if any is missing,
+   unavailable or listed twice (every figure is one of a kind).
+3. We reserve one unit of each (app/services/reservation.py), so no one
+   else can start paying for the same figure while this customer does.
+4. We create a Stripe Checkout Session with inline `price_data`, the
+   product ids in its metadata for the webhook to read back, and the
+   reservation's hold id as `client_reference_id`.
+
+**A fixed number of queries per cart, whatever its size.** All ids go
+into a single `WHERE id = ANY(:ids)` lookup, and one pass over the cart
+(in the order the customer sees it) sorts every item into missing /
+unavailable / duplicate / OK. The error then reports every bad item at
+once, so the frontend can fix the whole cart in one round instead of one
+item per retry. Line items are built from the rows already in hand, and
+the reservation is one more statement for the whole cart.
+
+**No connection held during the Stripe call.** Creating a session takes
+a few hundred ms at Stripe. The reservation is committed before that
+call, so the pooled connection goes back to the pool instead of idling
+in a transaction while we wait on the network. If Stripe fails, the hold
+is released right away; if the customer never pays, the Stripe session
+expires a few minutes before the hold, and the sweeper returns the stock.
+"""
+
+import time
+import uuid
+from collections.abc import Sequence
+from typing import Any, cast
+
+from sqlalchemy import Row, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from stripe import StripeClient
+from stripe.checkout import SessionService
+
+from app.config import settings
+from app.models.product import Product
+from app.schemas.order import CheckoutLineItem, CheckoutResponse
+from app.services.product import product_id_in
+from app.services.reservation import ProductsUnavailableError, release_hold, reserve_products
+
+CURRENCY = "usd"
+
+# The Stripe session expires this long before its reservation, so a payment
+# completed at the last moment still finds its items held.
+STRIPE_EXPIRY_MARGIN_SECONDS = 300
+
+# Stripe rejects sessions that expire less than 30 minutes after it receives
+# them; the headroom absorbs our request latency and any clock skew.
+STRIPE_MIN_SESSION_SECONDS = 30 * 60
+STRIPE_MIN_SESSION_HEADROOM_SECONDS = 60
+
+# Stripe metadata values are capped at 500 characters, and a 100-item cart
+# has 3,700 characters of ids — so they're split across numbered keys
+# (`product_ids_0`, `product_ids_1`, ...) of 13 ids each.
+PRODUCT_IDS_METADATA_PREFIX = "product_ids_"
+PRODUCT_IDS_PER_METADATA_KEY = 13
+
+
+class CheckoutItemsError(Exception):
+    """Some cart items can't be bought. Lists every offending product id."""
+
+    def __init__(
+        self,
+        missing: list[uuid.UUID],
+        unavailable: list[uuid.UUID],
+        duplicates: list[uuid.UUID],
+    ) -> None:
+        super().__init__("Some items in the cart can't be checked out")
+        self.missing = missing
+        self.unavailable = unavailable
+        self.duplicates = duplicates
+
+
+async def resolve_checkout_items(
+    session: AsyncSession, items: Sequence[CheckoutLineItem]
+) -> list[Row[Any]]:
+    """Fetch every cart product in one query, in cart order.
+
+    Raises `CheckoutItemsError` if any id is unknown, unavailable or
+    repeated.
+    """
+    ids = [item.product_id for item in items]
+    result = await session.execute(
+        select(
+            Product.id,
+            Product.name,
+            Product.price_cents,
+            Product.image_url,
+            Product.is_available,
+        ).where(product_id_in(list(dict.fromkeys(ids))))
+    )
+    found = {row.id: row for row in result}
+
+    products: list[Row[Any]] = []
+    missing: list[uuid.UUID] = []
+    unavailable: list[uuid.UUID] = []
+    duplicates: list[uuid.UUID] = []
+    seen: set[uuid.UUID] = set()
+    for product_id in ids:
+        if product_id in seen:
+            duplicates.append(product_id)
+            continue
+        seen.add(product_id)
+        row = found.get(product_id)
+        if row is None:
+            missing.append(product_id)
+        elif not row.is_available:
+            unavailable.append(product_id)
+        else:
+            products.append(row)
+
+    if missing or unavailable or duplicates:
+        raise CheckoutItemsError(missing, unavailable, duplicates)
+    return products
+
+
+def build_line_items(products: Sequence[Row[Any]]) -> list[SessionService.CreateParamsLineItem]:
+    """Stripe `line_items` with inline `price_data` from our DB prices."""
+    return [
+        {
+            "price_data": {
+                "currency": CURRENCY,
+                "unit_amount": product.price_cents,
+                "product_data": {
+                    "name": product.name,
+                    "images": [product.image_url],
+                    "metadata": {"product_id": str(product.id)},
+                },
+            },
+            "quantity": 1,
+        }
+        for product in products
+    ]
+
+
+def stripe_expires_at(now: float) -> int:
+    """`expires_at` for a session opened at `now`: just before its reservation ends.
+
+    Never closer than Stripe's minimum plus headroom — the settings check
+    keeps the reservation TTL long enough that this floor never wins.
+    """
+    return max(
+        int(now) + STRIPE_MIN_SESSION_SECONDS + STRIPE_MIN_SESSION_HEADROOM_SECONDS,
+        int(now) + settings.reservation_ttl_seconds - STRIPE_EXPIRY_MARGIN_SECONDS,
+    )
+
+
+def shipping_address_collection() -> SessionService.CreateParamsShippingAddressCollection:
+    """Stripe `shipping_address_collection` for the configured countries.
+
+    The SDK types `allowed_countries` as a Literal of every ISO code it
+    knows; the setting holds plain strings, and Stripe rejects unknown ones.
+    """
+    return cast(
+        SessionService.CreateParamsShippingAddressCollection,
+        {"allowed_countries": settings.checkout_shipping_countries},
+    )
+
+
+def product_ids_metadata(ids: Sequence[uuid.UUID]) -> dict[str, str]:
+    """Comma-separated ids, split over as many metadata keys as needed."""
+    step = PRODUCT_IDS_PER_METADATA_KEY
+    return {
+        f"{PRODUCT_IDS_METADATA_PREFIX}{start // step}": ",".join(
+            str(product_id) for product_id in ids[start : start + step]
+        )
+        for start in range(0, len(ids), step)
+    }
+
+
+def product_ids_from_metadata(metadata: dict[str, str]) -> list[uuid.UUID]:
+    """Inverse of `product_ids_metadata`, for the webhook."""
+    ids: list[uuid.UUID] = []
+    index = 0
+    while (chunk := metadata.get(f"{PRODUCT_IDS_METADATA_PREFIX}{index}")) is not None:
+        ids.extend(uuid.UUID(value) for value in chunk.split(","))
+        index += 1
+    return ids
+
+
+async def create_checkout_session(
+    session: AsyncSession,
+    items: Sequence[CheckoutLineItem],
+    stripe_client: StripeClient,
+) -> CheckoutResponse:
+    """Validate and reserve the cart, then open a Stripe Checkout Session for it.
+
+    Raises `CheckoutItemsError` for bad items (including items someone
+    else reserved first) and `ReservationBusyError` under heavy contention,
+    and lets `stripe.StripeError` propagate when Stripe can't be reached or
+    rejects the request. Nothing stays reserved when it raises.
+    """
+    try:
+        products = await resolve_checkout_items(session, items)
+    except CheckoutItemsError:
+        await session.rollback()
+        raise
+
+    product_ids = [product.id for product in products]
+    try:
+        # Commits, so the connection returns to the pool before the (slow)
+        # Stripe call.
+        hold = await reserve_products(session, product_ids)
+    except ProductsUnavailableError as exc:
+        raise CheckoutItemsError([], exc.product_ids, []) from exc
+
+    try:
+        checkout = await stripe_client.checkout.sessions.create_async(
+            params={
+                "mode": "payment",
+                "line_items": build_line_items(products),
+                "metadata": product_ids_metadata(product_ids),
+                "client_reference_id": str(hold.hold_id),
+                "expires_at": stripe_expires_at(time.time()),
+                "shipping_address_collection": shipping_address_collection(),
+                "success_url": (
+                    f"{settings.frontend_url}/checkout/success?session_id={{CHECKOUT_SESSION_ID}}"
+                ),
+                "cancel_url": f"{settings.frontend_url}/cart",
+            }
+        )
+    except Exception:
+        await release_hold(session, hold.hold_id)
+        raise
+    return CheckoutResponse(checkout_url=checkout.url, session_id=checkout.id)
@@ -0,0 +1,180 @@
+"""Order service — turns a paid Stripe Checkout Session into an Order.
+
+Called by the webhook workers (app/services/webhook.py) for
+`checkout.session.completed`, never inline in the webhook request.
+
+**Set-based: the same statements for 1 item or 100.** Building the Order
+with ORM OrderItems and flipping each `product.is_available` costs a
+SELECT ... FOR UPDATE, an INSERT per item and an UPDATE per product. Instead,
+in one transaction:
+
+1. `INSERT INTO orders ... ON CONFLICT (stripe_checkout_session_id)
+   DO NOTHING RETURNING id` — creates the order, and doubles as the
+   duplicate check: webhook handlers run at least once, and a session
+   that already has an order inserts nothing, so we stop there.
+2. `UPDATE products SET is_available = false WHERE id = ANY(:ids)
+   RETURNING id, name, price_cents` — marks everything sold and hands
+   back the name and price to snapshot. The rows are locked in id order
+   first (as in the reservation service), so concurrent checkouts and
+   releases can't deadlock with it.
+3. `INSERT INTO order_items ... SELECT FROM unnest(:product_ids, :names,
+   :prices)` — every item in one statement, one array per column, so the
+   SQL text is the same for any cart size (as in product_import).
+4. The checkout's reservation is consumed: the units it held are sold,
+   not returned to stock.
+
+The customer, address and total come from the session Stripe sent us —
+the amount Stripe charged is the order total.
+"""
+
+import logging
+import uuid
+from typing import Any
+
+from sqlalchemy import (
+    Integer,
+    Row,
+    String,
+    Uuid,
+    bindparam,
+    func,
+    insert,
+    literal,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.selectable import TableValuedAlias
+
+from app.models.order import Order, OrderItem, OrderStatus
+from app.models.product import Product
+from app.services.checkout import product_ids_from_metadata
+from app.services.product import invalidate_product_caches, product_id_in
+from app.services.reservation import consume_hold
+
+logger = logging.getLogger(__name__)
+
+# Plain SQL rather than `postgresql.insert(Order).on_conflict_do_nothing()`:
+# the dialect's INSERT construct has no cache key, so SQLAlchemy would
+# compile it afresh for every order — over a millisecond, longer than
+# running it. `text()` is compiled once and prepared once per connection.
+_order_columns = Order.__table__.c
+_INSERT_ORDER_SQL = (
+    text(
+        f"INSERT INTO {Order.__tablename__} (id, customer_email, customer_name, "
+        "stripe_checkout_session_id, stripe_payment_intent_id, status, total_cents, "
+        "shipping_address_json) "
+        "VALUES (gen_random_uuid(), :customer_email, :customer_name, :session_id, "
+        ":payment_intent_id, :status, :total_cents, :shipping_address) "
+        "ON CONFLICT (stripe_checkout_session_id) DO NOTHING "
+        "RETURNING id"
+    )
+    .bindparams(
+        bindparam("status", type_=_order_columns.status.type),
+        bindparam("shipping_address", type_=_order_columns.shipping_address_json.type),
+    )
+    .columns(id=_order_columns.id.type)
+)
+
+
+def _unnest_items(items: list[Row[Any]]) -> TableValuedAlias:
+    """The items as rows of `unnest()` — one array parameter per column."""
+    return (
+        func.unnest(
+            bindparam("product_ids", [item.id for item in items], type_=ARRAY(Uuid())),
+            bindparam("product_names", [item.name for item in items], type_=ARRAY(String())),
+            bindparam("prices_cents", [item.price_cents for item in items], type_=ARRAY(Integer())),
+        )
+        .table_valued("product_id", "product_name", "price_cents")
+        .render_derived(name="items")
+    )
+
+
+def _shipping_address(checkout: dict[str, Any]) -> dict[str, Any]:
+    """Shipping name + address; newer Stripe API versions nest it differently."""
+    collected = checkout.get("collected_information") or {}
+    return collected.get("shipping_details") or checkout.get("shipping_details") or {}
+
+
+async def create_order_from_checkout(
+    session: AsyncSession, checkout: dict[str, Any]
+) -> uuid.UUID | None:
+    """Record the order for a completed Checkout Session, and commit.
+
+    Returns the new order's id, or None if the session already has an order.
+    """
+    session_id = checkout["id"]
+    customer = checkout.get("customer_details") or {}
+    order_id: uuid.UUID | None = await session.scalar(
+        _INSERT_ORDER_SQL,
+        {
+            "customer_email": customer.get("email") or "",
+            "customer_name": customer.get("name") or "",
+            "session_id": session_id,
+            "payment_intent_id": checkout.get("payment_intent"),
+            "status": (
+                OrderStatus.PAID
+                if checkout.get("payment_status") == "paid"
+                else OrderStatus.PENDING
+            ),
+            "total_cents": checkout["amount_total"],
+            "shipping_address": _shipping_address(checkout),
+        },
+    )
+    if order_id is None:
+        await session.rollback()
+        return None
+
+    product_ids = product_ids_from_metadata(checkout.get("metadata") or {})
+    locked = (
+        select(Product.id)
+        .where(product_id_in(product_ids))
+        .order_by(Product.id)
+        .with_for_update()
+        .cte("locked")
+    )
+    result = await session.execute(
+        update(Product)
+        .where(Product.id == locked.c.id)
+        .values(is_available=False)
+        .returning(Product.id, Product.name, Product.price_cents),
+        execution_options={"synchronize_session": False},
+    )
+    sold = {row.id: row for row in result}
+    if len(sold) < len(product_ids):
+        # Deleted by an admin after checkout started; the order still
+        # records what was paid for.
+        logger.warning("Checkout %s: some purchased products no longer exist", session_id)
+
+    # Snapshot rows in cart order.
+    items = [sold[product_id] for product_id in product_ids if product_id in sold]
+    if items:
+        unnested = _unnest_items(items)
+        await session.execute(
+            insert(OrderItem).from_select(
+                [
+                    OrderItem.id,
+                    OrderItem.order_id,
+                    OrderItem.product_id,
+                    OrderItem.product_name,
+                    OrderItem.price_cents,
+                    OrderItem.quantity,
+                ],
+                select(
+                    func.gen_random_uuid(),
+                    literal(order_id, OrderItem.order_id.type),
+                    unnested.c.product_id,
+                    unnested.c.product_name,
+                    unnested.c.price_cents,
+                    literal(1),
+                ),
+            )
+        )
+    if checkout.get("client_reference_id"):
+        await consume_hold(session, uuid.UUID(checkout["client_reference_id"]))
+
+    await session.commit()
+    invalidate_product_caches()
+    return order_id
@@ -14,31 +14,244 @@ the web framework.
 - `session.execute(stmt)` — runs it, returns a `Result` object
 - `result.scalars().all()` — extracts the ORM objects from the result rows
 - `result.scalar_one_or_none()` — returns one object or None
-- `session.add(obj)` → `session.commit()` — INSERT or UPDATE
+- `insert(Product).values(...).returning(...)` — INSERT that hands back the row
+
+**Keyset (cursor) pagination:**
+OFFSET pagination makes Postgres walk and throw away every row before the
+requested page. Keyset pagination remembers the sort key of the last row
+returned — `(created_at, id)` — and asks for rows strictly "after" it:
+
+    WHERE (created_at, id) < (:last_created_at, :last_id)
+    ORDER BY created_at DESC, id DESC
+
+Postgres evaluates the row comparison with the composite
+`ix_products_created_at_id` index, so page 500 costs the same as page 1.
+`id` is the tiebreaker for rows created in the same transaction. Search
+results sort by trigram similarity first, so their cursors carry the rank too.
+
+**Listing totals:**
+`COUNT(*)` over the filtered query has to visit every matching row, so it
+is usually more expensive than fetching the page itself. `count_products`
+avoids running it on every request:
+- Exact counts are cached per filter combination for a short TTL and
+  cleared by every write in this module (`invalidate_product_caches`).
+- In "estimate" mode, unfiltered listings use the planner's row estimate.
+- Clients paging by cursor can pass `include_total=false` to skip it.
+
+**Writes are single statements:**
+Loading a row, changing it through the ORM, then refreshing it after the
+commit costs SELECT + UPDATE + SELECT. Instead every write here is one
+`INSERT/UPDATE ... RETURNING <response columns>` plus the commit, and
+returns the row from RETURNING — ready for `ProductResponse`. A missing
+product simply updates nothing and comes back as None. The `bulk_*` and
+`reprice_*` functions do the same for many rows with `WHERE id = ANY(:ids)`.
 """
 
+import base64
+import binascii
 import math
 import uuid
+from collections.abc import Sequence
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, TypeVar
 
-from sqlalchemy import func, select
+from sqlalchemy import (
+    ColumnElement,
+    Float,
+    Integer,
+    Row,
+    Select,
+    Text,
+    Update,
+    any_,
+    bindparam,
+    cast,
+    func,
+    insert,
+    select,
+    text,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
 
-from app.models.product import Product
-from app.schemas.product import ProductCreate, ProductListParams, ProductUpdate
+from app.config import settings
+from app.database import record_primary_write
+from app.models.product import FTS_CONFIG, Product, ProductCategory, ProductCondition
+from app.response_cache import catalog_cache
+from app.schemas.product import (
+    ProductCreate,
+    ProductListParams,
+    ProductResponse,
+    ProductSearchParams,
+    ProductSummaryResponse,
+    ProductUpdate,
+)
+from app.utils.cache import TTLCache
 
+RowT = TypeVar("RowT", bound=tuple[Any, ...])
 
-async def list_products(
+# Exactly the columns each response schema exposes, in its field order.
+# Derived from the schemas so the two can't drift apart.
+PRODUCT_RESPONSE_FIELDS = tuple(ProductResponse.model_fields)
+PRODUCT_SUMMARY_FIELDS = tuple(ProductSummaryResponse.model_fields)
+
+# What the write functions return via RETURNING: a full ProductResponse row.
+_RESPONSE_COLUMNS = tuple(Product.__table__.c[field] for field in PRODUCT_RESPONSE_FIELDS)
+LIST_FIELDS: dict[str, tuple[str, ...]] = {
+    "full": PRODUCT_RESPONSE_FIELDS,
+    "summary": PRODUCT_SUMMARY_FIELDS,
+}
+
+# Filter combination → exact total. Module-level, so shared by every
+# request handled by this worker process.
+CountKey = tuple[ProductCategory | None, ProductCondition | None, bool, str | None]
+product_count_cache: TTLCache[CountKey, int] = TTLCache(
+    maxsize=settings.product_count_cache_size,
+    ttl_seconds=settings.product_count_cache_ttl_seconds,
+)
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor can't be decoded."""
+
+
+def encode_cursor(created_at: datetime, product_id: uuid.UUID, rank: float | None = None) -> str:
+    """Encode a row's sort key as an opaque, URL-safe cursor string.
+
+    The format (`<created_at ISO>|<uuid>[|<rank>]`, base64url without padding)
+    is an implementation detail — clients should treat cursors as opaque
+    tokens. `rank` is only present for search results, which sort by
+    relevance first.
+    """
+    raw = f"{created_at.isoformat()}|{product_id}"
+    if rank is not None:
+        # repr() round-trips a float exactly, so the seek lands on the same row.
+        raw += f"|{rank!r}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID, float | None]:
+    """Decode a cursor produced by `encode_cursor`.
+
+    Returns:
+        A tuple of (created_at, id, rank). `rank` is None for non-search cursors.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or was tampered with.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8")
+        created_at, product_id, *rest = raw.split("|")
+        if len(rest) > 1:
+            raise ValueError("too many cursor fields")
+        rank = float(rest[0]) if rest else None
+        return datetime.fromisoformat(created_at), uuid.UUID(product_id), rank
+    except (binascii.Error, UnicodeError, ValueError) as exc:
+        raise InvalidCursorError("Invalid pagination cursor") from exc
+
+
+def _search_rank(params: ProductListParams) -> ColumnElement[float] | None:
+    """Relevance of each product to `params.search`, or None without a search.
+
+    `similarity()` comes from the pg_trgm extension: the fraction of
+    3-character chunks ("trigrams") the two strings share, from 0 to 1.
+    "Miku" scores higher against "Hatsune Miku" than against
+    "Hatsune Miku Racing Ver. 2024 Nendoroid".
+    """
+    if params.search is None:
+        return None
+    return func.similarity(Product.name, params.search, type_=Float).label("rank")
+
+
+def _count_cache_key(params: ProductListParams) -> CountKey:
+    """Only the filters affect the total — page, per_page and cursor don't."""
+    return (params.category, params.condition, params.available_only, params.search)
+
+
+def _is_unfiltered(params: ProductListParams) -> bool:
+    return (
+        not params.available_only
+        and params.category is None
+        and params.condition is None
+        and params.search is None
+    )
+
+
+async def _estimate_product_total(session: AsyncSession) -> int | None:
+    """Read the planner's row estimate for `products` from the system catalog.
+
+    `pg_class.reltuples` is refreshed by VACUUM/ANALYZE (including autovacuum),
+    so it's approximate but costs a single catalog lookup. It's -1 for a
+    table that has never been analyzed — we return None so the caller falls
+    back to an exact count.
+    """
+    result = await session.execute(
+        text("SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table AS regclass)"),
+        {"table": Product.__tablename__},
+    )
+    estimate: int = result.scalar_one()
+    return estimate if estimate >= 0 else None
+
+
+async def count_products(
     session: AsyncSession,
+    query: Select[Any],
     params: ProductListParams,
-) -> tuple[list[Product], int]:
-    """List products with pagination and optional filters.
+) -> int:
+    """Total rows matching `query`, using the cheapest strategy available.
 
-    Returns:
-        A tuple of (products, total_count) for building paginated responses.
+    Args:
+        session: DB session.
+        query: The filtered (but not yet ordered or paginated) product query.
+        params: The listing params `query` was built from — used as cache key.
     """
-    # Build the base query — SELECT * FROM products
-    query = select(Product)
+    key = _count_cache_key(params)
+    cached = product_count_cache.get(key)
+    if cached is not None:
+        return cached
+
+    total = None
+    if settings.product_count_mode == "estimate" and _is_unfiltered(params):
+        total = await _estimate_product_total(session)
+
+    if total is None:
+        # Count total matching rows (before pagination) for the "pages" field.
+        count_query = select(func.count()).select_from(query.subquery())
+        total_result = await session.execute(count_query)
+        total = total_result.scalar_one()
+
+    product_count_cache.set(key, total)
+    return total
+
 
+def invalidate_product_counts() -> None:
+    """Drop cached listing totals."""
+    product_count_cache.clear()
+
+
+def invalidate_product_caches() -> None:
+    """Drop everything derived from product rows. Called after every product write.
+
+    Covers cached listing totals and the rendered public catalog responses
+    in `app.response_cache`, and keeps this process's catalog reads on the
+    primary until a read replica has caught up with the write.
+    """
+    invalidate_product_counts()
+    catalog_cache.clear()
+    record_primary_write()
+
+
+def _apply_filters(query: Select[RowT], params: ProductListParams) -> Select[RowT]:
+    """Add the WHERE clauses for the listing filters in `params`.
+
+    Shared by the page query and the cheap version probe, so both always
+    describe the same set of rows.
+    """
     # Apply filters conditionally. Each `.where()` ANDs another condition.
     if params.available_only:
         query = query.where(Product.is_available.is_(True))
@@ -49,21 +262,219 @@ async def list_products(
     if params.search is not None:
         # `ilike` is case-insensitive LIKE — Postgres-specific.
         # The `%` wildcards match any characters before/after the search term.
+        # A leading `%` rules out btree indexes, but the pg_trgm GIN index
+        # `ix_products_name_trgm` can answer it for terms of 3+ characters.
         query = query.where(Product.name.ilike(f"%{params.search}%"))
+    return query
+
+
+def _page_query(query: Select[RowT], params: ProductListParams) -> Select[RowT]:
+    """Filter, sort and paginate `query` into one page of the listing.
+
+    Shared by `list_products` and the version probe, so both always see the
+    same rows. Adds a trailing `rank` column when searching, and selects
+    one row past the page to tell whether a next page exists.
+
+    Raises:
+        InvalidCursorError: If `params.cursor` can't be decoded.
+    """
+    query = _apply_filters(query, params)
+
+    # Sort key, all DESC: relevance first when searching, then newest first.
+    # `id` breaks ties so the order is total — required for keyset paging,
+    # and keeps OFFSET pages stable too.
+    rank = _search_rank(params)
+    sort_key: list[ColumnElement[Any] | InstrumentedAttribute[Any]] = [
+        Product.created_at,
+        Product.id,
+    ]
+    if rank is not None:
+        sort_key.insert(0, rank)
+        query = query.add_columns(rank)
+    query = query.order_by(*(column.desc() for column in sort_key))
+
+    if params.cursor is not None:
+        # Keyset: seek past the last row of the previous page.
+        last_created_at, last_id, last_rank = decode_cursor(params.cursor)
+        if (last_rank is None) != (rank is None):
+            # A search cursor replayed without the search, or vice versa.
+            raise InvalidCursorError("Cursor does not match the search parameters")
+        cursor_key: list[Any] = [last_created_at, last_id]
+        if last_rank is not None:
+            cursor_key.insert(0, last_rank)
+        query = query.where(tuple_(*sort_key) < tuple_(*cursor_key))
+    else:
+        # Apply pagination: OFFSET = skip rows, LIMIT = max rows returned.
+        query = query.offset((params.page - 1) * params.per_page)
+
+    return query.limit(params.per_page + 1)
+
+
+ListingVersion = tuple[datetime | None, tuple[Any, ...]]
+
+
+def page_version(rows: Sequence[Row[Any]], total: int | None, has_next: bool) -> ListingVersion:
+    """Last-Modified and an ETag fingerprint for one page of a listing.
+
+    The fingerprint pins everything the response body is built from: which
+    rows are on the page, the newest `updated_at` among them (it is set to
+    now() on every write, so any edit to a row on the page moves it), the
+    total, and whether a next page exists. `rows` need `id` and `updated_at`.
+
+    Returns:
+        A tuple of (latest updated_at or None for an empty page, fingerprint).
+    """
+    last_modified = max((row.updated_at for row in rows), default=None)
+    return last_modified, (total, has_next, last_modified, *(row.id for row in rows))
+
+
+async def get_listing_version(
+    session: AsyncSession,
+    params: ProductListParams,
+) -> ListingVersion:
+    """`page_version` of the page a listing would show, without loading it.
+
+    Only for conditional requests: runs the page query for just
+    `(id, updated_at)`, so an unchanged page can get a 304 without reading
+    or serializing full rows. The total comes from `count_products`, the
+    same (possibly cached) value the response body would carry.
+
+    Raises:
+        InvalidCursorError: If `params.cursor` can't be decoded.
+    """
+    result = await session.execute(_page_query(select(Product.id, Product.updated_at), params))
+    rows = list(result.all())
+    total = (
+        await count_products(session, _apply_filters(select(Product.id), params), params)
+        if params.include_total
+        else None
+    )
+    return page_version(rows[: params.per_page], total, len(rows) > params.per_page)
+
+
+async def list_products(
+    session: AsyncSession,
+    params: ProductListParams,
+) -> tuple[list[Row[Any]], int | None, str | None]:
+    """List products with pagination and optional filters.
+
+    Selects plain columns rather than `Product` entities: rows come back as
+    lightweight named tuples, skipping ORM object construction and
+    identity-map bookkeeping. Rows still support attribute access
+    (`row.name`), so `ProductResponse.model_validate(row)` works on them.
+
+    Only the columns of the schema picked by `params.fields` are selected
+    (see `LIST_FIELDS`), so `fields=summary` never reads `description`.
+    Each row starts with those columns, in schema field order; sort-only
+    and bookkeeping columns (`created_at` and `updated_at` for summaries,
+    `rank` when searching) trail them.
+
+    Uses keyset pagination when `params.cursor` is set, OFFSET otherwise.
+    Either way, one extra row is fetched to find out whether a next page
+    exists without a second query.
+
+    Returns:
+        A tuple of (rows, total_count, next_cursor) for building
+        paginated responses. `total_count` is None when the client opted
+        out with `include_total=False`. `next_cursor` is None on the last page.
+
+    Raises:
+        InvalidCursorError: If `params.cursor` can't be decoded.
+    """
+    # Build the base query — SELECT <response columns> FROM products WHERE <filters>
+    fields = LIST_FIELDS[params.fields]
+    columns: list[ColumnElement[Any] | InstrumentedAttribute[Any]] = [
+        getattr(Product, field) for field in fields
+    ]
+    if "created_at" not in fields:
+        columns.append(Product.created_at)  # needed for next_cursor
+    if "updated_at" not in fields:
+        columns.append(Product.updated_at)  # needed for page_version
+    query = select(*columns)
+
+    total = (
+        await count_products(session, _apply_filters(query, params), params)
+        if params.include_total
+        else None
+    )
+
+    result = await session.execute(_page_query(query, params))
+    # Rows are named tuples: the schema's columns, then any sort-only columns.
+    rows = list(result.all())
+
+    next_cursor = None
+    if len(rows) > params.per_page:
+        rows = rows[: params.per_page]
+        last = rows[-1]
+        next_cursor = encode_cursor(
+            last.created_at, last.id, last.rank if params.search is not None else None
+        )
+
+    return rows, total, next_cursor
+
+
+# ts_headline options: up to two description fragments of 5-20 words,
+# matches wrapped in <mark> for the storefront to highlight.
+_HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxFragments=2, MinWords=5, MaxWords=20"
+
+
+async def search_products(
+    session: AsyncSession,
+    params: ProductSearchParams,
+) -> tuple[list[tuple[Product, float, str]], int]:
+    """Full-text search over product names and descriptions.
+
+    `websearch_to_tsquery` turns free text into a tsquery (never raises on
+    odd input, unlike `to_tsquery`). `@@` matches it against the generated
+    `search_vector` column through its GIN index, and `ts_rank` scores
+    matches using the column's A/B weights, so name hits outrank
+    description-only hits.
+
+    `ts_headline` re-parses the raw description, so it's the expensive part.
+    Postgres postpones costly SELECT-list expressions until after
+    ORDER BY + LIMIT, so it only runs for the rows on this page.
+
+    Returns:
+        A tuple of ([(product, rank, snippet), ...], total_count).
+    """
+    tsquery = func.websearch_to_tsquery(FTS_CONFIG, params.q)
+    query = select(Product).where(Product.search_vector.bool_op("@@")(tsquery))
+    query = query.where(Product.is_available.is_(True))
+    if params.category is not None:
+        query = query.where(Product.category == params.category)
+    if params.condition is not None:
+        query = query.where(Product.condition == params.condition)
 
-    # Count total matching rows (before pagination) for the "pages" field.
     count_query = select(func.count()).select_from(query.subquery())
-    total_result = await session.execute(count_query)
-    total = total_result.scalar_one()
+    total = (await session.execute(count_query)).scalar_one()
 
-    # Apply pagination: OFFSET = skip rows, LIMIT = max rows returned.
-    offset = (params.page - 1) * params.per_page
-    query = query.order_by(Product.created_at.desc()).offset(offset).limit(params.per_page)
+    rank = func.ts_rank(Product.search_vector, tsquery, type_=Float).label("rank")
+    snippet = func.ts_headline(
+        FTS_CONFIG, Product.description, tsquery, _HEADLINE_OPTIONS, type_=Text
+    ).label("snippet")
+    query = (
+        query.add_columns(rank, snippet)
+        .order_by(rank.desc(), Product.created_at.desc(), Product.id.desc())
+        .offset((params.page - 1) * params.per_page)
+        .limit(params.per_page)
+    )
 
     result = await session.execute(query)
-    products = list(result.scalars().all())
+    return [(row[0], row[1], row[2]) for row in result.all()], total
 
-    return products, total
+
+async def get_product_version(
+    session: AsyncSession, slug: str
+) -> tuple[uuid.UUID, datetime] | None:
+    """Fetch just `(id, updated_at)` for a slug — an index lookup, no full row.
+
+    Returns None if no product has this slug.
+    """
+    result = await session.execute(
+        select(Product.id, Product.updated_at).where(Product.slug == slug)
+    )
+    row = result.one_or_none()
+    return (row.id, row.updated_at) if row is not None else None
 
 
 async def get_product_by_slug(session: AsyncSession, slug: str) -> Product | None:
@@ -78,27 +489,27 @@ async def get_product_by_id(session: AsyncSession, product_id: uuid.UUID) -> Pro
     return result.scalar_one_or_none()
 
 
-async def create_product(session: AsyncSession, data: ProductCreate) -> Product:
-    """Create a new product.
+async def create_product(session: AsyncSession, data: ProductCreate) -> Row[Any]:
+    """Create a new product with a single `INSERT ... RETURNING`.
 
-    `model_dump()` converts the Pydantic schema to a dict, which we
-    unpack into the SQLAlchemy model constructor with `**`.
+    `model_dump()` converts the Pydantic schema to a dict of column values.
+    RETURNING hands back the DB-generated fields (id, created_at,
+    updated_at) with the insert itself, so there's no refresh SELECT.
+    Raises `IntegrityError` if the slug is taken.
     """
-    product = Product(**data.model_dump())
-    session.add(product)
+    stmt = insert(Product).values(**data.model_dump()).returning(*_RESPONSE_COLUMNS)
+    product = (await session.execute(stmt)).one()
     await session.commit()
-    # Refresh loads the DB-generated fields (id, created_at, updated_at)
-    # back into the Python object.
-    await session.refresh(product)
+    invalidate_product_caches()
     return product
 
 
 async def update_product(
     session: AsyncSession,
-    product: Product,
+    product_id: uuid.UUID,
     data: ProductUpdate,
-) -> Product:
-    """Update an existing product with partial data.
+) -> Row[Any] | None:
+    """Update an existing product with partial data. None if it doesn't exist.
 
     `exclude_unset=True` is the key pattern here — it only returns fields
     the client actually sent in the request body. If the client sends
@@ -107,28 +518,136 @@ async def update_product(
 
     Without `exclude_unset`, all optional fields would default to None
     and overwrite existing data.
+
+    One `UPDATE ... WHERE id = :id RETURNING ...` both finds and changes
+    the row — no SELECT first, no refresh after. Raises `IntegrityError`
+    if the new slug is taken.
     """
     update_data = data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(product, field, value)
-    await session.commit()
-    await session.refresh(product)
-    return product
+    if not update_data:
+        # Nothing to change: don't bump updated_at, just return the row.
+        stmt = select(*_RESPONSE_COLUMNS).where(Product.id == product_id)
+        return (await session.execute(stmt)).one_or_none()
+    return await _update_one(session, product_id, update_data)
 
 
-async def soft_delete_product(session: AsyncSession, product: Product) -> Product:
-    """Soft-delete a product by marking it unavailable.
+async def soft_delete_product(session: AsyncSession, product_id: uuid.UUID) -> Row[Any] | None:
+    """Soft-delete a product by marking it unavailable. None if it doesn't exist.
 
     We never hard-delete products because they might be referenced
     by existing orders. Setting `is_available = False` hides them
     from the storefront while preserving order history.
     """
-    product.is_available = False
+    return await _update_one(session, product_id, {"is_available": False})
+
+
+async def _update_one(
+    session: AsyncSession,
+    product_id: uuid.UUID,
+    values: dict[str, Any],
+) -> Row[Any] | None:
+    """`UPDATE products SET ... WHERE id = :id RETURNING ...`, then commit."""
+    stmt = (
+        update(Product)
+        .where(Product.id == product_id)
+        .values(**values)
+        .returning(*_RESPONSE_COLUMNS)
+    )
+    result = await session.execute(stmt, execution_options={"synchronize_session": False})
+    product = result.one_or_none()
     await session.commit()
-    await session.refresh(product)
+    if product is not None:
+        invalidate_product_caches()
     return product
 
 
+def product_id_in(ids: list[uuid.UUID]) -> ColumnElement[bool]:
+    """`products.id = ANY(:ids)` — one array parameter, whatever the count.
+
+    `Product.id.in_(ids)` renders one placeholder per id, so every list
+    length is a different statement to compile and prepare.
+    """
+    return Product.id == any_(bindparam("ids", ids, type_=ARRAY(Product.__table__.c.id.type)))
+
+
+async def _bulk_update(
+    session: AsyncSession,
+    stmt: Update,
+    ids: list[uuid.UUID] | None,
+    *,
+    narrowed: bool = False,
+) -> tuple[list[Row[Any]], list[uuid.UUID]]:
+    """Run a set-based UPDATE ... RETURNING, commit, and report missing ids.
+
+    `narrowed` means `stmt` has conditions besides the ids (e.g. a
+    category), so an id it didn't update may still exist. Those are looked
+    up before reporting, and only ids with no product at all are returned.
+    """
+    stmt = stmt.returning(*_RESPONSE_COLUMNS)
+    # Core-style execution: no identity-map bookkeeping for rows we never loaded.
+    result = await session.execute(stmt, execution_options={"synchronize_session": False})
+    rows = list(result.all())
+
+    found = {row.id for row in rows}
+    not_found = [product_id for product_id in dict.fromkeys(ids or ()) if product_id not in found]
+    if not_found and narrowed:
+        existing = set(await session.scalars(select(Product.id).where(product_id_in(not_found))))
+        not_found = [product_id for product_id in not_found if product_id not in existing]
+
+    await session.commit()
+    if rows:
+        invalidate_product_caches()
+    return rows, not_found
+
+
+async def bulk_update_products(
+    session: AsyncSession,
+    ids: list[uuid.UUID],
+    data: ProductUpdate,
+) -> tuple[list[Row[Any]], list[uuid.UUID]]:
+    """Apply one partial update to many products in a single statement.
+
+    `UPDATE products SET ... WHERE id = ANY(:ids) RETURNING ...` replaces
+    one `update_product` call per product.
+    Returns the updated rows and the ids that matched nothing.
+    """
+    stmt = update(Product).where(product_id_in(ids)).values(**data.model_dump(exclude_unset=True))
+    return await _bulk_update(session, stmt, ids)
+
+
+async def bulk_soft_delete_products(
+    session: AsyncSession,
+    ids: list[uuid.UUID],
+) -> tuple[list[Row[Any]], list[uuid.UUID]]:
+    """Soft-delete many products in a single statement (see `soft_delete_product`)."""
+    stmt = update(Product).where(product_id_in(ids)).values(is_available=False)
+    return await _bulk_update(session, stmt, ids)
+
+
+async def reprice_products(
+    session: AsyncSession,
+    percent: Decimal,
+    ids: list[uuid.UUID] | None = None,
+    category: ProductCategory | None = None,
+) -> tuple[list[Row[Any]], list[uuid.UUID]]:
+    """Scale prices by `percent` for the products matching `ids` and/or `category`.
+
+    The arithmetic runs in Postgres NUMERIC, so `+10%` of 4999 cents is
+    exactly 5498.9 before rounding — no float error creeps into money.
+
+    With both, ids outside `category` are left alone, but aren't reported
+    as not found.
+    """
+    factor = (Decimal(100) + percent) / Decimal(100)
+    new_price = func.greatest(1, cast(func.round(Product.price_cents * factor), Integer))
+    stmt = update(Product).values(price_cents=new_price)
+    if ids is not None:
+        stmt = stmt.where(product_id_in(ids))
+    if category is not None:
+        stmt = stmt.where(Product.category == category)
+    return await _bulk_update(session, stmt, ids, narrowed=category is not None)
+
+
 def calculate_pages(total: int, per_page: int) -> int:
     """Calculate total number of pages for pagination."""
     return max(1, math.ceil(total / per_page))
@@ -0,0 +1,289 @@
+"""Reservation service — hold stock while a customer pays.
+
+Most figures are one of a kind (`quantity = 1`), and a drop of a rare one
+brings hundreds of checkouts for the same row within seconds. Checking
+`is_available` and creating the Stripe session isn't enough: every one of
+those customers would be sent to pay for the same figure. Instead, starting
+a checkout *reserves* its items, and only one customer can hold a unit.
+
+**Reserving is one statement.** For a whole cart:
+
+    WITH locked AS (SELECT id FROM products
+                    WHERE id = ANY(:ids) AND is_available AND quantity > 0
+                    ORDER BY id FOR UPDATE),
+         taken  AS (UPDATE products SET quantity = quantity - 1
+                    FROM locked WHERE products.id = locked.id
+                    RETURNING products.id)
+    INSERT INTO product_reservations (...) SELECT ... FROM taken
+    RETURNING product_id
+
+- The decrement is conditional (`quantity > 0`), so stock can't go
+  negative: when two checkouts race for the last unit, the second waits
+  for the first's row lock, then re-checks the condition against the
+  committed row, finds 0, and reserves nothing. No oversell, and no
+  read-then-write window in application code.
+- Lock waits are short by construction: the locks are held for one
+  statement plus the commit. A waiter on a sold-out row gives up as soon as
+  the holder commits. `reservation_lock_timeout_ms` caps the wait anyway,
+  so a pile-up turns into quick 503s instead of a growing queue.
+- Rows are locked in id order, so two carts sharing products can't
+  deadlock by locking them in opposite orders.
+- All or nothing: if any item didn't get a unit, the transaction is rolled
+  back and the caller learns which items were taken.
+
+**Releasing** (the checkout failed, or the hold expired) deletes the
+reservation rows and adds their units back, again in one statement and in
+id order. **Consuming** (the customer paid) deletes them and keeps the
+units taken.
+
+**Expiry** is handled by `ReservationSweeper`, a background task per worker
+process that releases expired holds in batches. It picks rows with
+`FOR UPDATE SKIP LOCKED`, so sweepers on several workers split the work
+instead of queueing on each other, and never wait on a hold that a
+checkout or webhook is busy with.
+
+Reservations don't clear the catalog cache: the `quantity` it serves may
+lag by up to its TTL. That's fine — reserving, not the catalog, enforces
+stock — and clearing it on every reservation would empty the cache
+continuously during exactly the traffic spike it exists for.
+"""
+
+import asyncio
+import contextlib
+import logging
+import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from sqlalchemy import (
+    ColumnElement,
+    bindparam,
+    delete,
+    func,
+    insert,
+    literal,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.models.product import Product
+from app.models.reservation import ProductReservation
+from app.services.product import product_id_in
+
+logger = logging.getLogger(__name__)
+
+# Postgres SQLSTATE for lock_timeout expiring.
+LOCK_NOT_AVAILABLE = "55P03"
+
+
+class ProductsUnavailableError(Exception):
+    """Some products had no unit left to reserve. Nothing was reserved."""
+
+    def __init__(self, product_ids: list[uuid.UUID]) -> None:
+        super().__init__("Some products are no longer available")
+        self.product_ids = product_ids
+
+
+class ReservationBusyError(Exception):
+    """Waited longer than `reservation_lock_timeout_ms` for a row lock."""
+
+
+@dataclass(frozen=True)
+class ReservationHold:
+    """The units reserved for one checkout."""
+
+    hold_id: uuid.UUID
+    product_ids: list[uuid.UUID]
+    expires_at: datetime
+
+
+async def reserve_products(
+    session: AsyncSession,
+    product_ids: Sequence[uuid.UUID],
+    ttl_seconds: int | None = None,
+) -> ReservationHold:
+    """Reserve one unit of each product for `ttl_seconds`, and commit.
+
+    Raises `ProductsUnavailableError` (listing the products that had no
+    unit left) or `ReservationBusyError`; either way nothing is reserved.
+    `product_ids` must not repeat.
+    """
+    if not product_ids:
+        raise ValueError("Nothing to reserve")
+    ttl = settings.reservation_ttl_seconds if ttl_seconds is None else ttl_seconds
+    hold_id = uuid.uuid4()
+
+    locked = (
+        select(Product.id)
+        .where(product_id_in(list(product_ids)), Product.is_available, Product.quantity > 0)
+        .order_by(Product.id)
+        .with_for_update()
+        .cte("locked")
+    )
+    taken = (
+        update(Product)
+        .where(Product.id == locked.c.id)
+        .values(quantity=Product.quantity - 1)
+        .returning(Product.id)
+        .cte("taken")
+    )
+    stmt = insert(ProductReservation).from_select(
+        ["id", "hold_id", "product_id", "expires_at"],
+        select(
+            func.gen_random_uuid(),
+            literal(hold_id, ProductReservation.hold_id.type),
+            taken.c.id,
+            func.now() + bindparam("ttl", timedelta(seconds=ttl)),
+        ),
+    )
+
+    try:
+        if settings.reservation_lock_timeout_ms > 0:
+            # Transaction-scoped (SET LOCAL), so it never leaks to the next
+            # user of this pooled connection.
+            await session.execute(
+                text("SELECT set_config('lock_timeout', :timeout, true)"),
+                {"timeout": f"{settings.reservation_lock_timeout_ms}ms"},
+            )
+        result = await session.execute(
+            stmt.returning(ProductReservation.product_id, ProductReservation.expires_at)
+        )
+        rows = result.all()
+    except DBAPIError as exc:
+        await session.rollback()
+        if getattr(exc.orig, "sqlstate", None) == LOCK_NOT_AVAILABLE:
+            raise ReservationBusyError("Timed out waiting for a product row lock") from exc
+        raise
+
+    reserved = {row.product_id for row in rows}
+    if len(reserved) < len(product_ids):
+        await session.rollback()
+        raise ProductsUnavailableError([pid for pid in product_ids if pid not in reserved])
+
+    await session.commit()
+    return ReservationHold(
+        hold_id=hold_id, product_ids=list(product_ids), expires_at=rows[0].expires_at
+    )
+
+
+async def _release(session: AsyncSession, which: ColumnElement[bool]) -> int:
+    """Delete the matching reservations and restock their units. Returns units released."""
+    released = (
+        delete(ProductReservation)
+        .where(which)
+        .returning(ProductReservation.product_id)
+        .cte("released")
+    )
+    units = (
+        select(released.c.product_id, func.count().label("units"))
+        .group_by(released.c.product_id)
+        .cte("units")
+    )
+    locked = (
+        select(Product.id, units.c.units)
+        .join(units, Product.id == units.c.product_id)
+        .order_by(Product.id)
+        .with_for_update(of=Product)
+        .cte("locked")
+    )
+    result = await session.execute(
+        update(Product)
+        .where(Product.id == locked.c.id)
+        .values(quantity=Product.quantity + locked.c.units)
+        .returning(locked.c.units),
+        # No ORM instance sync: its "fetch" strategy would take over RETURNING.
+        execution_options={"synchronize_session": False},
+    )
+    count = int(sum(result.scalars().all()))
+    await session.commit()
+    return count
+
+
+async def release_hold(session: AsyncSession, hold_id: uuid.UUID) -> int:
+    """Give a hold's units back to stock (e.g. the checkout never started)."""
+    return await _release(session, ProductReservation.hold_id == hold_id)
+
+
+async def consume_hold(session: AsyncSession, hold_id: uuid.UUID) -> int:
+    """Drop a paid hold's reservations *without* restocking. Returns rows deleted.
+
+    The units were sold. Doesn't commit: call it in the transaction that
+    records the sale, so the two can't come apart.
+    """
+    result = await session.execute(
+        delete(ProductReservation)
+        .where(ProductReservation.hold_id == hold_id)
+        .returning(ProductReservation.id)
+    )
+    return len(result.all())
+
+
+async def release_expired_reservations(session: AsyncSession, batch_size: int) -> int:
+    """Release up to `batch_size` expired reservations, oldest first.
+
+    Reservations locked by someone else are skipped, not waited for.
+    """
+    expired = (
+        select(ProductReservation.id)
+        .where(ProductReservation.expires_at <= func.now())
+        .order_by(ProductReservation.expires_at)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    return await _release(session, ProductReservation.id.in_(expired.scalar_subquery()))
+
+
+class ReservationSweeper:
+    """Background task that releases expired reservations every `interval` seconds."""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        *,
+        interval: float,
+        batch_size: int,
+    ) -> None:
+        self.session_factory = session_factory
+        self.interval = interval
+        self.batch_size = batch_size
+        self._task: asyncio.Task[None] | None = None
+
+    async def sweep(self) -> int:
+        """Release every expired reservation now, one batch per transaction."""
+        total = 0
+        while True:
+            async with self.session_factory() as session:
+                released = await release_expired_reservations(session, self.batch_size)
+            total += released
+            if released < self.batch_size:
+                break
+        if total:
+            logger.info("Released %d expired reservations", total)
+        return total
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.sweep()
+            except Exception:  # keep sweeping after a transient DB error
+                logger.exception("Reservation sweep failed")
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        """Start the background sweep task (idempotent)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="reservation-sweeper")
+
+    async def stop(self) -> None:
+        """Cancel the background task and wait for it to finish."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
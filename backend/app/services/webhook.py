@@ -0,0 +1,293 @@
+"""Stripe webhooks — store, acknowledge, and handle events in the background.
+
+Stripe waits up to a few seconds for a 2xx and retries anything it doesn't
+get one for. Handling an event inline (create the order, lock and update
+products, consume the reservation) would keep Stripe's connection open for
+all that database work, and a slow response turns into a redelivery that
+runs the same work twice.
+
+So the webhook request only does the cheap, durable part:
+1. Verify the signature against the raw body.
+2. `INSERT ... ON CONFLICT (stripe_event_id) DO NOTHING` into
+   `webhook_events` — one statement; a redelivered event is a no-op.
+3. Commit, wake the workers, return 200.
+
+**Workers.** `WebhookWorkerPool` runs a few asyncio tasks per process. Each
+claims one due event at a time with `FOR UPDATE SKIP LOCKED` (workers in
+every process share the table without blocking each other), pushing its
+`next_attempt_at` a lease into the future, then runs the handler:
+- success → `processed`
+- exception → retried after an exponential backoff
+  (`webhook_retry_base_seconds * 2^(attempt - 1)`, capped), and marked
+  `failed` after `webhook_max_attempts`
+- process crash → the lease runs out and another worker picks it up.
+
+Workers wake immediately when a request stores an event, and otherwise
+poll every `webhook_poll_interval_seconds` for retries and for events
+stored by other processes.
+
+**Handlers run at least once** (a crash after the handler commits but
+before the event is marked processed re-runs it), so every handler must
+be idempotent: order creation skips sessions that already have an order,
+and releasing a hold twice releases nothing the second time.
+"""
+
+import asyncio
+import contextlib
+import logging
+import uuid
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+from typing import Any, cast
+
+import orjson
+import stripe
+from sqlalchemy import Row, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.database import async_session
+from app.models.webhook_event import WebhookEvent, WebhookEventStatus
+from app.services.order import create_order_from_checkout
+from app.services.reservation import release_hold
+
+logger = logging.getLogger(__name__)
+
+# Reject signatures older than this (Stripe's own default), against replays.
+SIGNATURE_TOLERANCE_SECONDS = 300
+
+# `(payload, header, secret, tolerance)`; raises SignatureVerificationError.
+# The SDK leaves it unannotated, so mypy --strict would reject the call.
+_verify_header = cast(Callable[[str, str, str, int], bool], stripe.WebhookSignature.verify_header)
+
+Handler = Callable[[AsyncSession, dict[str, Any]], Awaitable[Any]]
+
+
+async def _checkout_completed(session: AsyncSession, checkout: dict[str, Any]) -> None:
+    await create_order_from_checkout(session, checkout)
+
+
+async def _checkout_expired(session: AsyncSession, checkout: dict[str, Any]) -> None:
+    # The customer never paid: give the held items back now instead of
+    # waiting for the reservation to expire.
+    if checkout.get("client_reference_id"):
+        await release_hold(session, uuid.UUID(checkout["client_reference_id"]))
+
+
+# Event type → handler, called with the event's `data.object`. Other event
+# types are acknowledged and dropped without being stored.
+HANDLERS: dict[str, Handler] = {
+    "checkout.session.completed": _checkout_completed,
+    "checkout.session.expired": _checkout_expired,
+}
+
+
+class InvalidWebhookError(ValueError):
+    """Missing or bad signature, or a body that isn't a Stripe event."""
+
+
+def verify_event(payload: bytes, signature: str | None, secret: str) -> dict[str, Any]:
+    """Check the `Stripe-Signature` header and parse the event.
+
+    Raises `InvalidWebhookError`.
+    """
+    if not signature:
+        raise InvalidWebhookError("Missing Stripe-Signature header")
+    try:
+        _verify_header(payload.decode(), signature, secret, SIGNATURE_TOLERANCE_SECONDS)
+        event = orjson.loads(payload)
+    except (stripe.SignatureVerificationError, UnicodeDecodeError, orjson.JSONDecodeError) as exc:
+        raise InvalidWebhookError(str(exc)) from exc
+    if not isinstance(event, dict) or not isinstance(event.get("id"), str):
+        raise InvalidWebhookError("Not a Stripe event")
+    return event
+
+
+async def record_event(session: AsyncSession, event: dict[str, Any]) -> bool:
+    """Queue an event for the workers, and commit.
+
+    Returns False when it's already stored (a redelivery), or when nothing
+    here handles its type.
+    """
+    if event.get("type") not in HANDLERS:
+        return False
+    result = await session.execute(
+        insert(WebhookEvent)
+        .values(
+            id=uuid.uuid4(),
+            stripe_event_id=event["id"],
+            type=event["type"],
+            payload=event,
+            status=WebhookEventStatus.PENDING,
+            attempts=0,
+        )
+        .on_conflict_do_nothing(index_elements=[WebhookEvent.stripe_event_id])
+        .returning(WebhookEvent.id)
+    )
+    inserted = result.scalar_one_or_none() is not None
+    await session.commit()
+    return inserted
+
+
+class WebhookWorkerPool:
+    """`workers` asyncio tasks draining `webhook_events` (see module docstring)."""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        *,
+        workers: int,
+        poll_interval: float,
+        max_attempts: int,
+        retry_base_seconds: float,
+        retry_max_seconds: float,
+        lease_seconds: float,
+        handlers: dict[str, Handler] = HANDLERS,
+    ) -> None:
+        self.session_factory = session_factory
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.retry_base_seconds = retry_base_seconds
+        self.retry_max_seconds = retry_max_seconds
+        self.lease_seconds = lease_seconds
+        self.handlers = handlers
+        self._wakeup = asyncio.Event()
+        self._tasks: list[asyncio.Task[None]] = []
+
+    def notify(self) -> None:
+        """An event was stored: wake the workers now instead of at the next poll."""
+        self._wakeup.set()
+
+    def retry_delay(self, attempts: int) -> float:
+        """Backoff before the next try, after `attempts` failed ones."""
+        return min(self.retry_base_seconds * 2.0 ** (attempts - 1), self.retry_max_seconds)
+
+    async def _claim(self) -> Row[Any] | None:
+        """Lease the pending event due soonest; None if nothing is due."""
+        due = (
+            select(WebhookEvent.id)
+            .where(
+                WebhookEvent.status == WebhookEventStatus.PENDING,
+                WebhookEvent.next_attempt_at <= func.now(),
+            )
+            .order_by(WebhookEvent.next_attempt_at)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        async with self.session_factory() as session:
+            result = await session.execute(
+                update(WebhookEvent)
+                .where(WebhookEvent.id == due)
+                .values(
+                    attempts=WebhookEvent.attempts + 1,
+                    next_attempt_at=func.now() + timedelta(seconds=self.lease_seconds),
+                )
+                .returning(
+                    WebhookEvent.id, WebhookEvent.type, WebhookEvent.payload, WebhookEvent.attempts
+                ),
+                execution_options={"synchronize_session": False},
+            )
+            row = result.one_or_none()
+            await session.commit()
+        return row
+
+    async def _finish(self, event_id: uuid.UUID, **values: Any) -> None:
+        async with self.session_factory() as session:
+            await session.execute(
+                update(WebhookEvent).where(WebhookEvent.id == event_id).values(**values),
+                execution_options={"synchronize_session": False},
+            )
+            await session.commit()
+
+    async def process_next(self) -> bool:
+        """Claim and handle one due event. Returns False if none was due."""
+        claimed = await self._claim()
+        if claimed is None:
+            return False
+        event_id, event_type, payload, attempts = claimed
+
+        try:
+            async with self.session_factory() as session:
+                await self.handlers[event_type](session, payload["data"]["object"])
+        except Exception as exc:
+            error = f"{type(exc).__name__}: {exc}"
+            if attempts >= self.max_attempts:
+                logger.error("Webhook event %s failed for good: %s", payload["id"], error)
+                await self._finish(event_id, status=WebhookEventStatus.FAILED, last_error=error)
+            else:
+                delay = self.retry_delay(attempts)
+                logger.warning(
+                    "Webhook event %s failed (attempt %d), retrying in %.0fs: %s",
+                    payload["id"],
+                    attempts,
+                    delay,
+                    error,
+                )
+                await self._finish(
+                    event_id,
+                    next_attempt_at=func.now() + timedelta(seconds=delay),
+                    last_error=error,
+                )
+            return True
+
+        await self._finish(
+            event_id,
+            status=WebhookEventStatus.PROCESSED,
+            processed_at=func.now(),
+            last_error=None,
+        )
+        return True
+
+    async def drain(self) -> int:
+        """Handle events until none is due. Returns how many were tried."""
+        count = 0
+        while await self.process_next():
+            count += 1
+        return count
+
+    async def _run(self) -> None:
+        while True:
+            # Clear before draining, not after waking: a notify() that lands
+            # while this drain runs then cuts the next wait short instead of
+            # being wiped, and its event is picked up at once.
+            self._wakeup.clear()
+            try:
+                await self.drain()
+            except Exception:  # e.g. the DB is down; try again after the poll interval
+                logger.exception("Webhook worker error")
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+
+    def start(self) -> None:
+        """Start the worker tasks (idempotent)."""
+        self._tasks = [task for task in self._tasks if not task.done()]
+        for i in range(len(self._tasks), self.workers):
+            self._tasks.append(asyncio.create_task(self._run(), name=f"webhook-worker-{i}"))
+
+    async def stop(self) -> None:
+        """Cancel the worker tasks and wait for them to finish.
+
+        An event being handled is abandoned mid-way; its lease expires and
+        it's retried, which idempotent handlers make safe.
+        """
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._tasks = []
+
+
+# The app's pool, started by the lifespan in app/main.py.
+webhook_workers = WebhookWorkerPool(
+    async_session,
+    workers=settings.webhook_workers,
+    poll_interval=settings.webhook_poll_interval_seconds,
+    max_attempts=settings.webhook_max_attempts,
+    retry_base_seconds=settings.webhook_retry_base_seconds,
+    retry_max_seconds=settings.webhook_retry_max_seconds,
+    lease_seconds=settings.webhook_lease_seconds,
+)
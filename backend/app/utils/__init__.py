@@ -1,10 +1,24 @@
-"""Utility modules (JWT, password hashing, email templates)."""
+"""Utility modules (JWT, password hashing, caching, email templates)."""
 
-from app.utils.security import create_access_token, decode_token, hash_password, verify_password
+from app.utils.cache import CacheStats, TTLCache
+from app.utils.security import (
+    PasswordHasherBusyError,
+    create_access_token,
+    decode_token,
+    hash_password,
+    hash_password_async,
+    verify_password,
+    verify_password_async,
+)
 
 __all__ = [
+    "CacheStats",
+    "PasswordHasherBusyError",
+    "TTLCache",
     "create_access_token",
     "decode_token",
     "hash_password",
+    "hash_password_async",
     "verify_password",
+    "verify_password_async",
 ]
@@ -0,0 +1,110 @@
+"""In-process LRU cache with per-entry TTL.
+
+A small, dependency-free cache for values that are expensive to compute
+but fine to serve slightly stale (counts, rendered responses, lookups).
+
+**How it works:**
+- Entries live in an `OrderedDict`. Reading an entry moves it to the end,
+  so the *front* of the dict is always the least-recently-used entry.
+- When the cache is full, inserting evicts from the front (LRU).
+- Every entry stores an expiry timestamp from `time.monotonic()` (a clock
+  that never jumps backwards, unlike wall-clock time). Expired entries
+  are treated as misses and dropped on read.
+
+**Why not `functools.lru_cache`?** It has no TTL, can't be cleared per-key,
+and doesn't work on `async def` functions (it would cache the coroutine
+object, not its result).
+
+**Scope:** Each uvicorn worker process has its own cache. Writes clear the
+cache in the process that handled them; other workers catch up when their
+entries expire, so the TTL is the upper bound on staleness.
+
+Not thread-safe — fine for asyncio, where code between `await`s never
+runs concurrently.
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass
+class CacheStats:
+    """Counters for monitoring cache effectiveness."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class TTLCache(Generic[K, V]):
+    """Bounded LRU cache where every entry expires after `ttl_seconds`.
+
+    Usage:
+        counts: TTLCache[str, int] = TTLCache(maxsize=1024, ttl_seconds=30)
+        total = counts.get(key)
+        if total is None:
+            total = await expensive_count()
+            counts.set(key, total)
+    """
+
+    def __init__(self, maxsize: int, ttl_seconds: float) -> None:
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self.stats = CacheStats()
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: K) -> V | None:
+        """Return the cached value, or None on a miss or expired entry."""
+        entry = self._data.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            self.stats.misses += 1
+            return None
+
+        self._data.move_to_end(key)
+        self.stats.hits += 1
+        return value
+
+    def set(self, key: K, value: V, ttl_seconds: float | None = None) -> None:
+        """Store a value, evicting the least-recently-used entry if full.
+
+        A cache with `maxsize <= 0` or `ttl_seconds <= 0` stores nothing,
+        which makes "disable the cache" a config change, not a code change.
+        """
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        if self.maxsize <= 0 or ttl <= 0:
+            return
+
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.stats.evictions += 1
+
+    def pop(self, key: K) -> V | None:
+        """Remove a single entry (explicit invalidation)."""
+        entry = self._data.pop(key, None)
+        return entry[1] if entry is not None else None
+
+    def clear(self) -> None:
+        """Drop every entry. Stats are kept — they describe the cache's lifetime."""
+        self._data.clear()
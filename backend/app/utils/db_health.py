@@ -0,0 +1,104 @@
+"""Background database health check for the readiness endpoint.
+
+Orchestrators probe readiness every few seconds on every worker. Running
+`SELECT 1` per probe checks out a pool connection each time — under load
+the probe queues behind real requests (and fails for the wrong reason),
+and when idle it churns pool slots for nothing.
+
+`DatabaseHealthCheck` runs the check from one background task per process,
+once per `interval`, and keeps the result. The endpoint just reads the
+cached verdict, so a probe costs no I/O and no pool connection.
+
+If the background task dies or stalls, the cached result stops being
+refreshed; `is_ready()` treats a result older than three intervals as a
+failure, so a stuck checker can't keep reporting "ready" forever.
+"""
+
+import asyncio
+import contextlib
+import logging
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.utils.replica import ReplicaMonitor
+
+logger = logging.getLogger(__name__)
+
+STALE_AFTER_INTERVALS = 3
+
+
+class DatabaseHealthCheck:
+    """Periodic `SELECT 1` against one engine, with a cached result."""
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        *,
+        interval: float,
+        timeout: float,
+        replica_monitor: ReplicaMonitor | None = None,
+    ) -> None:
+        self.engine = engine
+        self.interval = interval
+        self.timeout = timeout
+        self.replica_monitor = replica_monitor
+        self.healthy = False
+        self.last_error: str | None = "not checked yet"
+        self.last_latency_ms: float | None = None
+        self.last_checked_at: float | None = None  # time.monotonic()
+        self._task: asyncio.Task[None] | None = None
+
+    async def _ping(self) -> None:
+        async with self.engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    async def check(self) -> bool:
+        """Ping the database now and update the cached result."""
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(self._ping(), timeout=self.timeout)
+        except Exception as exc:  # any failure means "not ready"
+            self.healthy = False
+            self.last_error = f"{type(exc).__name__}: {exc}"
+            logger.warning("Database health check failed: %s", self.last_error)
+        else:
+            self.healthy, self.last_error = True, None
+        self.last_latency_ms = (time.perf_counter() - start) * 1000
+        self.last_checked_at = time.monotonic()
+
+        # Piggyback the replica probe, so routing rarely has to probe inline.
+        if self.replica_monitor is not None:
+            await self.replica_monitor.check()
+        return self.healthy
+
+    def age_seconds(self) -> float | None:
+        """Seconds since the last completed check, or None if none has run."""
+        if self.last_checked_at is None:
+            return None
+        return time.monotonic() - self.last_checked_at
+
+    def is_ready(self) -> bool:
+        """Last check passed, and it is recent enough to trust."""
+        age = self.age_seconds()
+        return self.healthy and age is not None and age <= self.interval * STALE_AFTER_INTERVALS
+
+    async def _run(self) -> None:
+        while True:
+            await self.check()
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        """Start the background refresh task (idempotent)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="db-health-check")
+
+    async def stop(self) -> None:
+        """Cancel the background task and wait for it to finish."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
@@ -0,0 +1,48 @@
+"""Connection pool with checkout instrumentation.
+
+SQLAlchemy's pool reports its current state (`checkedout()`, `overflow()`)
+but not how long requests waited for a connection — the number that
+actually shows pool starvation. `InstrumentedAsyncQueuePool` times every
+checkout into a histogram and counts checkouts that hit `pool_timeout`.
+
+Checkout time includes opening a new connection when the pool grows, and
+`pool_pre_ping` when enabled: everything a request spends before its first
+query can run.
+
+Stats belong to one pool instance; `engine.dispose()` replaces the pool,
+which starts fresh counters.
+"""
+
+import time
+from dataclasses import dataclass, field
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
+
+from app.utils.metrics import Histogram
+
+
+@dataclass
+class PoolCheckoutStats:
+    """Cumulative checkout counters for one pool."""
+
+    wait_ms: Histogram = field(default_factory=Histogram)
+    timeouts: int = 0
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """`AsyncAdaptedQueuePool` that records how long each checkout took."""
+
+    def __init__(self, *args: object, **kwargs: object) -> None:
+        super().__init__(*args, **kwargs)  # type: ignore[arg-type]
+        self.checkout_stats = PoolCheckoutStats()
+
+    def connect(self) -> PoolProxiedConnection:
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            self.checkout_stats.timeouts += 1
+            raise
+        finally:
+            self.checkout_stats.wait_ms.observe((time.perf_counter() - start) * 1000)
@@ -0,0 +1,91 @@
+"""HTTP conditional request helpers (ETag / Last-Modified → 304).
+
+**How conditional requests work:**
+1. The server sends a validator with each response: an `ETag` (opaque
+   fingerprint of the content) and/or `Last-Modified` (a timestamp).
+2. The client caches the body and, next time, sends the validator back:
+   `If-None-Match: "<etag>"` or `If-Modified-Since: <date>`.
+3. If nothing changed, the server answers `304 Not Modified` with no body,
+   and the client reuses its copy — no serialization, almost no bandwidth.
+
+`If-None-Match` wins when both are sent (RFC 9110 §13.2.2) because ETags
+are exact, while HTTP dates only have one-second resolution.
+
+`Cache-Control: no-cache` means "store it, but revalidate before reuse" —
+without it, browsers may guess a freshness lifetime from `Last-Modified`
+and show stale prices without asking.
+"""
+
+import hashlib
+from collections.abc import Mapping
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Response, status
+
+
+def make_etag(*parts: object) -> str:
+    """Build a strong ETag from the values that determine a response body.
+
+    Strong (no `W/` prefix) because equal parts mean byte-identical bodies.
+    """
+    digest = hashlib.sha256("|".join(str(part) for part in parts).encode("utf-8"))
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def _as_utc(value: datetime) -> datetime:
+    # DB timestamps are naive (`timestamp without time zone`) in server time,
+    # which is UTC in every environment we run.
+    return value.replace(tzinfo=UTC) if value.tzinfo is None else value.astimezone(UTC)
+
+
+def http_date(value: datetime) -> str:
+    """Format a datetime as an HTTP date: `Wed, 21 Oct 2026 07:28:00 GMT`."""
+    return format_datetime(_as_utc(value), usegmt=True)
+
+
+def _etag_in(header: str, etag: str) -> bool:
+    """Weak comparison, as RFC 9110 requires for If-None-Match."""
+    if header.strip() == "*":
+        return True
+    candidates = (tag.strip().removeprefix("W/") for tag in header.split(","))
+    return etag.removeprefix("W/") in candidates
+
+
+def is_conditional(headers: Mapping[str, str]) -> bool:
+    """True if the request carries a validator that could earn it a 304."""
+    return "if-none-match" in headers or "if-modified-since" in headers
+
+
+def is_not_modified(headers: Mapping[str, str], etag: str, last_modified: datetime | None) -> bool:
+    """True if the client's cached copy (per its conditional headers) is current."""
+    if_none_match = headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_in(if_none_match, etag)
+
+    if_modified_since = headers.get("if-modified-since")
+    if if_modified_since is not None and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False  # unparseable dates are ignored, per spec
+        # HTTP dates have no sub-second part, so compare at second resolution.
+        return _as_utc(last_modified).replace(microsecond=0) <= _as_utc(since)
+
+    return False
+
+
+def validator_headers(etag: str, last_modified: datetime | None) -> dict[str, str]:
+    """ETag, Last-Modified and Cache-Control headers for a cacheable response."""
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+    return headers
+
+
+def not_modified(etag: str, last_modified: datetime | None) -> Response:
+    """A bodyless 304 that repeats the validators, as the spec requires."""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers=validator_headers(etag, last_modified),
+    )
@@ -0,0 +1,49 @@
+"""Tiny in-process metrics primitives for the diagnostics endpoints.
+
+Deliberately minimal — fixed buckets, no labels, no export format. If we
+ever need Prometheus, these map straight onto its histogram type.
+"""
+
+import threading
+from bisect import bisect_left
+from collections.abc import Sequence
+
+# Milliseconds. Wide enough to tell "instant" from "queued behind the pool"
+# from "about to time out".
+DEFAULT_MS_BUCKETS = (1.0, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0, 1000.0, 5000.0)
+
+
+class Histogram:
+    """Fixed-bucket histogram of observed values.
+
+    `buckets[i]` counts observations `<= bounds[i]` (and above the previous
+    bound); the last bucket, `+Inf`, catches everything larger.
+
+    Thread-safe: sync pool checkouts can run on any thread.
+    """
+
+    def __init__(self, bounds: Sequence[float] = DEFAULT_MS_BUCKETS) -> None:
+        self.bounds = tuple(bounds)
+        self._counts = [0] * (len(self.bounds) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.bounds, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    @property
+    def count(self) -> int:
+        return sum(self._counts)
+
+    @property
+    def mean(self) -> float:
+        count = self.count
+        return self._sum / count if count else 0.0
+
+    def buckets(self) -> dict[str, int]:
+        """Counts per bucket, keyed by upper bound: `{"1.0": 12, ..., "+Inf": 0}`."""
+        labels = [str(bound) for bound in self.bounds] + ["+Inf"]
+        return dict(zip(labels, self._counts, strict=True))
@@ -0,0 +1,194 @@
+"""SQLite rate-limit storage — one set of counters shared by every worker on a host.
+
+slowapi's default `memory://` storage lives inside each process, so with
+four uvicorn workers a `5/minute` limit really allows 20/minute. This
+backend keeps the counters in a SQLite file instead: every worker on the
+machine opens the same file, and SQLite's locking makes each check atomic
+across processes. No Redis needed for a single-host deployment.
+
+**Why SQLite (WAL mode):**
+- WAL lets readers proceed while a writer commits, and with
+  `synchronous=NORMAL` a commit doesn't fsync — a check costs tens of
+  microseconds, not a disk flush. Counters lost in a power cut are fine.
+- `BEGIN IMMEDIATE` takes the write lock up front, so the
+  read-compare-increment of a sliding-window check can't interleave with
+  another process's.
+
+**Lock waits block the event loop.** slowapi calls the storage
+synchronously, so a check waiting for another process's write lock holds
+up every request on its worker. `busy_timeout_ms` (default 50, from
+`rate_limit_sqlite_busy_timeout_ms`) caps the wait; past it the check
+raises `sqlite3.OperationalError`, and `rate_limit_fail_open` decides
+whether the request goes through or fails.
+
+Importing this module registers the `sqlite://` scheme with `limits`
+(subclasses of `Storage` self-register), so it's selected with a storage
+URI like SQLAlchemy's: `sqlite:///relative.db` or `sqlite:////abs/path.db`.
+
+Supports the fixed-window and sliding-window-counter strategies.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from math import floor
+
+from limits.storage import Storage
+from limits.storage.base import SlidingWindowCounterSupport, TimestampedSlidingWindow
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rate_limit_counters (
+    key TEXT PRIMARY KEY,
+    count INTEGER NOT NULL,
+    expires_at REAL NOT NULL
+) WITHOUT ROWID
+"""
+
+# Start a fresh window if the old one expired, otherwise add to it.
+_INCR = """
+INSERT INTO rate_limit_counters (key, count, expires_at) VALUES (:key, :amount, :expires_at)
+ON CONFLICT (key) DO UPDATE SET
+    count = CASE WHEN expires_at <= :now THEN :amount ELSE count + :amount END,
+    expires_at = CASE WHEN expires_at <= :now THEN :expires_at ELSE expires_at END
+RETURNING count
+"""
+
+# Expired rows are harmless (reads ignore them) but would grow the file
+# forever; sweep them every this many writes.
+_PURGE_EVERY = 1000
+
+
+class SQLiteStorage(Storage, SlidingWindowCounterSupport, TimestampedSlidingWindow):
+    """`limits` storage backed by a SQLite file shared between processes."""
+
+    STORAGE_SCHEME = ["sqlite"]  # noqa: RUF012 — declared as a plain attribute by `Storage`
+
+    def __init__(self, uri: str, wrap_exceptions: bool = False, **options: float | str | bool):
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+        self.path = uri.removeprefix("sqlite:///")
+        self.busy_timeout_ms = int(options.get("busy_timeout_ms", 50))
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._pid: int | None = None
+        self._writes = 0
+
+    @property
+    def base_exceptions(self) -> type[Exception]:
+        return sqlite3.Error
+
+    def _connection(self) -> sqlite3.Connection:
+        # Opened lazily and reopened after a fork: a SQLite connection must
+        # never be shared between processes.
+        if self._conn is None or self._pid != os.getpid():
+            conn = sqlite3.connect(
+                self.path,
+                timeout=self.busy_timeout_ms / 1000,  # also bounds the pragmas below
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(_SCHEMA)
+            self._conn, self._pid = conn, os.getpid()
+        return self._conn
+
+    def _incr(self, conn: sqlite3.Connection, key: str, expiry: float, amount: int) -> int:
+        now = time.time()
+        row = conn.execute(
+            _INCR, {"key": key, "amount": amount, "expires_at": now + expiry, "now": now}
+        ).fetchone()
+        self._writes += 1
+        if self._writes % _PURGE_EVERY == 0:
+            conn.execute("DELETE FROM rate_limit_counters WHERE expires_at <= ?", (now,))
+        return int(row[0])
+
+    def _get(self, conn: sqlite3.Connection, key: str, now: float) -> int:
+        row = conn.execute(
+            "SELECT count FROM rate_limit_counters WHERE key = ? AND expires_at > ?", (key, now)
+        ).fetchone()
+        return int(row[0]) if row else 0
+
+    def incr(self, key: str, expiry: int, amount: int = 1) -> int:
+        with self._lock:
+            return self._incr(self._connection(), key, expiry, amount)
+
+    def get(self, key: str) -> int:
+        with self._lock:
+            return self._get(self._connection(), key, time.time())
+
+    def get_expiry(self, key: str) -> float:
+        now = time.time()
+        with self._lock:
+            row = (
+                self._connection()
+                .execute(
+                    "SELECT expires_at FROM rate_limit_counters WHERE key = ? AND expires_at > ?",
+                    (key, now),
+                )
+                .fetchone()
+            )
+        return float(row[0]) if row else now
+
+    def check(self) -> bool:
+        try:
+            with self._lock:
+                self._connection().execute("SELECT 1")
+        except sqlite3.Error:
+            return False
+        return True
+
+    def reset(self) -> int | None:
+        with self._lock:
+            return self._connection().execute("DELETE FROM rate_limit_counters").rowcount
+
+    def clear(self, key: str) -> None:
+        with self._lock:
+            self._connection().execute("DELETE FROM rate_limit_counters WHERE key = ?", (key,))
+
+    def _sliding_window(
+        self, conn: sqlite3.Connection, key: str, expiry: int, now: float
+    ) -> tuple[str, tuple[int, float, int, float]]:
+        """Current window's key plus (previous count, previous TTL, current count, current TTL)."""
+        previous_key, current_key = self.sliding_window_keys(key, expiry, now)
+        previous_count = self._get(conn, previous_key, now)
+        current_count = self._get(conn, current_key, now)
+        previous_ttl = 0.0 if previous_count == 0 else (1 - ((now - expiry) / expiry) % 1) * expiry
+        current_ttl = (1 - (now / expiry) % 1) * expiry + expiry
+        return current_key, (previous_count, previous_ttl, current_count, current_ttl)
+
+    def acquire_sliding_window_entry(
+        self, key: str, limit: int, expiry: int, amount: int = 1
+    ) -> bool:
+        if amount > limit:
+            return False
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Read the clock once the write lock is held — BEGIN may
+                # have waited on another process.
+                now = time.time()
+                current_key, window = self._sliding_window(conn, key, expiry, now)
+                previous_count, previous_ttl, current_count, _ = window
+                weighted_count = previous_count * previous_ttl / expiry + current_count
+                acquired = floor(weighted_count) + amount <= limit
+                if acquired:
+                    # The current window's counter must outlive the next
+                    # window, where it becomes the "previous" count.
+                    self._incr(conn, current_key, 2 * expiry, amount)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return acquired
+
+    def get_sliding_window(self, key: str, expiry: int) -> tuple[int, float, int, float]:
+        with self._lock:
+            _, window = self._sliding_window(self._connection(), key, expiry, time.time())
+        return window
+
+    def clear_sliding_window(self, key: str, expiry: int) -> None:
+        previous_key, current_key = self.sliding_window_keys(key, expiry, time.time())
+        self.clear(previous_key)
+        self.clear(current_key)
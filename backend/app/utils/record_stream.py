@@ -0,0 +1,103 @@
+"""Incremental CSV / NDJSON parsing over a streamed request body.
+
+Bulk uploads can be tens of megabytes, so the body is parsed chunk by
+chunk as it arrives rather than read into memory first. Each record comes
+out as `(row, fields)`, where `row` is its 1-based position among the data
+records (the CSV header isn't counted), or `(row, error)` when that one
+record can't be parsed — a bad line shouldn't sink the whole upload.
+
+Problems with the upload as a whole (not UTF-8, CSV header missing
+required columns) raise `RecordFormatError` instead.
+
+**CSV records spanning lines:** a quoted field may contain newlines. CSV
+escapes a literal quote by doubling it, so a complete record always holds
+an even number of `"` characters; lines are buffered until the count is
+even, then parsed as one record.
+"""
+
+import codecs
+import csv
+from collections.abc import AsyncIterable, AsyncIterator, Collection
+from typing import Any
+
+import orjson
+
+# (row, fields) for a parsed record, or (row, error message).
+Record = tuple[int, dict[str, Any] | str]
+
+
+class RecordFormatError(ValueError):
+    """The upload can't be parsed at all (encoding, CSV header)."""
+
+
+async def _iter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[str]:
+    """Decode UTF-8 (an Excel BOM is dropped) and split on newlines."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    try:
+        async for chunk in chunks:
+            pending += decoder.decode(chunk)
+            *lines, pending = pending.split("\n")
+            for line in lines:
+                yield line
+        pending += decoder.decode(b"", final=True)
+    except UnicodeDecodeError as exc:
+        raise RecordFormatError(f"Body is not valid UTF-8: {exc.reason}") from exc
+    if pending:
+        yield pending
+
+
+async def iter_csv_records(
+    chunks: AsyncIterable[bytes],
+    required_columns: Collection[str] = (),
+) -> AsyncIterator[Record]:
+    """CSV with a header row; each record becomes `{column: value}`."""
+    header: list[str] | None = None
+    buffer: list[str] = []
+    quotes = 0
+    row = 0
+
+    async for line in _iter_lines(chunks):
+        buffer.append(line)
+        quotes += line.count('"')
+        if quotes % 2:
+            continue  # inside a quoted field that continues on the next line
+        text = "\n".join(buffer)
+        buffer, quotes = [], 0
+        if not text.strip():
+            continue
+
+        values = next(csv.reader([text]))
+        if header is None:
+            header = [column.strip() for column in values]
+            missing = [column for column in required_columns if column not in header]
+            if missing:
+                raise RecordFormatError(f"CSV header is missing columns: {', '.join(missing)}")
+            continue
+
+        row += 1
+        if len(values) != len(header):
+            yield row, f"expected {len(header)} columns, got {len(values)}"
+        else:
+            yield row, dict(zip(header, values, strict=True))
+
+    if buffer:
+        yield row + 1, "unterminated quoted field"
+
+
+async def iter_ndjson_records(chunks: AsyncIterable[bytes]) -> AsyncIterator[Record]:
+    """Newline-delimited JSON: one object per line, blank lines ignored."""
+    row = 0
+    async for line in _iter_lines(chunks):
+        if not line.strip():
+            continue
+        row += 1
+        try:
+            value = orjson.loads(line)
+        except orjson.JSONDecodeError as exc:
+            yield row, f"invalid JSON: {exc.msg}"
+            continue
+        if isinstance(value, dict):
+            yield row, value
+        else:
+            yield row, "expected a JSON object"
@@ -0,0 +1,100 @@
+"""Read-replica health tracking — decides whether reads may go to the replica.
+
+A replica can be down, or up but behind: streaming replication replays
+the primary's WAL asynchronously, so a just-updated price may not be on
+the replica yet. `ReplicaMonitor` probes the replica at most once per
+`check_interval` and caches the verdict, so routing a request costs no
+extra query. When the probe fails, times out, or reports lag past
+`max_lag_seconds`, reads fall back to the primary until a later probe
+passes.
+
+**Measuring lag:** `now() - pg_last_xact_replay_timestamp()` alone grows
+while the primary is idle (nothing new to replay), so a caught-up replica
+(received WAL == replayed WAL) counts as zero lag. A server that isn't in
+recovery at all — e.g. a second standalone Postgres in local testing — is
+treated as fully caught up.
+
+**Read-your-writes:** after this process writes to the primary,
+`record_write()` keeps reads on the primary for `max_lag_seconds` — long
+enough for any replica we'd accept to have replayed the write. Otherwise
+the catalog cache, just cleared by the write, could refill from a replica
+that hasn't seen it yet and serve the old data for a full cache TTL.
+"""
+
+import asyncio
+import logging
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+_LAG_SQL = text(
+    """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+    """
+)
+
+
+class ReplicaMonitor:
+    """Cached replica health verdict for one replica engine."""
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        *,
+        max_lag_seconds: float,
+        check_interval: float,
+        check_timeout: float,
+    ) -> None:
+        self.engine = engine
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval = check_interval
+        self.check_timeout = check_timeout
+        self.healthy = False
+        self.lag_seconds: float | None = None
+        self.last_error: str | None = None
+        self._checked_at: float | None = None
+        self._primary_until = 0.0
+
+    async def _measure_lag(self) -> float:
+        async with self.engine.connect() as conn:
+            return float((await conn.execute(_LAG_SQL)).scalar_one())
+
+    async def check(self) -> bool:
+        """Probe the replica now and update the cached verdict."""
+        try:
+            lag = await asyncio.wait_for(self._measure_lag(), timeout=self.check_timeout)
+        except Exception as exc:  # any failure means "don't route here"
+            self.healthy, self.lag_seconds = False, None
+            self.last_error = f"{type(exc).__name__}: {exc}"
+        else:
+            self.lag_seconds, self.last_error = lag, None
+            self.healthy = lag <= self.max_lag_seconds
+            if not self.healthy:
+                self.last_error = f"lag {lag:.1f}s exceeds {self.max_lag_seconds}s"
+        self._checked_at = time.monotonic()
+
+        if not self.healthy:
+            logger.warning("Read replica unavailable, using primary: %s", self.last_error)
+        return self.healthy
+
+    def record_write(self) -> None:
+        """Send reads to the primary until the replica must have caught up."""
+        self._primary_until = time.monotonic() + self.max_lag_seconds
+
+    async def use_replica(self) -> bool:
+        """Cached verdict, re-probing once it's older than `check_interval`."""
+        now = time.monotonic()
+        if now < self._primary_until:
+            return False
+        if self._checked_at is None or now - self._checked_at >= self.check_interval:
+            # Stamp before awaiting, so concurrent requests don't all probe at once.
+            self._checked_at = now
+            await self.check()
+        return self.healthy
@@ -0,0 +1,152 @@
+"""Per-request timing: SQL query count, DB time and total time.
+
+When a page is slow, the first question is whether the time went to the
+database or to our own code (validation, serialization, Python in
+between). With `request_timing_enabled`, every response answers it:
+
+    Server-Timing: db;dur=12.4;desc="3 queries", app;dur=4.1, total;dur=16.5
+
+Browser dev tools show `Server-Timing` in the network panel, and each
+request also gets one log line with the same numbers (see
+`request_timing_log_min_ms` to log only slow ones).
+
+**How DB time is collected:** `install_query_hooks` adds SQLAlchemy
+`before_cursor_execute` / `after_cursor_execute` listeners to an engine.
+The middleware puts a fresh `RequestTiming` into a context variable for
+each request; the listeners add each statement's duration to whichever
+`RequestTiming` is current. Context variables follow the request through
+`await`s and into SQLAlchemy's greenlets, so concurrent requests never
+mix their numbers. Statements outside any request (startup, background
+health checks) find no `RequestTiming` and are ignored.
+
+DB time is measured around the driver call: it includes the network
+round trip and Postgres' execution, but not waiting for a pool
+connection. `app` is everything else up to the response headers.
+
+**Cost:** when disabled, neither the middleware nor the listeners are
+installed, so there is nothing to pay. When enabled, it's two
+`perf_counter()` calls per statement and one header per response.
+"""
+
+import logging
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RequestTiming:
+    """What one request spent in the database so far."""
+
+    queries: int = 0
+    db_ms: float = 0.0
+
+
+_current_timing: ContextVar[RequestTiming | None] = ContextVar("request_timing", default=None)
+
+
+def _before_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    if _current_timing.get() is not None:
+        # One execution context per statement, so a statement that fails
+        # (no after_cursor_execute) leaves nothing behind.
+        context._request_timing_start = time.perf_counter()
+
+
+def _after_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    timing = _current_timing.get()
+    start = getattr(context, "_request_timing_start", None)
+    if timing is None or start is None:
+        return
+    timing.queries += 1
+    timing.db_ms += (time.perf_counter() - start) * 1000
+
+
+def install_query_hooks(engine: AsyncEngine) -> None:
+    """Count and time every statement `engine` runs inside a timed request."""
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def remove_query_hooks(engine: AsyncEngine) -> None:
+    """Undo `install_query_hooks`."""
+    event.remove(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.remove(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def server_timing_header(timing: RequestTiming, total_ms: float) -> str:
+    """`Server-Timing` value with db, app (the rest) and total durations."""
+    app_ms = max(total_ms - timing.db_ms, 0.0)
+    plural = "query" if timing.queries == 1 else "queries"
+    return (
+        f'db;dur={timing.db_ms:.1f};desc="{timing.queries} {plural}", '
+        f"app;dur={app_ms:.1f}, total;dur={total_ms:.1f}"
+    )
+
+
+class RequestTimingMiddleware:
+    """Adds `Server-Timing` to every HTTP response and logs the numbers.
+
+    A plain ASGI middleware rather than `BaseHTTPMiddleware`, which would
+    run each request through an extra task and memory stream. Timing
+    stops when the response headers go out, since the header has to be
+    among them; for the JSON responses this API sends, that's after the
+    body is serialized.
+    """
+
+    def __init__(self, app: ASGIApp, *, log_min_ms: float = 0.0) -> None:
+        self.app = app
+        self.log_min_ms = log_min_ms
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timing = RequestTiming()
+        token = _current_timing.set(timing)
+        start = time.perf_counter()
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                total_ms = (time.perf_counter() - start) * 1000
+                header = server_timing_header(timing, total_ms)
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (b"server-timing", header.encode("latin-1")),
+                ]
+                if total_ms >= self.log_min_ms:
+                    self._log(scope, message["status"], timing, total_ms)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current_timing.reset(token)
+
+    @staticmethod
+    def _log(scope: Scope, status: int, timing: RequestTiming, total_ms: float) -> None:
+        fields = {
+            "method": scope["method"],
+            "path": scope["path"],
+            "status": status,
+            "total_ms": round(total_ms, 2),
+            "db_ms": round(timing.db_ms, 2),
+            "queries": timing.queries,
+        }
+        logger.info(
+            "request method=%(method)s path=%(path)s status=%(status)d "
+            "total_ms=%(total_ms).1f db_ms=%(db_ms).1f queries=%(queries)d",
+            fields,
+            extra={"request_timing": fields},
+        )
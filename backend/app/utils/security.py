@@ -17,28 +17,61 @@ JSON Web Tokens encode a payload (claims) into a signed string.
 - HS256: HMAC-SHA256 signing. Symmetric key — the same secret signs and verifies.
   Good enough for a single backend. Use RS256 (asymmetric) if multiple services need to verify.
 
+**bcrypt off the event loop:**
+A bcrypt check burns ~250ms of CPU by design. Called directly from an
+async route, that's 250ms during which the event loop serves nobody —
+every concurrent storefront request stalls behind the login. The async
+routes use `hash_password_async` / `verify_password_async`, which run
+bcrypt in a small dedicated thread pool (bcrypt releases the GIL while
+hashing). A semaphore caps how many run at once; a login that can't get
+a slot within the queue timeout raises `PasswordHasherBusyError`.
+The sync versions remain for scripts and tests.
+
 We use PyJWT (not python-jose). python-jose is unmaintained since 2022 and has
 known CVEs. PyJWT has the same encode/decode API, is actively maintained, and
 doesn't pull in unnecessary crypto dependencies for HS256.
 """
 
+import asyncio
+import weakref
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
+from typing import TypeVar
 
 import bcrypt
 import jwt
 
 from app.config import settings
 
+T = TypeVar("T")
+
+# One thread per slot, so a caller holding a slot never waits for a thread.
+_bcrypt_executor = ThreadPoolExecutor(
+    max_workers=max(1, settings.password_hash_max_concurrency),
+    thread_name_prefix="bcrypt",
+)
+
+# asyncio primitives belong to one event loop, so each loop gets its own.
+_bcrypt_slots: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+class PasswordHasherBusyError(Exception):
+    """No bcrypt slot freed up within `password_hash_queue_timeout_seconds`."""
+
 
 def hash_password(password: str) -> str:
     """Hash a plaintext password using bcrypt.
 
     `bcrypt.gensalt()` generates a random salt. The salt is embedded
     in the returned hash string, so you don't need to store it separately.
-    The default work factor (rounds=12) is a good balance of security vs speed.
+    The work factor comes from `password_hash_rounds` (default 12, a good
+    balance of security vs speed).
     """
     password_bytes = password.encode("utf-8")
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=settings.password_hash_rounds)
     hashed = bcrypt.hashpw(password_bytes, salt)
     return hashed.decode("utf-8")
 
@@ -56,6 +89,45 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     )
 
 
+async def _run_bcrypt(func: Callable[..., T], *args: str) -> T:
+    """Run a bcrypt call in the dedicated pool, waiting at most the queue timeout for a slot."""
+    loop = asyncio.get_running_loop()
+    slots = _bcrypt_slots.get(loop)
+    if slots is None:
+        slots = _bcrypt_slots[loop] = asyncio.Semaphore(
+            max(1, settings.password_hash_max_concurrency)
+        )
+
+    try:
+        await asyncio.wait_for(
+            slots.acquire(), timeout=settings.password_hash_queue_timeout_seconds
+        )
+    except TimeoutError:
+        raise PasswordHasherBusyError from None
+    try:
+        return await loop.run_in_executor(_bcrypt_executor, func, *args)
+    finally:
+        slots.release()
+
+
+async def hash_password_async(password: str) -> str:
+    """`hash_password` without blocking the event loop.
+
+    Raises:
+        PasswordHasherBusyError: If the pool stays saturated past the queue timeout.
+    """
+    return await _run_bcrypt(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """`verify_password` without blocking the event loop.
+
+    Raises:
+        PasswordHasherBusyError: If the pool stays saturated past the queue timeout.
+    """
+    return await _run_bcrypt(verify_password, plain_password, hashed_password)
+
+
 def create_access_token(subject: str, expires_delta: timedelta | None = None) -> str:
     """Create a signed JWT access token.
 
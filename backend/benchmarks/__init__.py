@@ -0,0 +1,11 @@
+"""HTTP benchmark suite — throughput and latency percentiles per scenario.
+
+Run from the backend directory (see `benchmarks/run.py` for all options):
+    python -m benchmarks.run --prepare 100000          # build the bench DB first
+    python -m benchmarks.run --mode both --output results.json
+    python -m benchmarks.run --compare old.json        # fail on p95 regressions
+
+Unlike `scripts/bench_*.py`, which time one service call in isolation,
+these drive the full HTTP stack the way clients do, either in-process
+(httpx ASGI transport, like the tests) or against a real uvicorn worker.
+"""
@@ -0,0 +1,356 @@
+"""Run the HTTP benchmark scenarios and report latency percentiles.
+
+Run from the backend directory:
+    python -m benchmarks.run --prepare 100000           # (re)build the bench DB
+    python -m benchmarks.run                            # every scenario, both modes
+    python -m benchmarks.run --mode uvicorn --scenarios search,product_detail
+    python -m benchmarks.run --output after.json --compare before.json
+
+Each scenario runs for `--warmup` seconds unrecorded, then `--duration`
+seconds recorded, with `--concurrency` closed-loop clients: each sends a
+request, waits for the response, and immediately sends the next. Modes:
+
+- `inprocess`: the app through httpx's ASGI transport, as the tests do.
+  No sockets or HTTP parsing, so it isolates our own code (routing,
+  validation, queries, serialization).
+- `uvicorn`: a real uvicorn worker in a subprocess (`benchmarks/server.py`)
+  over localhost TCP, i.e. what production serves, minus the network.
+
+Results (requests, errors, req/s and p50/p95/p99/mean/max in ms per
+scenario and mode, plus the git commit and settings) are printed and, with
+`--output`, written as JSON. `--compare` loads an earlier JSON and exits
+non-zero if any p95 grew by more than `--threshold`, so two commits can be
+compared like this:
+
+    git checkout main    && python -m benchmarks.run --output main.json
+    git checkout feature && python -m benchmarks.run --compare main.json
+
+Run both on the same machine with nothing else busy: the numbers are
+only comparable with each other, not across hosts.
+
+Everything runs against the throwaway `wisteria_bench` database (see
+scripts/bench_search.py) unless `--database-url` says otherwise.
+"""
+
+import argparse
+import asyncio
+import os
+import platform
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import httpx
+import orjson
+
+from app.config import settings
+from benchmarks.scenarios import SCENARIOS, Fixtures, Recorder, load_fixtures
+
+# `app.database` creates its engine from `settings.database_url` at import
+# time, so every other app module is imported inside the functions below,
+# after `main()` has pointed the settings at the bench database.
+
+MODES = ("inprocess", "uvicorn")
+SERVER_START_TIMEOUT = 30.0  # seconds to wait for uvicorn to answer /health/live
+BENCH_SLUG_PREFIX = "bench-crud-"  # products created by the admin_crud scenario
+
+
+def _default_database_url() -> str:
+    # Same as scripts/bench_search.py's `bench_url()`, which can't be
+    # imported yet: that module imports `app.database`.
+    return settings.test_database_url.rsplit("/", 1)[0] + "/wisteria_bench"
+
+
+async def _prepare(products: int, seed: int) -> None:
+    """Recreate the bench DB and fill it with `seed.py --scale` data."""
+    from sqlalchemy import text
+
+    from app.database import engine
+    from app.models.base import Base
+    from scripts.bench_search import recreate_bench_db
+    from scripts.seed import seed_scale
+
+    recreate_bench_db()
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        await conn.run_sync(Base.metadata.create_all)
+    await seed_scale(products, 0, seed, 0.85, truncate=False)
+
+
+async def _catalog_size() -> int:
+    from sqlalchemy import text
+
+    from app.database import engine
+
+    async with engine.connect() as conn:
+        return (await conn.execute(text("SELECT count(*) FROM products"))).scalar_one()
+
+
+async def _delete_bench_products() -> None:
+    """Remove what admin_crud created, so every run and mode starts alike.
+
+    Clients replay the same slugs (fixed seeds), so leftovers would 409.
+    """
+    from sqlalchemy import text
+
+    from app.database import engine
+
+    async with engine.begin() as conn:
+        await conn.execute(
+            text("DELETE FROM products WHERE slug LIKE :prefix"),
+            {"prefix": f"{BENCH_SLUG_PREFIX}%"},
+        )
+
+
+def _summarize(rec: Recorder, duration: float) -> dict[str, Any]:
+    latencies = sorted(rec.latencies_ms)
+    ok = sum(count for code, count in rec.statuses.items() if code < 400)
+    summary: dict[str, Any] = {
+        "requests": len(latencies),
+        "errors": len(latencies) - ok + rec.transport_errors,
+        "statuses": {str(code): count for code, count in sorted(rec.statuses.items())},
+        "throughput_rps": round(len(latencies) / duration, 1),
+    }
+    if len(latencies) >= 2:
+        cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+        summary |= {
+            "p50_ms": round(cuts[49], 2),
+            "p95_ms": round(cuts[94], 2),
+            "p99_ms": round(cuts[98], 2),
+            "mean_ms": round(statistics.fmean(latencies), 2),
+            "max_ms": round(latencies[-1], 2),
+        }
+    return summary
+
+
+async def _run_scenario(
+    client: httpx.AsyncClient,
+    name: str,
+    fixtures: Fixtures,
+    args: argparse.Namespace,
+) -> dict[str, Any]:
+    step = SCENARIOS[name]
+    rec = Recorder(recording=False)
+    deadline = time.perf_counter() + args.warmup + args.duration
+
+    async def client_loop(worker: int) -> None:
+        rng = random.Random(f"{args.seed}-{name}-{worker}")
+        state: dict[str, Any] = {}
+        while time.perf_counter() < deadline:
+            try:
+                await step(client, rec, fixtures, rng, state)
+            except httpx.TransportError:
+                await asyncio.sleep(0.01)  # counted by the recorder; don't spin
+
+    workers = [asyncio.create_task(client_loop(i)) for i in range(args.concurrency)]
+    await asyncio.sleep(args.warmup)
+    rec.recording = True
+    started = time.perf_counter()
+    await asyncio.gather(*workers)
+    return _summarize(rec, time.perf_counter() - started)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _start_server(database_url: str) -> tuple[subprocess.Popen[bytes], str]:
+    port = _free_port()
+    env = {**os.environ, "DATABASE_URL": database_url, "SECRET_KEY": settings.secret_key}
+    process = subprocess.Popen(
+        [sys.executable, "-m", "benchmarks.server", "--port", str(port)],
+        cwd=Path(__file__).resolve().parent.parent,
+        env=env,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    deadline = time.perf_counter() + SERVER_START_TIMEOUT
+    async with httpx.AsyncClient(base_url=base_url) as probe:
+        while time.perf_counter() < deadline:
+            if process.poll() is not None:
+                raise SystemExit(f"uvicorn exited with code {process.returncode}")
+            try:
+                if (await probe.get(f"{settings.api_v1_prefix}/health/live")).is_success:
+                    return process, base_url
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.2)
+    process.terminate()
+    raise SystemExit(f"uvicorn didn't answer within {SERVER_START_TIMEOUT:.0f}s")
+
+
+async def _run_mode(mode: str, args: argparse.Namespace) -> dict[str, dict[str, Any]]:
+    limits = httpx.Limits(max_connections=args.concurrency)
+    timeout = httpx.Timeout(30.0)
+    server = None
+    if mode == "inprocess":
+        from app.main import app
+        from app.rate_limit import limiter
+
+        limiter.enabled = False  # the admin scenarios log in far more than 5/minute
+        client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url=f"http://bench{settings.api_v1_prefix}",
+            timeout=timeout,
+        )
+    else:
+        server, base_url = await _start_server(settings.database_url)
+        client = httpx.AsyncClient(
+            base_url=f"{base_url}{settings.api_v1_prefix}", limits=limits, timeout=timeout
+        )
+
+    results: dict[str, dict[str, Any]] = {}
+    try:
+        async with client:
+            fixtures = await load_fixtures(client)
+            for name in args.scenarios:
+                print(f"  {mode:<9}  {name:<16}", end="  ", flush=True)
+                results[name] = await _run_scenario(client, name, fixtures, args)
+                _print_row(results[name])
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+        await _delete_bench_products()
+    return results
+
+
+def _print_row(summary: dict[str, Any]) -> None:
+    print(
+        f"{summary['requests']:>7,}  {summary['errors']:>6,}  {summary['throughput_rps']:>8,.1f}"
+        + "".join(
+            f"  {summary.get(key, float('nan')):>8.1f}"
+            for key in ("p50_ms", "p95_ms", "p99_ms", "max_ms")
+        )
+    )
+
+
+def _git_commit() -> str | None:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return f"{commit}-dirty" if dirty else commit
+
+
+def _compare(current: dict[str, Any], baseline: dict[str, Any], threshold: float) -> bool:
+    """Print p95 and throughput deltas; True if any p95 regressed past `threshold`."""
+    regressed = False
+    print(f"\nCompared with {baseline['meta'].get('commit')} (threshold +{threshold:.0%} p95):")
+    for mode, scenarios in current["results"].items():
+        for name, now in scenarios.items():
+            before = baseline["results"].get(mode, {}).get(name)
+            if not before or "p95_ms" not in before or "p95_ms" not in now:
+                continue
+            p95_change = now["p95_ms"] / before["p95_ms"] - 1
+            rps_change = now["throughput_rps"] / max(before["throughput_rps"], 0.1) - 1
+            flag = "REGRESSION" if p95_change > threshold else ""
+            regressed = regressed or bool(flag)
+            print(
+                f"  {mode:<9}  {name:<16}  p95 {before['p95_ms']:>8.1f} -> {now['p95_ms']:>8.1f}"
+                f" ({p95_change:+6.1%})  req/s {rps_change:+6.1%}  {flag}"
+            )
+    return regressed
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    if args.prepare:
+        await _prepare(args.prepare, args.seed)
+    catalog_size = await _catalog_size()
+
+    print(
+        f"{catalog_size:,} products, {args.concurrency} clients, "
+        f"{args.warmup:g}s warmup + {args.duration:g}s per scenario"
+    )
+    print(
+        f"  {'mode':<9}  {'scenario':<16}  {'requests':>7}  {'errors':>6}  {'req/s':>8}"
+        f"  {'p50 ms':>8}  {'p95 ms':>8}  {'p99 ms':>8}  {'max ms':>8}"
+    )
+    results = {mode: await _run_mode(mode, args) for mode in args.modes}
+
+    from app.database import engine
+
+    await engine.dispose()
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "catalog_size": catalog_size,
+            "concurrency": args.concurrency,
+            "duration_seconds": args.duration,
+            "warmup_seconds": args.warmup,
+            "seed": args.seed,
+            "db_pool_size": settings.db_pool_size,
+            "db_max_overflow": settings.db_max_overflow,
+        },
+        "results": results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--mode", choices=[*MODES, "both"], default="both")
+    parser.add_argument(
+        "--scenarios",
+        default=",".join(SCENARIOS),
+        help=f"comma-separated subset of: {', '.join(SCENARIOS)}",
+    )
+    parser.add_argument(
+        "--duration", type=float, default=10.0, help="recorded seconds per scenario"
+    )
+    parser.add_argument("--warmup", type=float, default=2.0, help="unrecorded seconds first")
+    parser.add_argument("--concurrency", type=int, default=8, help="simultaneous clients")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--database-url", help="default: the wisteria_bench database")
+    parser.add_argument(
+        "--prepare", type=int, metavar="N", help="recreate the bench DB with N products first"
+    )
+    parser.add_argument("--output", type=Path, help="write the results as JSON")
+    parser.add_argument("--compare", type=Path, help="earlier --output JSON to compare with")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="p95 growth that fails --compare (default: 0.10 = 10%%)",
+    )
+    args = parser.parse_args()
+
+    args.modes = MODES if args.mode == "both" else (args.mode,)
+    args.scenarios = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = sorted(set(args.scenarios) - set(SCENARIOS))
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(unknown)}")
+    settings.database_url = args.database_url or _default_database_url()
+    if args.prepare and args.database_url:
+        parser.error("--prepare only rebuilds the default bench database")
+
+    report = asyncio.run(run(args))
+    if args.output:
+        args.output.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2) + b"\n")
+        print(f"\nWrote {args.output}")
+    if args.compare:
+        baseline = orjson.loads(args.compare.read_bytes())
+        if _compare(report, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""Benchmark scenarios — what each simulated client does in a loop.
+
+A scenario's `step` makes one logical user action (usually one request,
+three for admin CRUD) through `Recorder.request`, which times every
+request it sends. Steps get a per-client `random.Random` and state dict,
+so runs with the same `--seed` send the same requests.
+
+`Fixtures` are loaded once per run from the API itself: real slugs for
+product detail and an admin token. Search terms come from the
+vocabulary `scripts/seed.py --scale` names products with.
+"""
+
+import random
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+from httpx import AsyncClient, Response
+
+ADMIN_EMAIL = "admin@wisteria.com"  # created by scripts/seed.py
+ADMIN_PASSWORD = "admin123"
+
+# Mix of common single words, phrases and a miss, like real shoppers type.
+SEARCH_TERMS = [
+    "miku",
+    "nendoroid",
+    "scale figure",
+    "winter ver",
+    "acrylic stand",
+    "rem plush",
+    "zzzqx",
+]
+CATEGORIES = [None, "nendoroid", "scale_figure", "plush", "goods"]
+DEEP_PAGE_LIMIT = 100  # cursor pages walked before a client starts over
+
+
+@dataclass
+class Recorder:
+    """Latency (ms) and status code of every request in one scenario run."""
+
+    latencies_ms: list[float] = field(default_factory=list)
+    statuses: dict[int, int] = field(default_factory=dict)
+    transport_errors: int = 0  # timeouts, refused connections
+    recording: bool = True  # off during warmup
+
+    async def request(self, client: AsyncClient, method: str, url: str, **kwargs: Any) -> Response:
+        start = time.perf_counter()
+        try:
+            response = await client.request(method, url, **kwargs)
+        except httpx.TransportError:
+            if self.recording:
+                self.transport_errors += 1
+            raise
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if self.recording:
+            self.latencies_ms.append(elapsed_ms)
+            self.statuses[response.status_code] = self.statuses.get(response.status_code, 0) + 1
+        return response
+
+
+@dataclass
+class Fixtures:
+    slugs: list[str]
+    admin_headers: dict[str, str]
+
+
+async def load_fixtures(client: AsyncClient) -> Fixtures:
+    """Sample product slugs and log in once for the admin scenarios."""
+    slugs: list[str] = []
+    cursor = None
+    for _ in range(10):
+        params: dict[str, Any] = {"per_page": 100, "fields": "summary", "include_total": False}
+        if cursor:
+            params["cursor"] = cursor
+        page = (await client.get("/products", params=params)).json()
+        slugs.extend(item["slug"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    if not slugs:
+        raise SystemExit("The bench database has no products — run with --prepare N first")
+
+    login = await client.post(
+        "/auth/login", json={"email": ADMIN_EMAIL, "password": ADMIN_PASSWORD}
+    )
+    login.raise_for_status()
+    return Fixtures(
+        slugs=slugs,
+        admin_headers={"Authorization": f"Bearer {login.json()['access_token']}"},
+    )
+
+
+Step = Callable[[AsyncClient, Recorder, Fixtures, random.Random, dict[str, Any]], Awaitable[None]]
+
+
+async def catalog_browse(
+    client: AsyncClient, rec: Recorder, fx: Fixtures, rng: random.Random, state: dict[str, Any]
+) -> None:
+    """Storefront grid: one of the first pages, sometimes filtered by category."""
+    params: dict[str, Any] = {"fields": "summary", "page": rng.randint(1, 5)}
+    category = rng.choice(CATEGORIES)
+    if category:
+        params["category"] = category
+    await rec.request(client, "GET", "/products", params=params)
+
+
+async def deep_pagination(
+    client: AsyncClient, rec: Recorder, fx: Fixtures, rng: random.Random, state: dict[str, Any]
+) -> None:
+    """Follow `next_cursor` page after page, like infinite scroll or a crawler."""
+    params: dict[str, Any] = {"per_page": 50, "include_total": False}
+    if state.get("cursor"):
+        params["cursor"] = state["cursor"]
+    response = await rec.request(client, "GET", "/products", params=params)
+    state["pages"] = state.get("pages", 0) + 1
+    cursor = response.json().get("next_cursor") if response.status_code == 200 else None
+    if cursor is None or state["pages"] >= DEEP_PAGE_LIMIT:
+        cursor, state["pages"] = None, 0
+    state["cursor"] = cursor
+
+
+async def search(
+    client: AsyncClient, rec: Recorder, fx: Fixtures, rng: random.Random, state: dict[str, Any]
+) -> None:
+    """Full-text search with a mix of hits, phrases and a miss."""
+    await rec.request(client, "GET", "/products/search", params={"q": rng.choice(SEARCH_TERMS)})
+
+
+async def product_detail(
+    client: AsyncClient, rec: Recorder, fx: Fixtures, rng: random.Random, state: dict[str, Any]
+) -> None:
+    """Product page for a random known slug."""
+    await rec.request(client, "GET", f"/products/{rng.choice(fx.slugs)}")
+
+
+async def admin_login(
+    client: AsyncClient, rec: Recorder, fx: Fixtures, rng: random.Random, state: dict[str, Any]
+) -> None:
+    """Admin login — dominated by bcrypt (the rate limit is off for benchmarks)."""
+    await rec.request(
+        client, "POST", "/auth/login", json={"email": ADMIN_EMAIL, "password": ADMIN_PASSWORD}
+    )
+
+
+async def admin_crud(
+    client: AsyncClient, rec: Recorder, fx: Fixtures, rng: random.Random, state: dict[str, Any]
+) -> None:
+    """Create, edit, then soft-delete a product (three requests)."""
+    slug = f"bench-crud-{uuid.UUID(int=rng.getrandbits(128)).hex}"
+    created = await rec.request(
+        client,
+        "POST",
+        "/admin/products",
+        headers=fx.admin_headers,
+        json={
+            "name": "Benchmark Figure",
+            "slug": slug,
+            "description": "Created by the benchmark suite.",
+            "price_cents": rng.randint(500, 50_000),
+            "condition": "new",
+            "category": "goods",
+            "image_url": "https://example.com/bench.jpg",
+        },
+    )
+    if created.status_code != 201:
+        return
+    product_id = created.json()["id"]
+    await rec.request(
+        client,
+        "PUT",
+        f"/admin/products/{product_id}",
+        headers=fx.admin_headers,
+        json={"price_cents": rng.randint(500, 50_000)},
+    )
+    await rec.request(client, "DELETE", f"/admin/products/{product_id}", headers=fx.admin_headers)
+
+
+SCENARIOS: dict[str, Step] = {
+    "catalog_browse": catalog_browse,
+    "deep_pagination": deep_pagination,
+    "search": search,
+    "product_detail": product_detail,
+    "admin_login": admin_login,
+    "admin_crud": admin_crud,
+}
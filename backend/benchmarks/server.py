@@ -0,0 +1,28 @@
+"""One uvicorn worker serving the app, for `run.py --mode uvicorn`.
+
+    DATABASE_URL=... python -m benchmarks.server --port 8765
+
+The same as `uvicorn app.main:app` except that the login rate limit is
+off — the admin scenarios log in far more than 5 times a minute.
+"""
+
+import argparse
+
+import uvicorn
+
+from app.main import app
+from app.rate_limit import limiter
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    limiter.enabled = False
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
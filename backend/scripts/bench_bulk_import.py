@@ -0,0 +1,126 @@
+"""Bulk import throughput — rows/sec for `import_products` vs. one-at-a-time.
+
+Run from the backend directory:
+    python -m scripts.bench_bulk_import
+    python -m scripts.bench_bulk_import --rows 50000
+
+Generates an upload of N synthetic products as CSV and as NDJSON, then
+times `import_products` (parsing + validation + batched INSERT, the same
+service call `POST /admin/products/bulk` makes) feeding it the body in
+64 KiB chunks like a streamed request. Each format runs in both conflict
+modes, and once more with every slug already present (all conflicts).
+The one-at-a-time baseline calls `create_product` for a smaller sample.
+
+Uses the throwaway `wisteria_bench` database (see scripts/bench_search.py).
+"""
+
+import argparse
+import asyncio
+import csv
+import io
+import time
+from collections.abc import AsyncIterator
+
+import orjson
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.models.base import Base
+from app.schemas.product import ProductCreate
+from app.services.product import create_product
+from app.services.product_import import ConflictMode, import_products
+from app.utils.record_stream import iter_csv_records, iter_ndjson_records
+from scripts.bench_search import bench_url, recreate_bench_db
+
+CHUNK_SIZE = 64 * 1024
+BASELINE_ROWS = 500
+
+
+def _product(i: int) -> dict[str, object]:
+    return {
+        "name": f"Bench Figure #{i}",
+        "slug": f"bench-{i}",
+        "description": f"Synthetic product {i} for import benchmarking, boxed and complete.",
+        "price_cents": 500 + i % 50_000,
+        "condition": ("new", "like_new", "used")[i % 3],
+        "category": ("nendoroid", "scale_figure", "plush", "goods")[i % 4],
+        "image_url": f"https://example.com/bench/{i}.jpg",
+        "quantity": 1,
+    }
+
+
+def _csv_body(rows: int) -> bytes:
+    out = io.StringIO()
+    writer = csv.DictWriter(out, fieldnames=list(ProductCreate.model_fields))
+    writer.writeheader()
+    writer.writerows(_product(i) for i in range(rows))
+    return out.getvalue().encode()
+
+
+def _ndjson_body(rows: int) -> bytes:
+    return b"".join(orjson.dumps(_product(i)) + b"\n" for i in range(rows))
+
+
+async def _chunks(body: bytes) -> AsyncIterator[bytes]:
+    for start in range(0, len(body), CHUNK_SIZE):
+        yield body[start : start + CHUNK_SIZE]
+
+
+async def _truncate(session: AsyncSession) -> None:
+    await session.execute(text("TRUNCATE products CASCADE"))
+    await session.commit()
+
+
+async def _time_import(
+    session: AsyncSession, fmt: str, body: bytes, on_conflict: ConflictMode
+) -> tuple[float, str]:
+    parse = iter_csv_records if fmt == "csv" else iter_ndjson_records
+    records = parse(_chunks(body))
+    start = time.perf_counter()
+    result = await import_products(session, records, on_conflict)
+    elapsed = time.perf_counter() - start
+    return elapsed, f"ins={result.inserted} upd={result.updated} skip={result.skipped}"
+
+
+def _report(label: str, rows: int, elapsed: float, outcome: str) -> None:
+    print(f"{label:<34}  {rows:>8,}  {elapsed:>8.2f}  {rows / elapsed:>10,.0f}  {outcome}")
+
+
+async def run(rows: int) -> None:
+    recreate_bench_db()
+    engine = create_async_engine(bench_url())
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        await conn.run_sync(Base.metadata.create_all)
+
+    bodies = {"csv": _csv_body(rows), "ndjson": _ndjson_body(rows)}
+    print(f"{'scenario':<34}  {'rows':>8}  {'seconds':>8}  {'rows/sec':>10}  outcome")
+    async with session_factory() as session:
+        await _truncate(session)
+        start = time.perf_counter()
+        for i in range(BASELINE_ROWS):
+            await create_product(session, ProductCreate.model_validate(_product(i)))
+        _report("create_product one at a time", BASELINE_ROWS, time.perf_counter() - start, "")
+
+        for fmt, body in bodies.items():
+            for on_conflict in ("skip", "update"):
+                await _truncate(session)
+                elapsed, outcome = await _time_import(session, fmt, body, on_conflict)
+                _report(f"{fmt} on_conflict={on_conflict}", rows, elapsed, outcome)
+                # Same upload again: every slug now conflicts.
+                elapsed, outcome = await _time_import(session, fmt, body, on_conflict)
+                _report(f"{fmt} on_conflict={on_conflict} (re-run)", rows, elapsed, outcome)
+
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--rows", type=int, default=20_000)
+    args = parser.parse_args()
+    asyncio.run(run(args.rows))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""Checkout latency — one batched lookup vs. one query per cart item.
+
+Run from the backend directory:
+    python -m scripts.bench_checkout
+    python -m scripts.bench_checkout --carts 1 10 100 --repeats 300 --stripe-latency-ms 0
+
+Fills the throwaway `wisteria_bench` database (see scripts/bench_search.py)
+with synthetic products, then creates checkout sessions for 1-, 10- and
+100-item carts two ways:
+
+- `batched`: `create_checkout_session`, as POST /checkout/create-session
+  runs it — one `WHERE id = ANY(:ids)` query per cart, plus the
+  reservation (one statement for the whole cart, and its lock_timeout).
+- `per-item`: the straightforward version — `session.get()` and an
+  availability check for each item in turn, then the same line items.
+
+Stripe is replaced by a local stub that records the request (optionally
+sleeping `--stripe-latency-ms` to mimic the real round trip), so only our
+side is measured. Queries per checkout are counted with a cursor listener.
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from collections.abc import Callable, Coroutine, Sequence
+from types import SimpleNamespace
+from typing import Any
+
+from sqlalchemy import event, select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.models.base import Base
+from app.models.product import Product
+from app.schemas.order import CheckoutLineItem, CheckoutResponse
+from app.services.checkout import (
+    CheckoutItemsError,
+    build_line_items,
+    create_checkout_session,
+    product_ids_metadata,
+)
+from scripts.bench_search import FILL_SQL, bench_url, recreate_bench_db
+
+CATALOG_SIZE = 100_000
+
+
+class StubStripeClient:
+    """Just enough of `stripe.StripeClient` for checkout, without the network."""
+
+    def __init__(self, latency_ms: float) -> None:
+        self.latency = latency_ms / 1000
+        self.checkout = SimpleNamespace(sessions=self)
+
+    async def create_async(self, params: dict[str, Any]) -> SimpleNamespace:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return SimpleNamespace(id="cs_bench", url="https://checkout.stripe.test/cs_bench")
+
+
+async def per_item_checkout(
+    session: AsyncSession, items: Sequence[CheckoutLineItem], stripe_client: Any
+) -> CheckoutResponse:
+    """The baseline: one primary-key lookup per item."""
+    products = []
+    for item in items:
+        product = await session.get(Product, item.product_id)
+        if product is None or not product.is_available:
+            raise CheckoutItemsError([], [item.product_id], [])
+        products.append(product)
+    params = {
+        "mode": "payment",
+        "line_items": build_line_items(products),
+        "metadata": product_ids_metadata([product.id for product in products]),
+    }
+    await session.rollback()  # after reading: rollback expires the instances
+    checkout = await stripe_client.checkout.sessions.create_async(params=params)
+    return CheckoutResponse(checkout_url=checkout.url, session_id=checkout.id)
+
+
+Checkout = Callable[
+    [AsyncSession, Sequence[CheckoutLineItem], Any], Coroutine[Any, Any, CheckoutResponse]
+]
+
+
+async def _time(
+    session_factory: async_sessionmaker[AsyncSession],
+    checkout: Checkout,
+    carts: list[list[CheckoutLineItem]],
+    stripe_client: StubStripeClient,
+) -> list[float]:
+    timings = []
+    for cart in carts:
+        async with session_factory() as session:
+            start = time.perf_counter()
+            await checkout(session, cart, stripe_client)
+            timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+async def run(cart_sizes: list[int], repeats: int, stripe_latency_ms: float) -> None:
+    recreate_bench_db()
+    engine = create_async_engine(bench_url())
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        await conn.run_sync(Base.metadata.create_all)
+        for statement in FILL_SQL.split(";"):
+            if statement.strip():
+                await conn.execute(text(statement), {"n": CATALOG_SIZE})
+        # Enough stock that repeated carts never run out of units to reserve.
+        await conn.execute(update(Product).values(quantity=1_000_000))
+        await conn.execute(text("ANALYZE products"))
+        result = await conn.execute(select(Product.id).where(Product.is_available).limit(10_000))
+        available = [row.id for row in result]
+
+    queries = 0
+
+    def count(*_args: Any) -> None:
+        nonlocal queries
+        queries += 1
+
+    event.listen(engine.sync_engine, "before_cursor_execute", count)
+    stripe_client = StubStripeClient(stripe_latency_ms)
+    rng = random.Random(42)
+    checkouts: dict[str, Checkout] = {
+        "batched": create_checkout_session,
+        "per-item": per_item_checkout,
+    }
+
+    print(
+        f"{CATALOG_SIZE:,} products, {repeats} carts per size, stub Stripe +{stripe_latency_ms}ms"
+    )
+    print(
+        f"{'items':>5}  {'mode':<9}  {'queries':>7}  {'mean ms':>8}  {'p50 ms':>8}  {'p95 ms':>8}"
+    )
+    for size in cart_sizes:
+        carts = [
+            [CheckoutLineItem(product_id=pid) for pid in rng.sample(available, size)]
+            for _ in range(repeats)
+        ]
+        for name, checkout in checkouts.items():
+            await _time(session_factory, checkout, carts[:10], stripe_client)  # warm up
+            queries = 0
+            timings = await _time(session_factory, checkout, carts, stripe_client)
+            cuts = statistics.quantiles(timings, n=20)
+            mean, p50 = statistics.fmean(timings), statistics.median(timings)
+            print(
+                f"{size:>5}  {name:<9}  {queries / repeats:>7.0f}  {mean:>8.2f}"
+                f"  {p50:>8.2f}  {cuts[18]:>8.2f}"
+            )
+
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--carts", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--repeats", type=int, default=200)
+    parser.add_argument("--stripe-latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+    asyncio.run(run(args.carts, args.repeats, args.stripe_latency_ms))
+
+
+if __name__ == "__main__":
+    main()
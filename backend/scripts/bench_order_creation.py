@@ -0,0 +1,155 @@
+"""Order creation from a paid checkout — set-based vs. the ORM unit of work.
+
+Run from the backend directory:
+    python -m scripts.bench_order_creation
+    python -m scripts.bench_order_creation --items 1 10 100 --repeats 100
+
+Fills the throwaway `wisteria_bench` database (see scripts/bench_search.py)
+with synthetic products, then turns checkout sessions of 1, 10 and 100
+items into orders two ways:
+
+- `set-based`: `create_order_from_checkout`, as the webhook workers run
+  it — INSERT order, one UPDATE ... WHERE id = ANY for the products, one
+  INSERT ... SELECT FROM unnest for the items, whatever the size.
+- `orm`: the straightforward version — load the products FOR UPDATE,
+  add an Order with one OrderItem per product, set each
+  `is_available = False`, and let the flush write them row by row.
+
+Each order uses fresh products and a fresh reservation hold, so both
+versions do the same work. Statements per order are counted with a
+cursor listener.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+from sqlalchemy import event, select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.models.base import Base
+from app.models.order import Order, OrderItem, OrderStatus
+from app.models.product import Product
+from app.services.checkout import product_ids_from_metadata
+from app.services.order import create_order_from_checkout
+from app.services.product import product_id_in
+from app.services.reservation import consume_hold, reserve_products
+from scripts.bench_search import FILL_SQL, bench_url, recreate_bench_db
+from scripts.stripe_events import checkout_session_event
+
+CATALOG_SIZE = 100_000
+
+
+async def orm_create_order(session: AsyncSession, checkout: dict[str, Any]) -> uuid.UUID | None:
+    """The baseline: one INSERT per item and one UPDATE per product at flush."""
+    existing = await session.scalar(
+        select(Order.id).where(Order.stripe_checkout_session_id == checkout["id"])
+    )
+    if existing is not None:
+        return None
+    product_ids = product_ids_from_metadata(checkout["metadata"])
+    products = (
+        await session.scalars(
+            select(Product).where(product_id_in(product_ids)).order_by(Product.id).with_for_update()
+        )
+    ).all()
+    order = Order(
+        customer_email=checkout["customer_details"]["email"],
+        customer_name=checkout["customer_details"]["name"],
+        stripe_checkout_session_id=checkout["id"],
+        stripe_payment_intent_id=checkout["payment_intent"],
+        status=OrderStatus.PAID,
+        total_cents=checkout["amount_total"],
+        shipping_address_json=checkout["shipping_details"],
+        items=[
+            OrderItem(
+                product_id=product.id, product_name=product.name, price_cents=product.price_cents
+            )
+            for product in products
+        ],
+    )
+    session.add(order)
+    for product in products:
+        product.is_available = False
+    await consume_hold(session, uuid.UUID(checkout["client_reference_id"]))
+    await session.commit()
+    return order.id
+
+
+CreateOrder = Callable[[AsyncSession, dict[str, Any]], Coroutine[Any, Any, uuid.UUID | None]]
+
+
+async def run(sizes: list[int], repeats: int) -> None:
+    recreate_bench_db()
+    engine = create_async_engine(bench_url())
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        await conn.run_sync(Base.metadata.create_all)
+        for statement in FILL_SQL.split(";"):
+            if statement.strip():
+                await conn.execute(text(statement), {"n": CATALOG_SIZE})
+        await conn.execute(update(Product).values(is_available=True, quantity=1))
+        await conn.execute(text("ANALYZE products"))
+        result = await conn.execute(select(Product.id))
+        unused = [row.id for row in result]
+
+    statements = 0
+
+    def count(*_args: Any) -> None:
+        nonlocal statements
+        statements += 1
+
+    versions: dict[str, CreateOrder] = {
+        "set-based": create_order_from_checkout,
+        "orm": orm_create_order,
+    }
+    print(f"{CATALOG_SIZE:,} products, {repeats} orders per size and version")
+    print(
+        f"{'items':>5}  {'version':<9}  {'stmts':>5}  {'mean ms':>8}  {'p50 ms':>8}  {'p95 ms':>8}"
+    )
+    for size in sizes:
+        for name, create_order in versions.items():
+            timings = []
+            statements_per_order = 0
+            for i in range(repeats + 5):  # the first 5 warm up
+                product_ids = [unused.pop() for _ in range(size)]
+                async with session_factory() as session:
+                    hold = await reserve_products(session, product_ids)
+                checkout = checkout_session_event(product_ids=product_ids, hold_id=hold.hold_id)
+                checkout = checkout["data"]["object"]
+
+                event.listen(engine.sync_engine, "before_cursor_execute", count)
+                statements = 0
+                async with session_factory() as session:
+                    start = time.perf_counter()
+                    await create_order(session, checkout)
+                    elapsed = (time.perf_counter() - start) * 1000
+                event.remove(engine.sync_engine, "before_cursor_execute", count)
+                if i >= 5:
+                    timings.append(elapsed)
+                    statements_per_order = statements
+            cuts = statistics.quantiles(timings, n=20)
+            print(
+                f"{size:>5}  {name:<9}  {statements_per_order:>5}"
+                f"  {statistics.fmean(timings):>8.2f}"
+                f"  {statistics.median(timings):>8.2f}  {cuts[18]:>8.2f}"
+            )
+
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--items", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--repeats", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(run(args.items, args.repeats))
+
+
+if __name__ == "__main__":
+    main()
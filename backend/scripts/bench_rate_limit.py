@@ -0,0 +1,87 @@
+"""Rate-limit storage microbenchmark — per-check overhead by backend.
+
+Run from the backend directory:
+    python -m scripts.bench_rate_limit
+    python -m scripts.bench_rate_limit --checks 50000 --processes 4
+
+Times `limiter.hit()` (what slowapi calls once per rate-limited request)
+for the in-memory default and the SQLite storage, under both strategies.
+Keys rotate over 1,000 client IPs so the limit is never reached and every
+check does the full read + increment.
+
+The `xN procs` rows run the same loop in N processes at once against one
+SQLite file — the multi-worker case, where they contend for its write lock.
+"""
+
+import argparse
+import multiprocessing
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from limits import parse
+from limits.storage import storage_from_string
+from limits.strategies import (
+    FixedWindowRateLimiter,
+    RateLimiter,
+    SlidingWindowCounterRateLimiter,
+)
+
+import app.utils.rate_limit_storage  # noqa: F401 — registers sqlite://
+
+LIMIT = parse("1000000/minute")
+CLIENTS = 1_000
+STRATEGIES: dict[str, type[RateLimiter]] = {
+    "fixed-window": FixedWindowRateLimiter,
+    "sliding-window-counter": SlidingWindowCounterRateLimiter,
+}
+
+
+def _time_checks(uri: str, strategy: str, checks: int) -> list[float]:
+    """Per-check latencies in microseconds."""
+    limiter = STRATEGIES[strategy](storage_from_string(uri))
+    limiter.hit(LIMIT, "warmup")
+    samples = []
+    for i in range(checks):
+        start = time.perf_counter()
+        limiter.hit(LIMIT, "login", f"10.0.{i % CLIENTS // 256}.{i % 256}")
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    return samples
+
+
+def _report(label: str, strategy: str, samples: list[float]) -> None:
+    cuts = statistics.quantiles(samples, n=100)
+    print(
+        f"{label:<16}  {strategy:<22}  {statistics.median(samples):>8.1f}  "
+        f"{cuts[98]:>8.1f}  {len(samples) / (sum(samples) / 1_000_000):>12,.0f}"
+    )
+
+
+def run(checks: int, processes: int) -> None:
+    print(f"{'storage':<16}  {'strategy':<22}  {'p50 µs':>8}  {'p99 µs':>8}  {'checks/sec':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        sqlite_uri = f"sqlite:///{Path(tmp) / 'rate_limits.db'}"
+        for strategy in STRATEGIES:
+            _report("memory", strategy, _time_checks("memory://", strategy, checks))
+            _report("sqlite", strategy, _time_checks(sqlite_uri, strategy, checks))
+
+            ctx = multiprocessing.get_context("spawn")
+            with ctx.Pool(processes=processes) as pool:
+                per_process = pool.starmap(
+                    _time_checks, [(sqlite_uri, strategy, checks // processes)] * processes
+                )
+            samples = [sample for chunk in per_process for sample in chunk]
+            _report(f"sqlite x{processes} procs", strategy, samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--checks", type=int, default=20_000)
+    parser.add_argument("--processes", type=int, default=4)
+    args = parser.parse_args()
+    run(args.checks, args.processes)
+
+
+if __name__ == "__main__":
+    main()
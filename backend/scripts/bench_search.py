@@ -0,0 +1,158 @@
+"""Search latency benchmark — trigram GIN index vs. sequential scan.
+
+Run from the backend directory:
+    python -m scripts.bench_search                       # 10k, 100k, 1M rows
+    python -m scripts.bench_search --sizes 10000 100000  # custom sizes
+
+For each catalog size this:
+1. Fills `products` in a throwaway `wisteria_bench` database with N
+   synthetic rows via one `INSERT ... SELECT generate_series(...)`.
+2. Times `list_products(search=...)` — the same service call the
+   storefront makes — for a handful of search terms, with the count
+   cache cleared so every call pays for both the COUNT and the page query.
+3. Drops `ix_products_name_trgm` and repeats, to show the unindexed baseline.
+
+The bench DB sits next to the test DB (same server, see TEST_DATABASE_URL)
+so dev data is never touched. It's dropped and recreated on every run.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.config import settings
+from app.models.base import Base
+from app.schemas.product import ProductListParams
+from app.services.product import invalidate_product_counts, list_products
+
+BENCH_DB = "wisteria_bench"
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+SEARCH_TERMS = ["miku", "gojo", "winter ver", "nendoroid", "no such figure"]
+
+# Synthetic names like "Rem 1/7 Scale Figure Winter Ver. #48213".
+# `random()` is seeded, so every run generates the same catalog.
+FILL_SQL = """
+SELECT setseed(0.42);
+INSERT INTO products (
+    id, name, slug, description, price_cents, condition, category,
+    image_url, is_available, quantity, created_at, updated_at
+)
+SELECT
+    gen_random_uuid(),
+    (ARRAY['Hatsune Miku', 'Rem', 'Ram', 'Gojo Satoru', 'Anya Forger',
+           'Tanjiro Kamado', 'Nezuko', 'Sailor Moon', 'Asuka Langley',
+           'Rei Ayanami', 'Megumin', 'Totoro', 'Kirby', 'Frieren',
+           'Marin Kitagawa', 'Makima', 'Luffy', 'Zero Two'])[1 + floor(random() * 18)::int]
+    || ' ' ||
+    (ARRAY['Nendoroid', '1/7 Scale Figure', 'Figma', 'Plush', 'Acrylic Stand',
+           'Pop Up Parade', 'Keychain'])[1 + floor(random() * 7)::int]
+    || ' ' ||
+    (ARRAY['Standard', 'Winter Ver.', 'Racing Ver.', 'Swimsuit Ver.',
+           'Deluxe', 'Limited Edition'])[1 + floor(random() * 6)::int]
+    || ' #' || i,
+    'bench-' || i,
+    'Synthetic product for search benchmarking.',
+    500 + floor(random() * 50000)::int,
+    (ARRAY['new', 'like_new', 'used'])[1 + floor(random() * 3)::int]::productcondition,
+    (ARRAY['nendoroid', 'scale_figure', 'plush', 'goods'])[1 + floor(random() * 4)::int]
+        ::productcategory,
+    'https://example.com/bench.jpg',
+    random() < 0.8,
+    1,
+    now() - i * interval '1 second',
+    now() - i * interval '1 second'
+FROM generate_series(1, :n) AS i;
+"""
+
+CREATE_TRGM_INDEX = (
+    "CREATE INDEX IF NOT EXISTS ix_products_name_trgm " "ON products USING gin (name gin_trgm_ops)"
+)
+DROP_TRGM_INDEX = "DROP INDEX IF EXISTS ix_products_name_trgm"
+
+
+def bench_url() -> str:
+    return settings.test_database_url.rsplit("/", 1)[0] + f"/{BENCH_DB}"
+
+
+def recreate_bench_db() -> None:
+    """Drop and recreate the bench DB (sync + AUTOCOMMIT, like the test conftest)."""
+    sync_url = settings.test_database_url.replace("+asyncpg", "").rsplit("/", 1)[0] + "/postgres"
+    engine = create_engine(sync_url, isolation_level="AUTOCOMMIT")
+    with engine.connect() as conn:
+        conn.execute(text(f"DROP DATABASE IF EXISTS {BENCH_DB}"))
+        conn.execute(text(f"CREATE DATABASE {BENCH_DB}"))
+    engine.dispose()
+
+
+async def _time_searches(
+    session_factory: async_sessionmaker[AsyncSession], repeats: int
+) -> dict[str, list[float]]:
+    """Run each search term `repeats` times; return latencies in ms per term."""
+    latencies: dict[str, list[float]] = {term: [] for term in SEARCH_TERMS}
+    async with session_factory() as session:
+        for term in SEARCH_TERMS:
+            params = ProductListParams(search=term)
+            await list_products(session, params)  # warm-up: plan + buffer cache
+            for _ in range(repeats):
+                invalidate_product_counts()
+                start = time.perf_counter()
+                await list_products(session, params)
+                latencies[term].append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def _report(size: int, label: str, latencies: dict[str, list[float]]) -> None:
+    for term, samples in latencies.items():
+        p50 = statistics.median(samples)
+        p95 = statistics.quantiles(samples, n=20)[-1] if len(samples) > 1 else samples[0]
+        print(f"{size:>10,}  {label:<9}  {term:<16}  {p50:>9.2f}  {p95:>9.2f}")
+
+
+async def run(sizes: list[int], repeats: int) -> None:
+    recreate_bench_db()
+    engine = create_async_engine(bench_url())
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        await conn.run_sync(Base.metadata.create_all)
+
+    print(f"{'rows':>10}  {'index':<9}  {'term':<16}  {'p50 ms':>9}  {'p95 ms':>9}")
+    for size in sizes:
+        fill_start = time.perf_counter()
+        async with engine.begin() as conn:
+            await conn.execute(text("TRUNCATE products CASCADE"))
+            await conn.execute(text(DROP_TRGM_INDEX))
+            # asyncpg can't run multiple statements with bind params at once.
+            setseed, insert = FILL_SQL.strip().split(";", 1)
+            await conn.execute(text(setseed))
+            await conn.execute(text(insert), {"n": size})
+            await conn.execute(text(CREATE_TRGM_INDEX))
+        async with engine.connect() as conn:
+            await conn.execution_options(isolation_level="AUTOCOMMIT")
+            await conn.execute(text("VACUUM ANALYZE products"))
+        print(f"# filled {size:,} rows in {time.perf_counter() - fill_start:.1f}s")
+
+        _report(size, "trgm", await _time_searches(session_factory, repeats))
+
+        async with engine.begin() as conn:
+            await conn.execute(text(DROP_TRGM_INDEX))
+        _report(size, "none", await _time_searches(session_factory, repeats))
+
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(run(args.sizes, args.repeats))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""List serialization benchmark — rows/sec for each way of rendering a page.
+
+Run from the backend directory:
+    python -m scripts.bench_serialization                  # 10k rows, pages of 20 and 100
+    python -m scripts.bench_serialization --rows 100000 --repeats 200
+
+Each path fetches one page from the DB and turns it into JSON bytes:
+
+- `orm+fastapi`: the original route — `select(Product)` → ORM objects →
+  `model_validate` per row → FastAPI re-validates against `response_model`
+  → `jsonable_encoder` → stdlib `json.dumps`.
+- `orm+dump_json`: ORM objects → `model_validate` → `model_dump_json()`
+  (one validation pass, Rust encoder).
+- `columns+orjson`: the current route — `list_products` column rows →
+  dicts → orjson. No ORM objects, no Pydantic models.
+
+Uses the same throwaway `wisteria_bench` database as `bench_search`
+(dropped and recreated on every run). Counting is skipped
+(`include_total=false`) so only fetch + serialization is measured.
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import Select, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.models.base import Base
+from app.models.product import Product
+from app.schemas.product import PaginatedProductResponse, ProductListParams, ProductResponse
+from app.services.product import PRODUCT_RESPONSE_FIELDS, list_products
+from app.utils.serialization import dumps, rows_to_dicts
+from scripts.bench_search import FILL_SQL, bench_url, recreate_bench_db
+
+DEFAULT_PAGE_SIZES = [20, 100]
+
+Renderer = Callable[[AsyncSession, int], Awaitable[bytes]]
+
+
+def _orm_page(per_page: int) -> Select[tuple[Product]]:
+    return (
+        select(Product)
+        .where(Product.is_available.is_(True))
+        .order_by(Product.created_at.desc(), Product.id.desc())
+        .limit(per_page + 1)
+    )
+
+
+def _page(items: list[ProductResponse], per_page: int) -> PaginatedProductResponse:
+    return PaginatedProductResponse(
+        items=items, total=None, page=1, per_page=per_page, pages=None, next_cursor=None
+    )
+
+
+async def render_orm_fastapi(session: AsyncSession, per_page: int) -> bytes:
+    products = (await session.execute(_orm_page(per_page))).scalars().all()[:per_page]
+    page = _page([ProductResponse.model_validate(p) for p in products], per_page)
+    # What FastAPI does with a returned model and a `response_model`:
+    # validate again, convert to JSON-able primitives, then `JSONResponse.render`.
+    revalidated = PaginatedProductResponse.model_validate(page.model_dump())
+    return json.dumps(
+        jsonable_encoder(revalidated),
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+async def render_orm_dump_json(session: AsyncSession, per_page: int) -> bytes:
+    products = (await session.execute(_orm_page(per_page))).scalars().all()[:per_page]
+    page = _page([ProductResponse.model_validate(p) for p in products], per_page)
+    return page.model_dump_json().encode("utf-8")
+
+
+async def render_columns_orjson(session: AsyncSession, per_page: int) -> bytes:
+    params = ProductListParams(per_page=per_page, include_total=False)
+    rows, total, next_cursor = await list_products(session, params)
+    return dumps(
+        {
+            "items": rows_to_dicts(PRODUCT_RESPONSE_FIELDS, rows),
+            "total": total,
+            "page": 1,
+            "per_page": per_page,
+            "pages": None,
+            "next_cursor": next_cursor,
+        }
+    )
+
+
+RENDERERS: dict[str, Renderer] = {
+    "orm+fastapi": render_orm_fastapi,
+    "orm+dump_json": render_orm_dump_json,
+    "columns+orjson": render_columns_orjson,
+}
+
+
+async def _time_renderer(
+    session_factory: async_sessionmaker[AsyncSession],
+    render: Renderer,
+    per_page: int,
+    repeats: int,
+) -> list[float]:
+    """Render one page `repeats` times; return latencies in ms.
+
+    A fresh session per call, as in a request — otherwise the identity map
+    would hand back already-built ORM objects and hide the hydration cost.
+    """
+    async with session_factory() as session:
+        await render(session, per_page)  # warm-up: plan + buffer cache
+    samples = []
+    for _ in range(repeats):
+        async with session_factory() as session:
+            start = time.perf_counter()
+            await render(session, per_page)
+            samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+async def run(rows: int, page_sizes: list[int], repeats: int) -> None:
+    recreate_bench_db()
+    engine = create_async_engine(bench_url())
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        await conn.run_sync(Base.metadata.create_all)
+        setseed, insert = FILL_SQL.strip().split(";", 1)
+        await conn.execute(text(setseed))
+        await conn.execute(text(insert), {"n": rows})
+    async with engine.connect() as conn:
+        await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text("VACUUM ANALYZE products"))
+
+    # All paths must agree on the items before their speed means anything.
+    async with session_factory() as session:
+        items = [json.loads(await render(session, 20))["items"] for render in RENDERERS.values()]
+    assert all(other == items[0] for other in items[1:])
+
+    print(f"{'per_page':>8}  {'path':<15}  {'p50 ms':>8}  {'p95 ms':>8}  {'rows/sec':>10}")
+    for per_page in page_sizes:
+        for name, render in RENDERERS.items():
+            samples = await _time_renderer(session_factory, render, per_page, repeats)
+            p50 = statistics.median(samples)
+            p95 = statistics.quantiles(samples, n=20)[-1]
+            rows_per_sec = per_page * len(samples) / (sum(samples) / 1000)
+            print(f"{per_page:>8}  {name:<15}  {p50:>8.2f}  {p95:>8.2f}  {rows_per_sec:>10,.0f}")
+
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--page-sizes", type=int, nargs="+", default=DEFAULT_PAGE_SIZES)
+    parser.add_argument("--repeats", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(run(args.rows, args.page_sizes, args.repeats))
+
+
+if __name__ == "__main__":
+    main()
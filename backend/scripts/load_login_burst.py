@@ -0,0 +1,151 @@
+"""Load test — catalog latency while a burst of admin logins is in flight.
+
+Run from the backend directory:
+    python -m scripts.load_login_burst
+    python -m scripts.load_login_burst --logins 40 --catalog-workers 8
+
+Drives the real app in-process (httpx ASGI transport, one event loop, like
+a single uvicorn worker) against the throwaway `wisteria_bench` database.
+For each scenario, `--catalog-workers` clients hammer `GET /products`
+(catalog cache cleared before every request, so each one hits the DB)
+while the login burst runs, and catalog p50/p95/p99 are reported:
+
+- `baseline`: no logins — the latency floor.
+- `pool`: the burst goes through the bounded bcrypt pool (current code).
+- `inline`: bcrypt called directly on the event loop (the old code), for
+  comparison.
+
+The login rate limit is switched off for the run — the point is to
+measure a burst that got past it, e.g. from many IPs.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections.abc import AsyncGenerator
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.config import settings
+from app.database import get_db
+from app.main import app
+from app.models.admin_user import AdminUser
+from app.models.base import Base
+from app.rate_limit import limiter
+from app.services import auth as auth_service
+from app.services.product import invalidate_product_caches
+from app.utils.security import hash_password, verify_password
+from scripts.bench_search import FILL_SQL, bench_url, recreate_bench_db
+
+ADMIN_EMAIL = "bench@wisteria.com"
+ADMIN_PASSWORD = "bench-password"
+
+
+async def _verify_inline(plain_password: str, hashed_password: str) -> bool:
+    # The pre-pool behaviour: bcrypt straight on the event loop.
+    return verify_password(plain_password, hashed_password)
+
+
+async def _catalog_worker(client: AsyncClient, stop: asyncio.Event, samples: list[float]) -> None:
+    while not stop.is_set():
+        invalidate_product_caches()
+        start = time.perf_counter()
+        response = await client.get("/products")
+        samples.append((time.perf_counter() - start) * 1000)
+        response.raise_for_status()
+
+
+async def _login(client: AsyncClient) -> int:
+    response = await client.post(
+        "/auth/login", json={"email": ADMIN_EMAIL, "password": ADMIN_PASSWORD}
+    )
+    return response.status_code
+
+
+async def _scenario(
+    client: AsyncClient, logins: int, workers: int
+) -> tuple[list[float], dict[int, int]]:
+    """Run catalog workers for the duration of a login burst (or 2s with no logins)."""
+    stop = asyncio.Event()
+    samples: list[float] = []
+    tasks = [asyncio.create_task(_catalog_worker(client, stop, samples)) for _ in range(workers)]
+    await asyncio.sleep(0.2)  # let the workers settle
+    samples.clear()
+
+    statuses: dict[int, int] = {}
+    if logins:
+        for status_code in await asyncio.gather(*(_login(client) for _ in range(logins))):
+            statuses[status_code] = statuses.get(status_code, 0) + 1
+    else:
+        await asyncio.sleep(2)
+
+    stop.set()
+    await asyncio.gather(*tasks)
+    return samples, statuses
+
+
+def _report(label: str, samples: list[float], statuses: dict[int, int]) -> None:
+    cuts = statistics.quantiles(samples, n=100)
+    print(
+        f"{label:<9}  {len(samples):>8}  {statistics.median(samples):>8.1f}  "
+        f"{cuts[94]:>8.1f}  {cuts[98]:>8.1f}  {max(samples):>8.1f}  {statuses or ''}"
+    )
+
+
+async def run(logins: int, workers: int, products: int) -> None:
+    recreate_bench_db()
+    engine = create_async_engine(bench_url(), pool_size=workers + 2)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        await conn.run_sync(Base.metadata.create_all)
+        setseed, insert = FILL_SQL.strip().split(";", 1)
+        await conn.execute(text(setseed))
+        await conn.execute(text(insert), {"n": products})
+    async with session_factory() as session:
+        session.add(AdminUser(email=ADMIN_EMAIL, password_hash=hash_password(ADMIN_PASSWORD)))
+        await session.commit()
+
+    async def bench_get_db() -> AsyncGenerator[AsyncSession, None]:
+        async with session_factory() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = bench_get_db
+    limiter.enabled = False
+    transport = ASGITransport(app=app)
+
+    print(
+        f"{'scenario':<9}  {'requests':>8}  {'p50 ms':>8}  {'p95 ms':>8}  "
+        f"{'p99 ms':>8}  {'max ms':>8}  logins"
+    )
+    base_url = f"http://bench{settings.api_v1_prefix}"
+    async with AsyncClient(transport=transport, base_url=base_url) as client:
+        _report("baseline", *await _scenario(client, 0, workers))
+        _report("pool", *await _scenario(client, logins, workers))
+
+        pooled = auth_service.verify_password_async
+        auth_service.verify_password_async = _verify_inline
+        try:
+            _report("inline", *await _scenario(client, logins, workers))
+        finally:
+            auth_service.verify_password_async = pooled
+
+    app.dependency_overrides.clear()
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--logins", type=int, default=20)
+    parser.add_argument("--catalog-workers", type=int, default=4)
+    parser.add_argument("--products", type=int, default=1_000)
+    args = parser.parse_args()
+    asyncio.run(run(args.logins, args.catalog_workers, args.products))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,22 @@
 """Seed script — populates the database with an admin user and sample products.
 
 Run from the backend directory:
-    python -m scripts.seed
+    python -m scripts.seed                           # admin + a few hand-written products
+    python -m scripts.seed --scale 1000000           # admin + 1M synthetic products, 5M orders
+    python -m scripts.seed --scale 100000 --orders 0 --truncate
 
-This script is idempotent: it checks for existing data before inserting.
-If the admin user or products already exist, it skips them.
+The default mode is idempotent: it checks for existing data before
+inserting. If the admin user or products already exist, it skips them.
+
+**`--scale N` (load-testing data):** generates N synthetic products and
+(by default) 5 x N orders with 1-4 items each, and bulk-loads them with
+`COPY` in batches, printing progress as it goes. Secondary indexes are
+dropped for the load and rebuilt afterwards. The data is shaped like
+the real catalog — weighted categories and conditions, prices by
+category, ~85% available, popular products appearing in more orders —
+and fully determined by `--seed`, so two runs build identical databases
+(ids included) and benchmark results stay comparable. Refuses to run on
+a non-empty catalog unless `--truncate` is given.
 
 **Async pattern for standalone scripts:**
 Unlike FastAPI routes (which get a session from dependency injection),
@@ -13,12 +25,24 @@ same `async_session` factory from `app.database` and wrap everything
 in `asyncio.run()`.
 """
 
+import argparse
 import asyncio
+import functools
+import random
+import time
+import uuid
+from array import array
+from datetime import datetime, timedelta
+from typing import Any
 
-from sqlalchemy import select
+import asyncpg
+import orjson
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import async_session
+from app.database import async_session, engine
 from app.models.admin_user import AdminUser
+from app.models.order import Order, OrderItem, OrderStatus
 from app.models.product import Product, ProductCategory, ProductCondition
 from app.utils.security import hash_password
 
@@ -139,25 +163,29 @@ SAMPLE_PRODUCTS = [
 ]
 
 
+async def seed_admin(session: AsyncSession) -> None:
+    """Create the admin user unless it already exists."""
+    result = await session.execute(
+        select(AdminUser).where(AdminUser.email == ADMIN_EMAIL)
+    )
+    existing_admin = result.scalar_one_or_none()
+
+    if existing_admin is None:
+        admin = AdminUser(
+            email=ADMIN_EMAIL,
+            password_hash=hash_password(ADMIN_PASSWORD),
+        )
+        session.add(admin)
+        await session.commit()
+        print(f"Created admin user: {ADMIN_EMAIL} / {ADMIN_PASSWORD}")
+    else:
+        print(f"Admin user already exists: {ADMIN_EMAIL}")
+
+
 async def seed() -> None:
     """Seed the database with sample data."""
     async with async_session() as session:
-        # Seed admin user
-        result = await session.execute(
-            select(AdminUser).where(AdminUser.email == ADMIN_EMAIL)
-        )
-        existing_admin = result.scalar_one_or_none()
-
-        if existing_admin is None:
-            admin = AdminUser(
-                email=ADMIN_EMAIL,
-                password_hash=hash_password(ADMIN_PASSWORD),
-            )
-            session.add(admin)
-            await session.commit()
-            print(f"Created admin user: {ADMIN_EMAIL} / {ADMIN_PASSWORD}")
-        else:
-            print(f"Admin user already exists: {ADMIN_EMAIL}")
+        await seed_admin(session)
 
         # Seed products
         created_count = 0
@@ -179,5 +207,398 @@ async def seed() -> None:
         print(f"Products: {created_count} created, {skipped_count} already existed")
 
 
+# --- Synthetic data for --scale ------------------------------------------
+
+COPY_BATCH_SIZE = 50_000
+ORDERS_PER_PRODUCT = 5
+HISTORY_DAYS = 730
+
+CHARACTERS = [
+    "Hatsune Miku",
+    "Rem",
+    "Ram",
+    "Gojo Satoru",
+    "Anya Forger",
+    "Tanjiro Kamado",
+    "Nezuko Kamado",
+    "Sailor Moon",
+    "Asuka Langley",
+    "Rei Ayanami",
+    "Megumin",
+    "Frieren",
+    "Marin Kitagawa",
+    "Makima",
+    "Monkey D. Luffy",
+    "Zero Two",
+    "Power",
+    "Yor Forger",
+    "Kirby",
+    "Pochacco",
+    "Levi Ackerman",
+    "Mikasa Ackerman",
+    "Bocchi",
+    "Chainsaw Man",
+    "Nami",
+    "Sukuna",
+    "Violet Evergarden",
+    "Kaguya",
+]
+SERIES = {
+    ProductCategory.NENDOROID: ["Nendoroid", "Nendoroid Swacchao!", "Nendoroid Doll"],
+    ProductCategory.SCALE_FIGURE: ["1/7 Scale Figure", "1/6 Scale Figure", "1/4 Scale Figure"],
+    ProductCategory.PLUSH: ["Fluffy Plush", "Mascot Plush", "Big Plush"],
+    ProductCategory.GOODS: ["Acrylic Stand", "Keychain", "Tapestry", "Can Badge Set"],
+}
+VARIANTS = ["", "Winter Ver.", "Racing Ver.", "Swimsuit Ver.", "Deluxe", "Limited Edition"]
+# Weights roughly follow the live catalog's mix.
+CATEGORY_WEIGHTS = {
+    ProductCategory.NENDOROID: 35,
+    ProductCategory.SCALE_FIGURE: 25,
+    ProductCategory.PLUSH: 15,
+    ProductCategory.GOODS: 25,
+}
+CONDITION_WEIGHTS = {
+    ProductCondition.NEW: 50,
+    ProductCondition.LIKE_NEW: 30,
+    ProductCondition.USED: 20,
+}
+# (min, max) price in cents per category; conditions discount from there.
+PRICE_RANGES = {
+    ProductCategory.NENDOROID: (3_000, 9_000),
+    ProductCategory.SCALE_FIGURE: (12_000, 45_000),
+    ProductCategory.PLUSH: (1_500, 6_000),
+    ProductCategory.GOODS: (800, 4_000),
+}
+CONDITION_DISCOUNT = {
+    ProductCondition.NEW: 1.0,
+    ProductCondition.LIKE_NEW: 0.85,
+    ProductCondition.USED: 0.65,
+}
+DESCRIPTION_SENTENCES = [
+    "{character} in {series} form, complete with all original parts.",
+    "Box shows light shelf wear; the figure itself is untouched.",
+    "Comes with interchangeable face plates and a display base.",
+    "Officially licensed. Authenticity guaranteed.",
+    "Approximately {size}cm tall.",
+    "Stored in a smoke-free, pet-free home.",
+    "A must-have for any {character} collector.",
+    "Ships double-boxed with bubble wrap.",
+]
+ORDER_STATUS_WEIGHTS = {
+    OrderStatus.SHIPPED: 55,
+    OrderStatus.PAID: 30,
+    OrderStatus.PENDING: 8,
+    OrderStatus.CANCELLED: 7,
+}
+FIRST_NAMES = ["Aiko", "Ben", "Chloe", "Daichi", "Emma", "Felix", "Grace", "Hiro", "Isla", "Jun"]
+LAST_NAMES = ["Tanaka", "Smith", "Garcia", "Suzuki", "Brown", "Kim", "Martin", "Sato", "Lee"]
+CITIES = [
+    ("Seattle", "WA", "US"),
+    ("Austin", "TX", "US"),
+    ("Toronto", "ON", "CA"),
+    ("London", "", "GB"),
+    ("Osaka", "", "JP"),
+    ("Berlin", "", "DE"),
+]
+
+PRODUCT_COLUMNS = [
+    "id",
+    "name",
+    "slug",
+    "description",
+    "price_cents",
+    "condition",
+    "category",
+    "image_url",
+    "is_available",
+    "quantity",
+    "created_at",
+    "updated_at",
+]
+ORDER_COLUMNS = [
+    "id",
+    "customer_email",
+    "customer_name",
+    "stripe_checkout_session_id",
+    "stripe_payment_intent_id",
+    "status",
+    "total_cents",
+    "shipping_address_json",
+    "created_at",
+    "updated_at",
+]
+SCALE_TABLES = [Product.__table__, Order.__table__, OrderItem.__table__]
+
+ORDER_ITEM_COLUMNS = [
+    "id",
+    "order_id",
+    "product_id",
+    "product_name",
+    "price_cents",
+    "quantity",
+    "created_at",
+    "updated_at",
+]
+
+
+def _slugify(name: str) -> str:
+    return "-".join("".join(c if c.isalnum() else " " for c in name.lower()).split())
+
+
+class _Progress:
+    """Prints `label  done / total  (pct)  rows/s` after each batch."""
+
+    def __init__(self, label: str, total: int) -> None:
+        self.label, self.total, self.done = label, total, 0
+        self.start = time.perf_counter()
+
+    def advance(self, rows: int) -> None:
+        self.done += rows
+        elapsed = time.perf_counter() - self.start
+        print(
+            f"  {self.label:<12} {self.done:>12,} / {self.total:,}"
+            f"  ({self.done / self.total:>4.0%})  {self.done / elapsed:>10,.0f} rows/s",
+            flush=True,
+        )
+
+
+class SyntheticCatalog:
+    """Deterministic product and order generator for `--scale`.
+
+    Order items need each product's id, name and price. Holding 1M
+    product rows in memory would take gigabytes, so only compact arrays
+    (16-byte ids, prices, and the name's seed) are kept; names are rebuilt
+    from their seed when an order item needs one.
+    """
+
+    def __init__(self, products: int, seed: int, available_ratio: float) -> None:
+        self.products = products
+        self.seed = seed
+        self.available_ratio = available_ratio
+        self.rng = random.Random(seed)
+        self.now = datetime(2026, 1, 1)  # created_at is a naive (UTC) timestamp column
+        self._ids = self.rng.randbytes(16 * products)
+        self._prices = array("i", bytes(4 * products))
+        # Popular products recur across many orders; skip rebuilding their names.
+        self.product_name = functools.lru_cache(maxsize=65_536)(self._product_name)
+
+    def product_id(self, index: int) -> uuid.UUID:
+        return uuid.UUID(bytes=self._ids[16 * index : 16 * index + 16], version=4)
+
+    def _identity(self, index: int) -> tuple[ProductCategory, str, str, str]:
+        """(category, character, series, name) — from the product's own small RNG,
+        so an order item can rebuild its product's name on demand."""
+        rng = random.Random(self.seed * 1_000_003 + index)
+        category = rng.choices(list(CATEGORY_WEIGHTS), weights=list(CATEGORY_WEIGHTS.values()))[0]
+        character, series = rng.choice(CHARACTERS), rng.choice(SERIES[category])
+        parts = (character, series, rng.choice(VARIANTS))
+        return category, character, series, " ".join(p for p in parts if p) + f" #{index + 1}"
+
+    def _product_name(self, index: int) -> str:
+        return self._identity(index)[3]
+
+    def product_records(self, start: int, stop: int) -> list[tuple[Any, ...]]:
+        records = []
+        rng = self.rng
+        for index in range(start, stop):
+            category, character, series, name = self._identity(index)
+            condition = rng.choices(
+                list(CONDITION_WEIGHTS), weights=list(CONDITION_WEIGHTS.values())
+            )[0]
+            low, high = PRICE_RANGES[category]
+            price = max(100, round(rng.uniform(low, high) * CONDITION_DISCOUNT[condition], -2) - 1)
+            self._prices[index] = int(price)
+            available = rng.random() < self.available_ratio
+            sentences = rng.sample(DESCRIPTION_SENTENCES, k=rng.randint(2, 5))
+            description = " ".join(sentences).format(
+                character=character, series=series, size=rng.randint(8, 40)
+            )
+            # Older products first, so created_at roughly follows insertion order.
+            created_at = self.now - timedelta(
+                days=HISTORY_DAYS * (1 - index / self.products), seconds=rng.randint(0, 3600)
+            )
+            records.append(
+                (
+                    self.product_id(index),
+                    name,
+                    _slugify(name),
+                    description,
+                    int(price),
+                    condition.value,
+                    category.value,
+                    f"https://images.example.com/products/{index + 1}.jpg",
+                    available,
+                    rng.randint(1, 3) if available else 0,
+                    created_at,
+                    created_at,
+                )
+            )
+        return records
+
+    def order_records(
+        self, start: int, stop: int, total_orders: int
+    ) -> tuple[list[tuple[Any, ...]], list[tuple[Any, ...]]]:
+        orders, items = [], []
+        rng = self.rng
+        for index in range(start, stop):
+            order_id = uuid.UUID(int=rng.getrandbits(128), version=4)
+            created_at = self.now - timedelta(
+                days=HISTORY_DAYS * (1 - index / total_orders), seconds=rng.randint(0, 3600)
+            )
+            total = 0
+            for _ in range(rng.choices((1, 2, 3, 4), weights=(55, 25, 12, 8))[0]):
+                # Squaring skews toward low indexes: a few products sell a lot.
+                product = int(self.products * rng.random() ** 2)
+                quantity = 1 if rng.random() < 0.9 else 2
+                price = self._prices[product]
+                total += price * quantity
+                items.append(
+                    (
+                        uuid.UUID(int=rng.getrandbits(128), version=4),
+                        order_id,
+                        self.product_id(product),
+                        self.product_name(product),
+                        price,
+                        quantity,
+                        created_at,
+                        created_at,
+                    )
+                )
+
+            first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+            city, state, country = rng.choice(CITIES)
+            status = rng.choices(
+                list(ORDER_STATUS_WEIGHTS), weights=list(ORDER_STATUS_WEIGHTS.values())
+            )[0]
+            paid = status in (OrderStatus.PAID, OrderStatus.SHIPPED)
+            address = {
+                "line1": f"{rng.randint(1, 9999)} {rng.choice(LAST_NAMES)} St",
+                "city": city,
+                "state": state,
+                "postal_code": f"{rng.randint(10000, 99999)}",
+                "country": country,
+            }
+            orders.append(
+                (
+                    order_id,
+                    f"{first.lower()}.{last.lower()}{index}@example.com",
+                    f"{first} {last}",
+                    f"cs_seed_{index:010d}",
+                    f"pi_seed_{index:010d}" if paid else None,
+                    status.value,
+                    total,
+                    orjson.dumps(address).decode(),
+                    created_at,
+                    created_at,
+                )
+            )
+        return orders, items
+
+
+async def seed_scale(
+    products: int, orders: int, seed: int, available_ratio: float, truncate: bool
+) -> None:
+    """Bulk-load synthetic products and orders with COPY (see module docstring)."""
+    async with async_session() as session:
+        await seed_admin(session)
+
+    async with engine.connect() as sa_conn:
+        # Each COPY batch commits on its own, so progress survives an interrupted load.
+        await sa_conn.execution_options(isolation_level="AUTOCOMMIT")
+        if truncate:
+            await sa_conn.execute(text("TRUNCATE products, orders, order_items CASCADE"))
+        existing = (await sa_conn.execute(text("SELECT count(*) FROM products"))).scalar_one()
+        if existing:
+            raise SystemExit(f"products already has {existing:,} rows; pass --truncate to replace")
+
+        # COPY isn't exposed through SQLAlchemy; use the asyncpg connection underneath.
+        raw = await sa_conn.get_raw_connection()
+        conn: asyncpg.Connection = raw.driver_connection
+        catalog = SyntheticCatalog(products, seed, available_ratio)
+        started = time.perf_counter()
+
+        # Building an index once over the loaded rows is far cheaper than
+        # updating it row by row — especially the GIN ones. Unique indexes
+        # stay, since they back constraints.
+        deferred = [index for table in SCALE_TABLES for index in table.indexes if not index.unique]
+        for index in deferred:
+            await conn.execute(f"DROP INDEX IF EXISTS {index.name}")
+
+        # Rebuilt even if the load fails part-way: a partly loaded catalog
+        # without its indexes would make every query a sequential scan.
+        try:
+            print(f"Loading {products:,} products and {orders:,} orders (seed {seed})")
+            progress = _Progress("products", products)
+            for start in range(0, products, COPY_BATCH_SIZE):
+                stop = min(start + COPY_BATCH_SIZE, products)
+                await conn.copy_records_to_table(
+                    "products",
+                    records=catalog.product_records(start, stop),
+                    columns=PRODUCT_COLUMNS,
+                )
+                progress.advance(stop - start)
+
+            if orders:
+                progress = _Progress("orders", orders)
+                item_count = 0
+                # Smaller batches: each order brings ~1.7 items along.
+                batch = COPY_BATCH_SIZE // 2
+                for start in range(0, orders, batch):
+                    stop = min(start + batch, orders)
+                    order_rows, item_rows = catalog.order_records(start, stop, orders)
+                    await conn.copy_records_to_table(
+                        "orders", records=order_rows, columns=ORDER_COLUMNS
+                    )
+                    await conn.copy_records_to_table(
+                        "order_items", records=item_rows, columns=ORDER_ITEM_COLUMNS
+                    )
+                    item_count += len(item_rows)
+                    progress.advance(stop - start)
+                print(f"  order_items  {item_count:>12,}")
+        finally:
+            await conn.execute("SET maintenance_work_mem = '512MB'")
+            for index in deferred:
+                index_start = time.perf_counter()
+                await sa_conn.run_sync(index.create, checkfirst=True)
+                print(f"  index {index.name} built in {time.perf_counter() - index_start:.1f}s")
+
+        # Fresh statistics, so the planner doesn't treat the tables as empty.
+        print("Analyzing...", flush=True)
+        await conn.execute("ANALYZE products, orders, order_items")
+        print(f"Done in {time.perf_counter() - started:,.1f}s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Seed the database.")
+    parser.add_argument(
+        "--scale", type=int, metavar="N", help="bulk-load N synthetic products (and orders)"
+    )
+    parser.add_argument(
+        "--orders",
+        type=int,
+        metavar="M",
+        help=f"synthetic orders to generate (default: {ORDERS_PER_PRODUCT} x N)",
+    )
+    parser.add_argument("--seed", type=int, default=42, help="RNG seed (default: 42)")
+    parser.add_argument(
+        "--available-ratio",
+        type=float,
+        default=0.85,
+        help="share of synthetic products that are available (default: 0.85)",
+    )
+    parser.add_argument(
+        "--truncate",
+        action="store_true",
+        help="empty products, orders and order_items before a --scale load",
+    )
+    args = parser.parse_args()
+
+    if args.scale:
+        orders = args.orders if args.orders is not None else ORDERS_PER_PRODUCT * args.scale
+        asyncio.run(seed_scale(args.scale, orders, args.seed, args.available_ratio, args.truncate))
+    else:
+        asyncio.run(seed())
+
+
 if __name__ == "__main__":
-    asyncio.run(seed())
+    main()
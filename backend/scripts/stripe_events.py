@@ -0,0 +1,127 @@
+"""Signed Stripe webhook events, generated locally — no Stripe account needed.
+
+Run from the backend directory, with the API running and
+STRIPE_WEBHOOK_SECRET set to the same value for both:
+    python -m scripts.stripe_events --product-id <uuid> --product-id <uuid>
+    python -m scripts.stripe_events --type checkout.session.expired --hold-id <uuid>
+    python -m scripts.stripe_events --product-id <uuid> --deliveries 3  # redelivery
+
+Builds a Checkout Session event shaped like Stripe's (only the fields the
+handlers read), signs it the way Stripe does —
+`Stripe-Signature: t=<unix time>,v1=<HMAC-SHA256 of "<t>.<body>">` — and
+POSTs it to /webhooks/stripe. The tests use the same helpers.
+"""
+
+import argparse
+import hashlib
+import hmac
+import time
+import uuid
+from typing import Any
+
+import httpx
+import orjson
+
+from app.config import settings
+from app.services.checkout import product_ids_metadata
+
+
+def sign_payload(payload: bytes, secret: str, timestamp: int | None = None) -> str:
+    """A `Stripe-Signature` header value for `payload`."""
+    timestamp = int(time.time()) if timestamp is None else timestamp
+    signed = f"{timestamp}.".encode() + payload
+    signature = hmac.new(secret.encode(), signed, hashlib.sha256).hexdigest()
+    return f"t={timestamp},v1={signature}"
+
+
+def checkout_session_event(
+    event_type: str = "checkout.session.completed",
+    *,
+    product_ids: list[uuid.UUID] | None = None,
+    hold_id: uuid.UUID | None = None,
+    session_id: str | None = None,
+    amount_total: int = 0,
+    email: str = "buyer@example.com",
+    name: str = "Test Buyer",
+    event_id: str | None = None,
+) -> dict[str, Any]:
+    """A Stripe event wrapping a Checkout Session object."""
+    session_id = session_id or f"cs_test_{uuid.uuid4().hex}"
+    completed = event_type == "checkout.session.completed"
+    return {
+        "id": event_id or f"evt_{uuid.uuid4().hex}",
+        "object": "event",
+        "type": event_type,
+        "created": int(time.time()),
+        "livemode": False,
+        "data": {
+            "object": {
+                "id": session_id,
+                "object": "checkout.session",
+                "mode": "payment",
+                "status": "complete" if completed else "expired",
+                "payment_status": "paid" if completed else "unpaid",
+                "payment_intent": f"pi_test_{uuid.uuid4().hex}" if completed else None,
+                "amount_total": amount_total,
+                "currency": "usd",
+                "client_reference_id": str(hold_id) if hold_id else None,
+                "metadata": product_ids_metadata(product_ids or []),
+                "customer_details": {"email": email, "name": name},
+                "shipping_details": {
+                    "name": name,
+                    "address": {
+                        "line1": "1 Test Street",
+                        "city": "Portland",
+                        "state": "OR",
+                        "postal_code": "97201",
+                        "country": "US",
+                    },
+                },
+            }
+        },
+    }
+
+
+def signed_request(event: dict[str, Any], secret: str) -> tuple[bytes, dict[str, str]]:
+    """Body and headers for POSTing `event` to the webhook endpoint."""
+    body = orjson.dumps(event)
+    return body, {
+        "content-type": "application/json",
+        "stripe-signature": sign_payload(body, secret),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--url", default=f"http://localhost:8000{settings.api_v1_prefix}/webhooks/stripe"
+    )
+    parser.add_argument(
+        "--type",
+        default="checkout.session.completed",
+        choices=["checkout.session.completed", "checkout.session.expired"],
+    )
+    parser.add_argument("--product-id", type=uuid.UUID, action="append", default=[])
+    parser.add_argument("--hold-id", type=uuid.UUID)
+    parser.add_argument("--amount-total", type=int, default=0, help="cents")
+    parser.add_argument("--deliveries", type=int, default=1, help="send the same event N times")
+    parser.add_argument("--secret", default=settings.stripe_webhook_secret)
+    args = parser.parse_args()
+    if not args.secret:
+        parser.error("set STRIPE_WEBHOOK_SECRET or pass --secret")
+
+    event = checkout_session_event(
+        args.type,
+        product_ids=args.product_id,
+        hold_id=args.hold_id,
+        amount_total=args.amount_total,
+    )
+    print(f"event {event['id']}, session {event['data']['object']['id']}")
+    for _ in range(args.deliveries):
+        body, headers = signed_request(event, args.secret)
+        response = httpx.post(args.url, content=body, headers=headers)
+        print(response.status_code, response.text)
+
+
+if __name__ == "__main__":
+    main()
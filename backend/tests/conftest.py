@@ -4,16 +4,39 @@
 
 1. Tests insert data via `db_session` — a dedicated session for test setup.
 2. The HTTP client's requests go through FastAPI, which calls `get_db` to
-   get a session. We override `get_db` to use our test session factory
-   (same DB, fresh session per request).
+   get a session. We override `get_db` (and `get_read_db`) to use the
+   test's session factory (same DB, fresh session per request).
 3. `httpx.AsyncClient` speaks ASGI directly to the FastAPI app — no real
    HTTP server needed.
 
-**Key gotcha: event loop + connection pool.**
-asyncpg connections are bound to the event loop they were created on.
-pytest-asyncio creates a new loop per test (in function scope mode).
-Using `NullPool` avoids keeping connections across loops — each query
-creates and destroys its own connection. Slower but correct for tests.
+**Isolation: each test runs inside a transaction that is rolled back.**
+Every test gets one connection with an open transaction. All its sessions
+(`db_session` and every request's) are bound to that connection with
+`join_transaction_mode="create_savepoint"`: a `session.commit()` in app
+code only releases a SAVEPOINT, and `session.rollback()` rolls back to
+it, so services behave exactly as in production. At teardown the outer
+transaction is rolled back and the tables are empty again — no TRUNCATE,
+no new connection per query.
+
+Two consequences to keep in mind:
+- Everything a test does happens on one connection, one statement at a
+  time. Tests that need concurrent requests, or other connections that
+  see the test's data, mark themselves `@pytest.mark.commits`: they get
+  real commits on pooled connections and TRUNCATE afterwards.
+- `now()` is the transaction's start time, so it doesn't advance within
+  a rollback test.
+
+`pytest --db-isolation=truncate` runs every test the old way (real
+commits + TRUNCATE), e.g. to rule out the harness when a test misbehaves.
+
+**Event loop + connection pool.** asyncpg connections are bound to the
+event loop they were created on, so the whole session shares one loop
+(see `pytest_collection_modifyitems`). That lets `test_engine` keep a
+normal connection pool across tests instead of `NullPool`.
+
+**Timing report:** `pytest --timing-report=timings.json` writes setup /
+call / teardown seconds per test; the terminal summary totals them per
+file either way.
 
 **Dedicated test database:**
 Tests run against `wisteria_test`, not the dev `wisteria` DB. This means:
@@ -22,18 +45,63 @@ Tests run against `wisteria_test`, not the dev `wisteria` DB. This means:
 - The test DB is auto-created on first run (see `_ensure_test_db_exists`)
 """
 
-from collections.abc import AsyncGenerator
+import time
+from collections import defaultdict
+from collections.abc import AsyncGenerator, Generator
+from pathlib import Path
+from typing import Any
 
+import orjson
 import pytest
+import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy import text
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.pool import NullPool
 
 from app.config import settings
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.main import app
 from app.models.base import Base
+from app.services.auth import invalidate_auth_caches
+from app.services.product import invalidate_product_caches
+
+# Cheapest bcrypt for the hashes tests create (~1ms instead of ~250ms).
+settings.password_hash_rounds = 4
+
+# Statements the rollback harness itself sends; `sql_statements` skips them.
+_SAVEPOINT_PREFIXES = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--db-isolation",
+        choices=("rollback", "truncate"),
+        default="rollback",
+        help="rollback: each test in a rolled-back transaction (default); "
+        "truncate: real commits, tables truncated after each test",
+    )
+    parser.addoption(
+        "--timing-report",
+        type=Path,
+        metavar="PATH",
+        help="write per-test setup/call/teardown seconds as JSON",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        "markers",
+        "commits: needs real commits — concurrent requests, other connections "
+        "reading the data, or now() advancing between writes; runs with TRUNCATE isolation",
+    )
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Run every async test in the session's event loop (see module docstring)."""
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if pytest_asyncio.is_async_test(item):
+            item.add_marker(session_loop, append=False)
 
 
 def _ensure_test_db_exists() -> None:
@@ -52,15 +120,11 @@ def _ensure_test_db_exists() -> None:
 
     # Swap asyncpg → psycopg2 (sync driver) and target the default `postgres` DB.
     # The `postgres` database always exists — it's the bootstrap DB.
-    sync_url = settings.test_database_url.replace(
-        "+asyncpg", ""
-    ).rsplit("/", 1)[0] + "/postgres"
+    sync_url = settings.test_database_url.replace("+asyncpg", "").rsplit("/", 1)[0] + "/postgres"
 
     engine = create_engine(sync_url, isolation_level="AUTOCOMMIT")
     with engine.connect() as conn:
-        result = conn.execute(
-            text("SELECT 1 FROM pg_database WHERE datname = 'wisteria_test'")
-        )
+        result = conn.execute(text("SELECT 1 FROM pg_database WHERE datname = 'wisteria_test'"))
         if not result.scalar():
             conn.execute(text("CREATE DATABASE wisteria_test"))
     engine.dispose()
@@ -68,71 +132,99 @@ def _ensure_test_db_exists() -> None:
 
 _ensure_test_db_exists()
 
-# NullPool is critical for tests: it creates a fresh connection per operation
-# and closes it immediately. This avoids "Future attached to a different loop"
-# errors that happen when pooled connections cross event loop boundaries.
-test_engine = create_async_engine(
-    settings.test_database_url,
-    echo=False,
-    poolclass=NullPool,
-)
-test_session_factory = async_sessionmaker(
-    test_engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-)
+# A normal pool: every test runs on the session's event loop, so pooled
+# connections never cross loops. A rollback test holds one connection.
+test_engine = create_async_engine(settings.test_database_url, echo=False)
 
-_tables_created = False
+TestSessionFactory = async_sessionmaker[AsyncSession]
 
 
-@pytest.fixture(autouse=True)
-async def setup_db() -> AsyncGenerator[None, None]:
-    """Ensure tables exist and are empty before each test."""
-    global _tables_created
-    if not _tables_created:
-        async with test_engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
-        _tables_created = True
-
-    # Truncate before AND after each test. The "before" handles stale data
-    # from the seed script or a previous test run that didn't clean up.
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def _test_tables() -> AsyncGenerator[None, None]:
+    """Recreate the tables once per run; dispose of the pool at the end."""
     async with test_engine.begin() as conn:
-        table_names = ", ".join(Base.metadata.tables.keys())
-        if table_names:
-            await conn.execute(text(f"TRUNCATE {table_names} CASCADE"))
+        # Alembic creates extensions in production; create_all doesn't.
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        # Drop first: create_all skips tables that already exist, so new
+        # columns and indexes would never reach an existing test DB.
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
     yield
+    await test_engine.dispose()
+
+
+async def _truncate_all() -> None:
     async with test_engine.begin() as conn:
-        table_names = ", ".join(Base.metadata.tables.keys())
-        if table_names:
-            await conn.execute(text(f"TRUNCATE {table_names} CASCADE"))
+        await conn.execute(text(f"TRUNCATE {', '.join(Base.metadata.tables)} CASCADE"))
+
+
+@pytest.fixture(autouse=True)
+async def session_factory(
+    request: pytest.FixtureRequest, _test_tables: None
+) -> AsyncGenerator[TestSessionFactory, None]:
+    """The sessionmaker every session in this test comes from.
+
+    Rollback isolation (default): bound to one connection inside an outer
+    transaction that is rolled back at teardown. Truncate isolation
+    (`--db-isolation=truncate` or `@pytest.mark.commits`): bound to the
+    pooled engine, with tables truncated before and after.
+    """
+    # Tests insert rows directly through `db_session`, bypassing the service
+    # writes that normally invalidate in-process caches — so clear them here.
+    invalidate_product_caches()
+    invalidate_auth_caches()
+
+    truncate = (
+        request.config.getoption("--db-isolation") == "truncate"
+        or request.node.get_closest_marker("commits") is not None
+    )
+    if truncate:
+        # Before AND after: "before" handles data left by the seed script
+        # or an interrupted run.
+        await _truncate_all()
+        yield async_sessionmaker(test_engine, class_=AsyncSession, expire_on_commit=False)
+        await _truncate_all()
+        return
+
+    async with test_engine.connect() as conn:
+        transaction = await conn.begin()
+        yield async_sessionmaker(
+            conn,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        await transaction.rollback()
 
 
 @pytest.fixture
-async def db_session() -> AsyncGenerator[AsyncSession, None]:
+async def db_session(
+    session_factory: TestSessionFactory,
+) -> AsyncGenerator[AsyncSession, None]:
     """Session for test setup (inserting test data).
 
-    This is a SEPARATE session from what the route handlers use.
-    After committing data here, it's visible to other sessions
-    (route handlers) via normal Postgres transaction isolation.
+    This is a SEPARATE session from what the route handlers use, but in
+    the same transaction, so whatever it commits is visible to them.
     """
-    async with test_session_factory() as session:
+    async with session_factory() as session:
         yield session
 
 
 @pytest.fixture
-async def client() -> AsyncGenerator[AsyncClient, None]:
+async def client(session_factory: TestSessionFactory) -> AsyncGenerator[AsyncClient, None]:
     """Async HTTP client with test DB injected.
 
-    Each route handler call gets its OWN session from `test_session_factory`.
-    This avoids asyncpg InterfaceError from concurrent operations on a single
-    connection.
+    Each route handler call gets its OWN session from `session_factory`,
+    as it would from `get_db` in production.
     """
 
     async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
-        async with test_session_factory() as session:
+        async with session_factory() as session:
             yield session
 
     app.dependency_overrides[get_db] = override_get_db
+    # No replica in tests — read-only routes use the same test DB.
+    app.dependency_overrides[get_read_db] = override_get_db
 
     async with AsyncClient(
         transport=ASGITransport(app=app),
@@ -141,3 +233,66 @@ async def client() -> AsyncGenerator[AsyncClient, None]:
         yield ac
 
     app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def sql_statements() -> Generator[list[str], None, None]:
+    """Every SQL statement sent through the test engine while the test runs.
+
+    Counts what reaches the database (one entry per cursor execute), so a
+    test can assert how many round trips an endpoint costs. Clear the list
+    after any setup requests you don't want counted. The SAVEPOINTs of
+    rollback isolation aren't counted: production sessions don't send them.
+    """
+    statements: list[str] = []
+
+    def record(_conn: Any, _cursor: Any, statement: str, *_args: Any) -> None:
+        if not statement.startswith(_SAVEPOINT_PREFIXES):
+            statements.append(statement)
+
+    event.listen(test_engine.sync_engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(test_engine.sync_engine, "before_cursor_execute", record)
+
+
+# --- Per-test timing report ---------------------------------------------
+
+_PHASES = ("setup", "call", "teardown")
+_timings: dict[str, dict[str, float]] = defaultdict(dict)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item: pytest.Item, nextitem: pytest.Item | None) -> Generator[None]:
+    start = time.perf_counter()
+    yield
+    _timings[item.nodeid]["total"] = time.perf_counter() - start
+
+
+def pytest_runtest_logreport(report: pytest.TestReport) -> None:
+    _timings[report.nodeid][report.when] = report.duration
+
+
+def pytest_terminal_summary(terminalreporter: Any, exitstatus: int, config: pytest.Config) -> None:
+    """Seconds per file and phase, slowest file first."""
+    if not _timings:
+        return
+    per_file: dict[str, list[float]] = defaultdict(lambda: [0.0] * (len(_PHASES) + 1))
+    for nodeid, phases in _timings.items():
+        totals = per_file[nodeid.split("::", 1)[0]]
+        totals[0] += 1
+        for i, phase in enumerate(_PHASES, start=1):
+            totals[i] += phases.get(phase, 0.0)
+
+    isolation = config.getoption("--db-isolation")
+    terminalreporter.write_sep("-", f"test timing (db isolation: {isolation})")
+    header = "".join(f"{phase:>10}" for phase in _PHASES)
+    terminalreporter.write_line(f"{'file':<36}{'tests':>6}{header}")
+    for path, (count, *seconds) in sorted(per_file.items(), key=lambda kv: -sum(kv[1][1:])):
+        columns = "".join(f"{value:>9.2f}s" for value in seconds)
+        terminalreporter.write_line(f"{path:<36}{count:>6.0f}{columns}")
+
+    report_path: Path | None = config.getoption("--timing-report")
+    if report_path is not None:
+        report = {"db_isolation": isolation, "tests": _timings}
+        report_path.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2) + b"\n")
+        terminalreporter.write_line(f"timing report written to {report_path}")
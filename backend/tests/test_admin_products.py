@@ -2,9 +2,13 @@
 
 import uuid
 
-from httpx import AsyncClient
+import orjson
+import pytest
+from httpx import AsyncClient, Response
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
 from app.models.admin_user import AdminUser
 from app.models.product import Product, ProductCategory, ProductCondition
 from app.utils.security import create_access_token, hash_password
@@ -63,6 +67,22 @@ class TestAdminListProducts:
         data = response.json()
         assert data["total"] == 2
 
+    async def test_estimated_total(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """In estimate mode the unfiltered admin listing reads pg_class.reltuples."""
+        monkeypatch.setattr(settings, "product_count_mode", "estimate")
+        admin = await _create_admin(db_session)
+        for i in range(3):
+            await _create_product(db_session, slug=f"item-{i}")
+        await db_session.execute(text("ANALYZE products"))
+
+        response = await client.get("/admin/products", headers=_auth_header(admin))
+        assert response.json()["total"] == 3
+
 
 class TestAdminCreateProduct:
     """POST /admin/products — create a new product."""
@@ -116,6 +136,28 @@ class TestAdminCreateProduct:
         assert response.status_code == 409
         assert "slug already exists" in response.json()["detail"]
 
+    async def test_create_invalidates_cached_total(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        admin = await _create_admin(db_session)
+        await _create_product(db_session, slug="existing")
+        assert (await client.get("/products")).json()["total"] == 1
+
+        await client.post(
+            "/admin/products",
+            json={
+                "name": "New Nendoroid",
+                "slug": "new-nendoroid",
+                "description": "A brand new nendoroid.",
+                "price_cents": 4500,
+                "condition": "new",
+                "category": "nendoroid",
+                "image_url": "https://example.com/img.jpg",
+            },
+            headers=_auth_header(admin),
+        )
+        assert (await client.get("/products")).json()["total"] == 2
+
     async def test_invalid_slug_format(
         self, client: AsyncClient, db_session: AsyncSession
     ) -> None:
@@ -205,6 +247,25 @@ class TestAdminUpdateProduct:
         assert response.status_code == 200
         assert response.json()["price_cents"] == 9900
 
+    async def test_update_invalidates_public_cache(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        admin = await _create_admin(db_session)
+        product = await _create_product(db_session)
+        await client.get(f"/products/{product.slug}")
+        await client.get("/products")
+
+        await client.put(
+            f"/admin/products/{product.id}",
+            json={"name": "Updated Name"},
+            headers=_auth_header(admin),
+        )
+
+        detail = await client.get(f"/products/{product.slug}")
+        assert detail.json()["name"] == "Updated Name"
+        listing = await client.get("/products")
+        assert listing.json()["items"][0]["name"] == "Updated Name"
+
     async def test_update_nonexistent(
         self, client: AsyncClient, db_session: AsyncSession
     ) -> None:
@@ -260,3 +321,505 @@ class TestAdminDeleteProduct:
             headers=_auth_header(admin),
         )
         assert response.status_code == 404
+
+
+CSV_HEADER = "name,slug,description,price_cents,condition,category,image_url,quantity\n"
+
+
+def _csv_row(slug: str, price_cents: str = "4200", quantity: str = "") -> str:
+    return (
+        f'Bulk {slug},{slug},"A figure, boxed.",{price_cents},new,nendoroid,'
+        f"https://example.com/{slug}.jpg,{quantity}\n"
+    )
+
+
+def _ndjson_row(slug: str, **overrides: object) -> str:
+    row = {
+        "name": f"Bulk {slug}",
+        "slug": slug,
+        "description": "A figure.",
+        "price_cents": 4200,
+        "condition": "used",
+        "category": "plush",
+        "image_url": f"https://example.com/{slug}.jpg",
+        **overrides,
+    }
+    return orjson.dumps(row).decode() + "\n"
+
+
+class TestAdminBulkImport:
+    """POST /admin/products/bulk — CSV/NDJSON import with per-row errors."""
+
+    async def _post(
+        self,
+        client: AsyncClient,
+        admin: AdminUser,
+        body: str,
+        content_type: str = "text/csv",
+        on_conflict: str = "skip",
+    ) -> Response:
+        return await client.post(
+            f"/admin/products/bulk?on_conflict={on_conflict}",
+            content=body.encode(),
+            headers={**_auth_header(admin), "Content-Type": content_type},
+        )
+
+    async def test_csv_import(self, client: AsyncClient, db_session: AsyncSession) -> None:
+        admin = await _create_admin(db_session)
+        body = CSV_HEADER + "".join(_csv_row(f"bulk-{i}") for i in range(1500))
+
+        response = await self._post(client, admin, body)
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "received": 1500,
+            "inserted": 1500,
+            "updated": 0,
+            "skipped": 0,
+            "failed": 0,
+            "errors": [],
+            "errors_truncated": False,
+        }
+        count = await db_session.execute(text("SELECT count(*) FROM products"))
+        assert count.scalar_one() == 1500
+
+        product = await client.get("/products/bulk-7")
+        assert product.json()["description"] == "A figure, boxed."
+        assert product.json()["quantity"] == 1  # empty cell → schema default
+        assert product.json()["is_available"] is True
+
+    async def test_ndjson_import(self, client: AsyncClient, db_session: AsyncSession) -> None:
+        admin = await _create_admin(db_session)
+        body = _ndjson_row("nd-1") + "\n" + _ndjson_row("nd-2", quantity=3)
+
+        response = await self._post(client, admin, body, "application/x-ndjson")
+
+        assert response.json()["inserted"] == 2
+        product = await client.get("/products/nd-2")
+        assert product.json()["quantity"] == 3
+
+    async def test_reports_invalid_rows(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        admin = await _create_admin(db_session)
+        body = (
+            _ndjson_row("good-1")
+            + _ndjson_row("bad-price", price_cents=0)
+            + "{not json\n"
+            + "[1, 2]\n"
+            + _ndjson_row("good-1")
+            + _ndjson_row("Bad Slug")
+        )
+
+        response = await self._post(client, admin, body, "application/x-ndjson")
+
+        data = response.json()
+        assert (data["received"], data["inserted"], data["failed"]) == (6, 1, 5)
+        errors = {error["row"]: error for error in data["errors"]}
+        assert errors[2]["slug"] == "bad-price"
+        assert errors[2]["errors"][0].startswith("price_cents:")
+        assert errors[3]["errors"][0].startswith("invalid JSON")
+        assert errors[4]["errors"] == ["expected a JSON object"]
+        assert errors[5]["errors"] == ["slug: duplicated earlier in this upload"]
+        assert errors[6]["errors"][0].startswith("slug:")
+
+    async def test_existing_slug_skipped(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        admin = await _create_admin(db_session)
+        await _create_product(db_session, slug="existing")
+
+        response = await self._post(
+            client, admin, CSV_HEADER + _csv_row("existing", "9999") + _csv_row("fresh")
+        )
+
+        data = response.json()
+        assert (data["inserted"], data["skipped"]) == (1, 1)
+        assert data["errors"] == [
+            {
+                "row": 1,
+                "slug": "existing",
+                "errors": ["slug: a product with this slug already exists"],
+            }
+        ]
+        product = await client.get("/products/existing")
+        assert product.json()["price_cents"] == 5000
+
+    async def test_existing_slug_updated(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        admin = await _create_admin(db_session)
+        await _create_product(db_session, slug="existing")
+
+        response = await self._post(
+            client,
+            admin,
+            CSV_HEADER + _csv_row("existing", "9999") + _csv_row("fresh"),
+            on_conflict="update",
+        )
+
+        data = response.json()
+        assert (data["inserted"], data["updated"], data["skipped"]) == (1, 1, 0)
+        product = await client.get("/products/existing")
+        assert product.json()["price_cents"] == 9999
+
+    async def test_multiline_csv_field(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        admin = await _create_admin(db_session)
+        body = CSV_HEADER + (
+            'Quoted,quoted,"Line one\nLine ""two""",100,new,goods,'
+            "https://example.com/q.jpg,1\r\n"
+        )
+
+        response = await self._post(client, admin, body)
+
+        assert response.json()["inserted"] == 1
+        product = await client.get("/products/quoted")
+        assert product.json()["description"] == 'Line one\nLine "two"'
+
+    async def test_missing_csv_columns(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        admin = await _create_admin(db_session)
+
+        response = await self._post(client, admin, "name,slug\nA,a\n")
+
+        assert response.status_code == 400
+        assert "description" in response.json()["detail"]
+
+    async def test_unsupported_content_type(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        admin = await _create_admin(db_session)
+
+        response = await self._post(client, admin, "{}", "application/json")
+
+        assert response.status_code == 415
+
+    async def test_row_limit(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        admin = await _create_admin(db_session)
+        monkeypatch.setattr(settings, "product_import_max_rows", 2)
+
+        body = "".join(_ndjson_row(f"limit-{i}") for i in range(3))
+        response = await self._post(client, admin, body, "application/x-ndjson")
+
+        assert response.status_code == 413
+        count = await db_session.execute(text("SELECT count(*) FROM products"))
+        assert count.scalar_one() == 0
+
+    async def test_requires_auth(self, client: AsyncClient) -> None:
+        response = await client.post(
+            "/admin/products/bulk",
+            content=CSV_HEADER.encode(),
+            headers={"Content-Type": "text/csv"},
+        )
+        assert response.status_code == 403
+
+
+class TestAdminBulkUpdate:
+    """PATCH /admin/products/bulk, POST /bulk/delete, POST /bulk/reprice."""
+
+    async def test_bulk_update(self, client: AsyncClient, db_session: AsyncSession) -> None:
+        admin = await _create_admin(db_session)
+        products = [await _create_product(db_session, slug=f"bulk-{i}") for i in range(3)]
+        missing = uuid.uuid4()
+
+        response = await client.patch(
+            "/admin/products/bulk",
+            json={
+                "ids": [str(products[0].id), str(products[1].id), str(missing)],
+                "changes": {"quantity": 5, "condition": "used"},
+            },
+            headers=_auth_header(admin),
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["updated"] == 2
+        assert data["not_found"] == [str(missing)]
+        assert {item["slug"] for item in data["items"]} == {"bulk-0", "bulk-1"}
+        assert all(item["quantity"] == 5 for item in data["items"])
+        assert all(item["condition"] == "used" for item in data["items"])
+
+        untouched = await client.get(
+            f"/admin/products/{products[2].id}", headers=_auth_header(admin)
+        )
+        assert untouched.json()["quantity"] == 1
+
+    @pytest.mark.commits
+    async def test_bulk_update_bumps_updated_at(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        admin = await _create_admin(db_session)
+        product = await _create_product(db_session)
+
+        response = await client.patch(
+            "/admin/products/bulk",
+            json={"ids": [str(product.id)], "changes": {"name": "Renamed"}},
+            headers=_auth_header(admin),
+        )
+
+        item = response.json()["items"][0]
+        assert item["name"] == "Renamed"
+        assert item["updated_at"] > product.updated_at.isoformat()
+
+    @pytest.mark.parametrize(
+        "changes",
+        [{}, {"slug": "same-slug"}, {"price_cents": None}],
+        ids=["empty", "slug", "null"],
+    )
+    async def test_bulk_update_rejects_changes(
+        self, client: AsyncClient, db_session: AsyncSession, changes: dict[str, str | None]
+    ) -> None:
+        admin = await _create_admin(db_session)
+        product = await _create_product(db_session)
+
+        response = await client.patch(
+            "/admin/products/bulk",
+            json={"ids": [str(product.id)], "changes": changes},
+            headers=_auth_header(admin),
+        )
+
+        assert response.status_code == 422
+
+    async def test_bulk_delete(self, client: AsyncClient, db_session: AsyncSession) -> None:
+        admin = await _create_admin(db_session)
+        products = [await _create_product(db_session, slug=f"gone-{i}") for i in range(3)]
+
+        response = await client.post(
+            "/admin/products/bulk/delete",
+            json={"ids": [str(product.id) for product in products]},
+            headers=_auth_header(admin),
+        )
+
+        assert response.json()["updated"] == 3
+        assert all(item["is_available"] is False for item in response.json()["items"])
+        listing = await client.get("/products")
+        assert listing.json()["total"] == 0
+
+    async def test_reprice_by_category(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        admin = await _create_admin(db_session)
+        nendoroid = await _create_product(db_session, slug="nendo")
+        plush = await _create_product(db_session, slug="plush")
+        plush.category = ProductCategory.PLUSH
+        plush.price_cents = 4999
+        await db_session.commit()
+
+        response = await client.post(
+            "/admin/products/bulk/reprice",
+            json={"category": "plush", "percent": "10"},
+            headers=_auth_header(admin),
+        )
+
+        assert response.json()["updated"] == 1
+        assert response.json()["items"][0]["price_cents"] == 5499  # 5498.9 rounded
+        unchanged = await client.get(
+            f"/admin/products/{nendoroid.id}", headers=_auth_header(admin)
+        )
+        assert unchanged.json()["price_cents"] == 5000
+
+    async def test_reprice_by_ids_and_category_reports_only_missing(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        admin = await _create_admin(db_session)
+        nendoroid = await _create_product(db_session, slug="nendo")
+        plush = await _create_product(db_session, slug="plush")
+        plush.category = ProductCategory.PLUSH
+        await db_session.commit()
+        missing = uuid.uuid4()
+
+        response = await client.post(
+            "/admin/products/bulk/reprice",
+            json={
+                "ids": [str(nendoroid.id), str(plush.id), str(missing)],
+                "category": "plush",
+                "percent": "10",
+            },
+            headers=_auth_header(admin),
+        )
+
+        data = response.json()
+        assert [item["slug"] for item in data["items"]] == ["plush"]
+        assert data["not_found"] == [str(missing)]
+
+    async def test_reprice_by_ids_never_below_one_cent(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        admin = await _create_admin(db_session)
+        product = await _create_product(db_session)
+
+        response = await client.post(
+            "/admin/products/bulk/reprice",
+            json={"ids": [str(product.id)], "percent": -99.99},
+            headers=_auth_header(admin),
+        )
+
+        assert response.json()["items"][0]["price_cents"] == 1
+
+    async def test_reprice_needs_selector(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        admin = await _create_admin(db_session)
+
+        response = await client.post(
+            "/admin/products/bulk/reprice",
+            json={"percent": 10},
+            headers=_auth_header(admin),
+        )
+
+        assert response.status_code == 422
+
+    async def test_bulk_update_invalidates_catalog_cache(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        admin = await _create_admin(db_session)
+        product = await _create_product(db_session)
+        assert (await client.get("/products/test-figure")).json()["price_cents"] == 5000
+
+        await client.patch(
+            "/admin/products/bulk",
+            json={"ids": [str(product.id)], "changes": {"price_cents": 6000}},
+            headers=_auth_header(admin),
+        )
+
+        assert (await client.get("/products/test-figure")).json()["price_cents"] == 6000
+
+
+class TestAdminWriteStatements:
+    """Each single-product admin write is exactly one SQL statement."""
+
+    async def _warm_auth(self, client: AsyncClient, admin: AdminUser) -> None:
+        # The first request looks the admin up; later ones hit the auth cache.
+        await client.get("/admin/products?include_total=false", headers=_auth_header(admin))
+
+    async def test_create_is_one_insert(
+        self, client: AsyncClient, db_session: AsyncSession, sql_statements: list[str]
+    ) -> None:
+        admin = await _create_admin(db_session)
+        await self._warm_auth(client, admin)
+        sql_statements.clear()
+
+        response = await client.post(
+            "/admin/products",
+            json={
+                "name": "One Statement",
+                "slug": "one-statement",
+                "description": "Inserted with RETURNING.",
+                "price_cents": 1000,
+                "condition": "new",
+                "category": "goods",
+                "image_url": "https://example.com/one.jpg",
+            },
+            headers=_auth_header(admin),
+        )
+
+        assert response.status_code == 201
+        assert response.json()["is_available"] is True
+        assert len(sql_statements) == 1
+        assert sql_statements[0].startswith("INSERT INTO products")
+
+    async def test_update_is_one_update(
+        self, client: AsyncClient, db_session: AsyncSession, sql_statements: list[str]
+    ) -> None:
+        admin = await _create_admin(db_session)
+        product = await _create_product(db_session)
+        await self._warm_auth(client, admin)
+        sql_statements.clear()
+
+        response = await client.put(
+            f"/admin/products/{product.id}",
+            json={"price_cents": 7000},
+            headers=_auth_header(admin),
+        )
+
+        assert response.json()["price_cents"] == 7000
+        assert len(sql_statements) == 1
+        assert sql_statements[0].startswith("UPDATE products")
+
+    async def test_delete_is_one_update(
+        self, client: AsyncClient, db_session: AsyncSession, sql_statements: list[str]
+    ) -> None:
+        admin = await _create_admin(db_session)
+        product = await _create_product(db_session)
+        await self._warm_auth(client, admin)
+        sql_statements.clear()
+
+        response = await client.delete(
+            f"/admin/products/{product.id}", headers=_auth_header(admin)
+        )
+
+        assert response.json()["is_available"] is False
+        assert len(sql_statements) == 1
+        assert sql_statements[0].startswith("UPDATE products")
+
+    async def test_missing_product_is_one_statement(
+        self, client: AsyncClient, db_session: AsyncSession, sql_statements: list[str]
+    ) -> None:
+        admin = await _create_admin(db_session)
+        await self._warm_auth(client, admin)
+        sql_statements.clear()
+
+        response = await client.put(
+            f"/admin/products/{uuid.uuid4()}",
+            json={"price_cents": 7000},
+            headers=_auth_header(admin),
+        )
+
+        assert response.status_code == 404
+        assert len(sql_statements) == 1
+
+    async def test_empty_update_does_not_write(
+        self, client: AsyncClient, db_session: AsyncSession, sql_statements: list[str]
+    ) -> None:
+        admin = await _create_admin(db_session)
+        product = await _create_product(db_session)
+        await self._warm_auth(client, admin)
+        sql_statements.clear()
+
+        response = await client.put(
+            f"/admin/products/{product.id}", json={}, headers=_auth_header(admin)
+        )
+
+        assert response.json()["updated_at"] == product.updated_at.isoformat()
+        assert len(sql_statements) == 1
+        assert sql_statements[0].startswith("SELECT")
+
+    async def test_bulk_update_is_one_update(
+        self, client: AsyncClient, db_session: AsyncSession, sql_statements: list[str]
+    ) -> None:
+        admin = await _create_admin(db_session)
+        products = [await _create_product(db_session, slug=f"many-{i}") for i in range(20)]
+        await self._warm_auth(client, admin)
+        sql_statements.clear()
+
+        response = await client.patch(
+            "/admin/products/bulk",
+            json={"ids": [str(p.id) for p in products], "changes": {"quantity": 0}},
+            headers=_auth_header(admin),
+        )
+
+        assert response.json()["updated"] == 20
+        assert len(sql_statements) == 1
+
+    async def test_update_slug_conflict(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        admin = await _create_admin(db_session)
+        await _create_product(db_session, slug="taken")
+        product = await _create_product(db_session, slug="mine")
+
+        response = await client.put(
+            f"/admin/products/{product.id}",
+            json={"slug": "taken"},
+            headers=_auth_header(admin),
+        )
+
+        assert response.status_code == 409
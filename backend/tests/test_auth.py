@@ -1,10 +1,27 @@
 """Tests for auth endpoints (POST /auth/login) and JWT validation."""
 
+import asyncio
+import time
+import weakref
+from datetime import timedelta
+
+import jwt
+import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
 from app.models.admin_user import AdminUser
-from app.utils.security import create_access_token, hash_password
+from app.rate_limit import limiter
+from app.services import auth as auth_service
+from app.services.auth import admin_cache, invalidate_admin, token_cache
+from app.utils import security
+from app.utils.security import (
+    PasswordHasherBusyError,
+    create_access_token,
+    hash_password,
+    verify_password_async,
+)
 
 
 async def _create_admin(
@@ -130,3 +147,143 @@ class TestJWTValidation:
             headers={"Authorization": f"Bearer {token}"},
         )
         assert response.status_code == 200
+
+
+class TestAuthCache:
+    """Verified tokens and admin lookups are cached per process."""
+
+    async def test_repeat_requests_hit_cache(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        admin = await _create_admin(db_session)
+        headers = {"Authorization": f"Bearer {create_access_token(subject=str(admin.id))}"}
+        token_hits, admin_hits = token_cache.stats.hits, admin_cache.stats.hits
+
+        await client.get("/admin/products", headers=headers)
+        response = await client.get("/admin/products", headers=headers)
+
+        assert response.status_code == 200
+        assert token_cache.stats.hits == token_hits + 1
+        assert admin_cache.stats.hits == admin_hits + 1
+
+    async def test_deleted_admin_rejected_immediately(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        admin = await _create_admin(db_session)
+        headers = {"Authorization": f"Bearer {create_access_token(subject=str(admin.id))}"}
+        assert (await client.get("/admin/products", headers=headers)).status_code == 200
+
+        await db_session.delete(admin)
+        await db_session.commit()
+        invalidate_admin(admin.id)
+
+        response = await client.get("/admin/products", headers=headers)
+        assert response.status_code == 401
+
+    async def test_invalidate_admin_evicts_cached_admin(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        admin = await _create_admin(db_session)
+        headers = {"Authorization": f"Bearer {create_access_token(subject=str(admin.id))}"}
+        await client.get("/admin/products", headers=headers)
+        assert admin_cache.get(admin.id) is not None
+
+        invalidate_admin(admin.id)
+
+        assert admin_cache.get(admin.id) is None
+
+    async def test_cached_token_still_expires(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        admin = await _create_admin(db_session)
+        token = create_access_token(subject=str(admin.id), expires_delta=timedelta(seconds=1))
+        headers = {"Authorization": f"Bearer {token}"}
+        assert (await client.get("/admin/products", headers=headers)).status_code == 200
+
+        await asyncio.sleep(1.1)
+
+        response = await client.get("/admin/products", headers=headers)
+        assert response.status_code == 401
+
+    async def test_signed_token_without_exp_rejected(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        admin = await _create_admin(db_session)
+        token = jwt.encode({"sub": str(admin.id)}, settings.secret_key, algorithm="HS256")
+
+        response = await client.get(
+            "/admin/products", headers={"Authorization": f"Bearer {token}"}
+        )
+        assert response.status_code == 401
+
+
+class TestPasswordHashPool:
+    """bcrypt runs in a bounded thread pool, off the event loop."""
+
+    async def test_login_burst_does_not_block_event_loop(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(settings, "password_hash_rounds", 12)  # production cost
+        hashed = hash_password("testpass123")
+        gaps: list[float] = []
+        done = asyncio.Event()
+
+        async def ticker() -> None:
+            # Each sleep should wake within a few ms unless the loop is blocked.
+            while not done.is_set():
+                start = time.perf_counter()
+                await asyncio.sleep(0.005)
+                gaps.append(time.perf_counter() - start)
+
+        ticking = asyncio.create_task(ticker())
+        burst_start = time.perf_counter()
+        results = await asyncio.gather(
+            *(verify_password_async("testpass123", hashed) for _ in range(4))
+        )
+        burst = time.perf_counter() - burst_start
+        done.set()
+        await ticking
+
+        assert all(results)
+        # One bcrypt check takes far longer than this; inline it would
+        # show up as a single gap of the whole check.
+        assert max(gaps) < burst / 4
+
+    async def test_queue_timeout_raises_busy(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(settings, "password_hash_max_concurrency", 1)
+        monkeypatch.setattr(settings, "password_hash_queue_timeout_seconds", 0.01)
+        # Slots are created per event loop on first use; the test loop is
+        # shared, so start from none to pick up the setting above.
+        monkeypatch.setattr(security, "_bcrypt_slots", weakref.WeakKeyDictionary())
+        # Slow enough that the second check can't get the slot in time.
+        monkeypatch.setattr(settings, "password_hash_rounds", 12)
+        hashed = hash_password("testpass123")
+
+        results = await asyncio.gather(
+            verify_password_async("testpass123", hashed),
+            verify_password_async("testpass123", hashed),
+            return_exceptions=True,
+        )
+
+        assert results.count(True) == 1
+        assert sum(isinstance(r, PasswordHasherBusyError) for r in results) == 1
+
+    async def test_login_returns_503_when_busy(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        async def busy(*_args: str) -> bool:
+            raise PasswordHasherBusyError
+
+        limiter.reset()
+        await _create_admin(db_session)
+        monkeypatch.setattr(auth_service, "verify_password_async", busy)
+
+        response = await client.post(
+            "/auth/login",
+            json={"email": "admin@test.com", "password": "testpass123"},
+        )
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "1"
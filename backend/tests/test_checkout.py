@@ -0,0 +1,346 @@
+"""Tests for POST /checkout/create-session and the checkout service."""
+
+import time
+import uuid
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+import stripe
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import MIN_RESERVATION_TTL_SECONDS, Settings, settings
+from app.dependencies import get_stripe_client
+from app.main import app
+from app.models.product import Product, ProductCategory, ProductCondition
+from app.models.reservation import ProductReservation
+from app.services import checkout as checkout_service
+from app.services.checkout import (
+    PRODUCT_IDS_PER_METADATA_KEY,
+    STRIPE_MIN_SESSION_SECONDS,
+    product_ids_from_metadata,
+    product_ids_metadata,
+    stripe_expires_at,
+)
+from app.services.reservation import ReservationBusyError
+
+
+class StubCheckoutSessions:
+    """Records `checkout.sessions.create_async` calls instead of calling Stripe."""
+
+    def __init__(self) -> None:
+        self.calls: list[dict[str, Any]] = []
+        self.error: Exception | None = None
+
+    async def create_async(self, params: dict[str, Any]) -> SimpleNamespace:
+        if self.error is not None:
+            raise self.error
+        self.calls.append(params)
+        session_id = f"cs_test_{len(self.calls)}"
+        return SimpleNamespace(id=session_id, url=f"https://checkout.stripe.test/{session_id}")
+
+
+@pytest.fixture
+def stripe_sessions(client: AsyncClient) -> StubCheckoutSessions:
+    """Stub Stripe client for the app (depends on `client`, which clears overrides)."""
+    sessions = StubCheckoutSessions()
+    stub = SimpleNamespace(checkout=SimpleNamespace(sessions=sessions))
+    app.dependency_overrides[get_stripe_client] = lambda: stub
+    return sessions
+
+
+async def _create_product(
+    session: AsyncSession,
+    slug: str = "test-figure",
+    price_cents: int = 5000,
+    is_available: bool = True,
+) -> Product:
+    product = Product(
+        name=f"Figure {slug}",
+        slug=slug,
+        description="A test figurine.",
+        price_cents=price_cents,
+        condition=ProductCondition.NEW,
+        category=ProductCategory.NENDOROID,
+        image_url=f"https://example.com/{slug}.jpg",
+        is_available=is_available,
+        quantity=1 if is_available else 0,
+    )
+    session.add(product)
+    await session.commit()
+    return product
+
+
+def _cart(*ids: uuid.UUID) -> dict[str, Any]:
+    return {"items": [{"product_id": str(product_id)} for product_id in ids]}
+
+
+class TestCreateCheckoutSession:
+    """POST /checkout/create-session"""
+
+    async def test_happy_path(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        stripe_sessions: StubCheckoutSessions,
+    ) -> None:
+        first = await _create_product(db_session, "first", price_cents=1200)
+        second = await _create_product(db_session, "second", price_cents=3400)
+
+        response = await client.post("/checkout/create-session", json=_cart(first.id, second.id))
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "checkout_url": "https://checkout.stripe.test/cs_test_1",
+            "session_id": "cs_test_1",
+        }
+        [params] = stripe_sessions.calls
+        assert params["mode"] == "payment"
+        assert [item["price_data"]["product_data"]["name"] for item in params["line_items"]] == [
+            "Figure first",
+            "Figure second",
+        ]
+        assert product_ids_from_metadata(params["metadata"]) == [first.id, second.id]
+
+    async def test_uses_database_prices(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        stripe_sessions: StubCheckoutSessions,
+    ) -> None:
+        product = await _create_product(db_session, price_cents=8800)
+        body = {"items": [{"product_id": str(product.id), "price_cents": 1}]}
+
+        response = await client.post("/checkout/create-session", json=body)
+
+        assert response.status_code == 200
+        [line_item] = stripe_sessions.calls[0]["line_items"]
+        assert line_item["price_data"]["unit_amount"] == 8800
+        assert line_item["quantity"] == 1
+
+    async def test_empty_cart(
+        self, client: AsyncClient, stripe_sessions: StubCheckoutSessions
+    ) -> None:
+        response = await client.post("/checkout/create-session", json={"items": []})
+
+        assert response.status_code == 422
+        assert stripe_sessions.calls == []
+
+    async def test_more_items_than_stripe_allows(
+        self, client: AsyncClient, stripe_sessions: StubCheckoutSessions
+    ) -> None:
+        response = await client.post(
+            "/checkout/create-session", json=_cart(*(uuid.uuid4() for _ in range(101)))
+        )
+
+        assert response.status_code == 422
+
+    async def test_nonexistent_product(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        stripe_sessions: StubCheckoutSessions,
+    ) -> None:
+        product = await _create_product(db_session)
+        unknown = uuid.uuid4()
+
+        response = await client.post("/checkout/create-session", json=_cart(product.id, unknown))
+
+        assert response.status_code == 404
+        assert response.json()["detail"]["missing"] == [str(unknown)]
+        assert stripe_sessions.calls == []
+
+    async def test_unavailable_product(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        stripe_sessions: StubCheckoutSessions,
+    ) -> None:
+        sold = await _create_product(db_session, "sold", is_available=False)
+        fine = await _create_product(db_session, "fine")
+
+        response = await client.post("/checkout/create-session", json=_cart(fine.id, sold.id))
+
+        assert response.status_code == 409
+        assert response.json()["detail"]["unavailable"] == [str(sold.id)]
+        assert stripe_sessions.calls == []
+
+    async def test_duplicate_product(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        stripe_sessions: StubCheckoutSessions,
+    ) -> None:
+        product = await _create_product(db_session)
+
+        response = await client.post("/checkout/create-session", json=_cart(product.id, product.id))
+
+        assert response.status_code == 422
+        assert response.json()["detail"]["duplicates"] == [str(product.id)]
+
+    async def test_reports_every_problem_at_once(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        stripe_sessions: StubCheckoutSessions,
+    ) -> None:
+        fine = await _create_product(db_session, "fine")
+        sold = await _create_product(db_session, "sold", is_available=False)
+        unknown = uuid.uuid4()
+
+        response = await client.post(
+            "/checkout/create-session", json=_cart(fine.id, sold.id, unknown, fine.id)
+        )
+
+        assert response.status_code == 404  # missing wins over the rest
+        detail = response.json()["detail"]
+        assert detail["missing"] == [str(unknown)]
+        assert detail["unavailable"] == [str(sold.id)]
+        assert detail["duplicates"] == [str(fine.id)]
+
+    async def test_same_queries_for_any_cart_size(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        stripe_sessions: StubCheckoutSessions,
+        sql_statements: list[str],
+    ) -> None:
+        products = [await _create_product(db_session, f"item-{i}") for i in range(20)]
+        sql_statements.clear()
+
+        response = await client.post(
+            "/checkout/create-session", json=_cart(*(p.id for p in products))
+        )
+
+        assert response.status_code == 200
+        assert len(stripe_sessions.calls[0]["line_items"]) == 20
+        lookup, lock_timeout, reserve = sql_statements
+        assert "= ANY" in lookup
+        assert "lock_timeout" in lock_timeout
+        assert "INSERT INTO product_reservations" in reserve
+
+    async def test_reserves_the_items(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        stripe_sessions: StubCheckoutSessions,
+    ) -> None:
+        product = await _create_product(db_session)
+
+        response = await client.post("/checkout/create-session", json=_cart(product.id))
+
+        assert response.status_code == 200
+        [params] = stripe_sessions.calls
+        [reservation] = (await db_session.scalars(select(ProductReservation))).all()
+        assert str(reservation.hold_id) == params["client_reference_id"]
+        assert reservation.product_id == product.id
+        # Stripe's 30-minute minimum, with room to spare for the trip to Stripe.
+        assert params["expires_at"] >= time.time() + 30 * 60 + 30
+        await db_session.refresh(product)
+        assert product.quantity == 0
+
+    async def test_item_reserved_by_someone_else(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        stripe_sessions: StubCheckoutSessions,
+    ) -> None:
+        taken = await _create_product(db_session, "taken")
+        fine = await _create_product(db_session, "fine")
+        await client.post("/checkout/create-session", json=_cart(taken.id))
+
+        response = await client.post("/checkout/create-session", json=_cart(fine.id, taken.id))
+
+        assert response.status_code == 409
+        assert response.json()["detail"]["unavailable"] == [str(taken.id)]
+        assert len(stripe_sessions.calls) == 1
+        await db_session.refresh(fine)
+        assert fine.quantity == 1  # all or nothing
+
+    async def test_stripe_error(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        stripe_sessions: StubCheckoutSessions,
+    ) -> None:
+        product = await _create_product(db_session)
+        stripe_sessions.error = stripe.APIConnectionError("network down")
+
+        response = await client.post("/checkout/create-session", json=_cart(product.id))
+
+        assert response.status_code == 502
+        # The hold is released right away, not left for the sweeper.
+        assert (await db_session.scalars(select(ProductReservation))).all() == []
+        await db_session.refresh(product)
+        assert product.quantity == 1
+
+    async def test_reservation_lock_timeout(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        stripe_sessions: StubCheckoutSessions,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        product = await _create_product(db_session)
+
+        async def busy(*_args: Any) -> None:
+            raise ReservationBusyError("Timed out waiting for a product row lock")
+
+        monkeypatch.setattr(checkout_service, "reserve_products", busy)
+
+        response = await client.post("/checkout/create-session", json=_cart(product.id))
+
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "1"
+        assert stripe_sessions.calls == []
+
+    async def test_stripe_not_configured(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(settings, "stripe_secret_key", "")
+        product = await _create_product(db_session)
+
+        response = await client.post("/checkout/create-session", json=_cart(product.id))
+
+        assert response.status_code == 503
+
+
+class TestStripeExpiresAt:
+    """Sessions expire before their reservation, but never under Stripe's minimum."""
+
+    def test_just_before_the_reservation(self) -> None:
+        now = 1_700_000_000.9
+
+        assert stripe_expires_at(now) == int(now) + settings.reservation_ttl_seconds - 300
+
+    def test_never_under_stripes_minimum(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        # Only reachable if the settings check were bypassed.
+        monkeypatch.setattr(settings, "reservation_ttl_seconds", STRIPE_MIN_SESSION_SECONDS)
+        now = 1_700_000_000.9
+
+        assert stripe_expires_at(now) >= now + STRIPE_MIN_SESSION_SECONDS + 30
+
+    def test_settings_reject_a_ttl_too_short_for_stripe(self) -> None:
+        with pytest.raises(ValueError, match="reservation_ttl_seconds"):
+            Settings(reservation_ttl_seconds=MIN_RESERVATION_TTL_SECONDS - 1)
+
+
+class TestProductIdsMetadata:
+    """Product ids round-trip through Stripe's 500-character metadata values."""
+
+    def test_round_trip_for_a_full_cart(self) -> None:
+        ids = [uuid.uuid4() for _ in range(100)]
+
+        metadata = product_ids_metadata(ids)
+
+        assert len(metadata) == -(-100 // PRODUCT_IDS_PER_METADATA_KEY)
+        assert all(len(value) <= 500 for value in metadata.values())
+        assert product_ids_from_metadata(metadata) == ids
+
+    def test_no_ids(self) -> None:
+        assert product_ids_from_metadata({"other": "value"}) == []
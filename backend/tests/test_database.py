@@ -0,0 +1,70 @@
+"""Tests for engine configuration and pool instrumentation (app/database.py)."""
+
+import pytest
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.config import settings
+from app.database import _connect_args
+from app.utils.db_pool import InstrumentedAsyncQueuePool
+
+
+class TestConnectArgs:
+    """Settings → asyncpg connection options."""
+
+    def test_statement_timeout_disabled_by_default(self) -> None:
+        assert "server_settings" not in _connect_args()
+
+    def test_statement_timeout_sent_as_server_setting(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(settings, "db_statement_timeout_ms", 2500)
+        monkeypatch.setattr(settings, "db_prepared_statement_cache_size", 0)
+
+        connect_args = _connect_args()
+
+        assert connect_args["server_settings"] == {"statement_timeout": "2500"}
+        assert connect_args["prepared_statement_cache_size"] == 0
+
+    async def test_statement_timeout_cancels_slow_queries(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(settings, "db_statement_timeout_ms", 50)
+        engine = create_async_engine(settings.test_database_url, connect_args=_connect_args())
+        try:
+            async with engine.connect() as conn:
+                with pytest.raises(exc.DBAPIError, match="statement timeout"):
+                    await conn.execute(text("SELECT pg_sleep(1)"))
+        finally:
+            await engine.dispose()
+
+
+class TestInstrumentedPool:
+    """Checkout wait times and timeouts are recorded per pool."""
+
+    async def test_records_checkouts_and_timeouts(self) -> None:
+        engine = create_async_engine(
+            settings.test_database_url,
+            poolclass=InstrumentedAsyncQueuePool,
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=0.05,
+        )
+        pool = engine.sync_engine.pool
+        assert isinstance(pool, InstrumentedAsyncQueuePool)
+        try:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+                assert pool.checkedout() == 1
+                # The only connection is in use, so this one waits, then times out.
+                with pytest.raises(exc.TimeoutError):
+                    async with engine.connect():
+                        pass
+        finally:
+            await engine.dispose()
+
+        stats = pool.checkout_stats
+        assert stats.wait_ms.count == 2
+        assert stats.timeouts == 1
+        # The timed-out checkout waited out the 50ms pool_timeout.
+        assert stats.wait_ms.mean >= 25
@@ -0,0 +1,73 @@
+"""Tests for admin diagnostics endpoints (/admin/diagnostics)."""
+
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.admin_user import AdminUser
+from app.utils.security import create_access_token, hash_password
+
+
+async def _create_admin(session: AsyncSession) -> AdminUser:
+    admin = AdminUser(
+        email="admin@test.com",
+        password_hash=hash_password("testpass"),
+    )
+    session.add(admin)
+    await session.commit()
+    await session.refresh(admin)
+    return admin
+
+
+def _auth_header(admin: AdminUser) -> dict[str, str]:
+    token = create_access_token(subject=str(admin.id))
+    return {"Authorization": f"Bearer {token}"}
+
+
+class TestCacheStats:
+    """GET /admin/diagnostics/caches — in-process cache counters."""
+
+    async def test_counts_catalog_hits_and_misses(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        admin = await _create_admin(db_session)
+        before = (
+            await client.get("/admin/diagnostics/caches", headers=_auth_header(admin))
+        ).json()["catalog_responses"]
+
+        await client.get("/products")  # miss
+        await client.get("/products")  # hit
+
+        response = await client.get("/admin/diagnostics/caches", headers=_auth_header(admin))
+        assert response.status_code == 200
+        after = response.json()["catalog_responses"]
+        assert after["misses"] == before["misses"] + 1
+        assert after["hits"] == before["hits"] + 1
+        assert after["size"] == 1
+        assert {"product_counts", "auth_tokens", "admin_users"} <= response.json().keys()
+
+    async def test_requires_auth(self, client: AsyncClient) -> None:
+        response = await client.get("/admin/diagnostics/caches")
+        assert response.status_code == 403
+
+
+class TestPoolStats:
+    """GET /admin/diagnostics/pool — connection pool state."""
+
+    async def test_reports_pool_configuration(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        admin = await _create_admin(db_session)
+
+        response = await client.get("/admin/diagnostics/pool", headers=_auth_header(admin))
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["size"] == settings.db_pool_size
+        assert data["max_overflow"] == settings.db_max_overflow
+        assert data["timeout_seconds"] == settings.db_pool_timeout_seconds
+        assert "+Inf" in data["wait_ms_buckets"]
+
+    async def test_requires_auth(self, client: AsyncClient) -> None:
+        response = await client.get("/admin/diagnostics/pool")
+        assert response.status_code == 403
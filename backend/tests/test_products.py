@@ -1,9 +1,18 @@
 """Tests for public product endpoints (GET /products, GET /products/{slug})."""
 
+from datetime import datetime
+
+import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.product import Product, ProductCategory, ProductCondition
+from app.schemas.product import (
+    PaginatedProductResponse,
+    ProductResponse,
+    ProductSummaryResponse,
+)
+from app.services.product import invalidate_product_caches
 
 
 async def _create_product(
@@ -11,6 +20,7 @@ async def _create_product(
     *,
     name: str = "Test Figure",
     slug: str = "test-figure",
+    description: str = "A test figurine for testing purposes.",
     price_cents: int = 5000,
     condition: ProductCondition = ProductCondition.NEW,
     category: ProductCategory = ProductCategory.NENDOROID,
@@ -20,7 +30,7 @@ async def _create_product(
     product = Product(
         name=name,
         slug=slug,
-        description="A test figurine for testing purposes.",
+        description=description,
         price_cents=price_cents,
         condition=condition,
         category=category,
@@ -110,6 +120,51 @@ class TestListProducts:
         data = response.json()
         assert data["total"] == 1
 
+    async def test_search_ranked_by_similarity(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        """Closer name matches come first, even when they're older."""
+        await _create_product(db_session, slug="miku", name="Hatsune Miku")
+        await _create_product(
+            db_session, slug="miku-racing", name="Hatsune Miku Racing Ver. 2024 Deluxe Nendoroid"
+        )
+
+        response = await client.get("/products?search=hatsune miku")
+        slugs = [item["slug"] for item in response.json()["items"]]
+        assert slugs == ["miku", "miku-racing"]
+
+    async def test_search_cursor_pagination(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        await _create_product(db_session, slug="miku", name="Miku")
+        await _create_product(db_session, slug="miku-v2", name="Miku V2")
+        await _create_product(db_session, slug="miku-deluxe", name="Miku Deluxe Edition")
+        await _create_product(db_session, slug="rem", name="Rem")
+
+        seen: list[str] = []
+        data = (await client.get("/products?search=miku&per_page=1")).json()
+        seen += [item["slug"] for item in data["items"]]
+        while data["next_cursor"] is not None:
+            data = (
+                await client.get(
+                    "/products",
+                    params={"search": "miku", "per_page": 1, "cursor": data["next_cursor"]},
+                )
+            ).json()
+            seen += [item["slug"] for item in data["items"]]
+
+        assert seen == ["miku", "miku-v2", "miku-deluxe"]
+
+    async def test_search_cursor_rejected_without_search(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        await _create_product(db_session, slug="miku", name="Miku")
+        await _create_product(db_session, slug="miku-v2", name="Miku V2")
+
+        first = (await client.get("/products?search=miku&per_page=1")).json()
+        response = await client.get("/products", params={"cursor": first["next_cursor"]})
+        assert response.status_code == 400
+
     async def test_pagination(
         self, client: AsyncClient, db_session: AsyncSession
     ) -> None:
@@ -151,6 +206,158 @@ class TestListProducts:
         assert "updated_at" in item
 
 
+class TestCursorPagination:
+    """GET /products?cursor=... — keyset pagination."""
+
+    @pytest.mark.commits
+    async def test_walks_all_pages_without_overlap(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        for i in range(5):
+            await _create_product(db_session, slug=f"item-{i}", name=f"Item {i}")
+
+        seen: list[str] = []
+        response = await client.get("/products?per_page=2")
+        data = response.json()
+        seen += [item["slug"] for item in data["items"]]
+
+        while data["next_cursor"] is not None:
+            response = await client.get(
+                "/products", params={"per_page": 2, "cursor": data["next_cursor"]}
+            )
+            assert response.status_code == 200
+            data = response.json()
+            seen += [item["slug"] for item in data["items"]]
+
+        # Newest first, every product exactly once
+        assert seen == [f"item-{i}" for i in reversed(range(5))]
+
+    async def test_matches_offset_order(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        for i in range(4):
+            await _create_product(db_session, slug=f"item-{i}", name=f"Item {i}")
+
+        first = (await client.get("/products?per_page=2")).json()
+        by_cursor = await client.get(
+            "/products", params={"per_page": 2, "cursor": first["next_cursor"]}
+        )
+        by_offset = await client.get("/products?page=2&per_page=2")
+
+        assert by_cursor.json()["items"] == by_offset.json()["items"]
+
+    async def test_no_next_cursor_on_last_page(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        await _create_product(db_session)
+
+        response = await client.get("/products?per_page=1")
+        assert response.json()["next_cursor"] is None
+
+    @pytest.mark.commits
+    async def test_respects_filters(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        await _create_product(db_session, slug="nendo-1", category=ProductCategory.NENDOROID)
+        await _create_product(db_session, slug="plush-1", category=ProductCategory.PLUSH)
+        await _create_product(db_session, slug="nendo-2", category=ProductCategory.NENDOROID)
+
+        first = (await client.get("/products?category=nendoroid&per_page=1")).json()
+        response = await client.get(
+            "/products",
+            params={"category": "nendoroid", "per_page": 1, "cursor": first["next_cursor"]},
+        )
+        data = response.json()
+        assert [item["slug"] for item in data["items"]] == ["nendo-1"]
+        assert data["next_cursor"] is None
+
+    async def test_invalid_cursor(self, client: AsyncClient) -> None:
+        response = await client.get("/products?cursor=not-a-cursor")
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid pagination cursor"
+
+
+class TestListingTotals:
+    """Listing totals — opt-out and per-filter caching."""
+
+    async def test_include_total_false_skips_count(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        await _create_product(db_session)
+
+        response = await client.get("/products?include_total=false")
+        data = response.json()
+        assert data["total"] is None
+        assert data["pages"] is None
+        assert len(data["items"]) == 1
+
+    async def test_total_cached_per_filter_combination(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        await _create_product(db_session, slug="nendo", category=ProductCategory.NENDOROID)
+        assert (await client.get("/products")).json()["total"] == 1
+
+        # Inserted behind the service's back — the cached total doesn't see it...
+        await _create_product(db_session, slug="plush", category=ProductCategory.PLUSH)
+        assert (await client.get("/products")).json()["total"] == 1
+
+        # ...but a different filter combination is counted fresh.
+        assert (await client.get("/products?category=plush")).json()["total"] == 1
+
+
+class TestSearchProducts:
+    """GET /products/search — full-text search over name + description."""
+
+    async def test_matches_description(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        await _create_product(
+            db_session,
+            slug="eva",
+            name="Unit-01 1/4 Scale",
+            description="Evangelion Unit-01 with LED eyes.",
+        )
+        await _create_product(db_session, slug="kirby", name="Kirby Plush")
+
+        response = await client.get("/products/search?q=evangelion")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 1
+        assert data["items"][0]["slug"] == "eva"
+        assert "<mark>Evangelion</mark>" in data["items"][0]["snippet"]
+
+    async def test_stemming(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        await _create_product(db_session, slug="set", description="Three keychains in a set.")
+
+        response = await client.get("/products/search?q=keychain")
+        assert response.json()["total"] == 1
+
+    async def test_name_match_ranks_first(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        await _create_product(db_session, slug="mentions", description="Pairs well with Gojo.")
+        await _create_product(db_session, slug="gojo", name="Gojo Nendoroid")
+
+        response = await client.get("/products/search?q=gojo")
+        items = response.json()["items"]
+        assert [item["slug"] for item in items] == ["gojo", "mentions"]
+        assert items[0]["rank"] > items[1]["rank"]
+
+    async def test_hides_unavailable(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        await _create_product(db_session, name="Rem Figure", is_available=False)
+
+        response = await client.get("/products/search?q=rem")
+        assert response.json()["total"] == 0
+
+    async def test_requires_query(self, client: AsyncClient) -> None:
+        response = await client.get("/products/search")
+        assert response.status_code == 422
+
+
 class TestGetProduct:
     """GET /products/{slug} — single product detail."""
 
@@ -167,3 +374,249 @@ class TestGetProduct:
         response = await client.get("/products/does-not-exist")
         assert response.status_code == 404
         assert response.json()["detail"] == "Product not found"
+
+
+class TestCatalogCache:
+    """Public catalog responses are served from the in-process cache."""
+
+    async def test_detail_served_from_cache(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        product = await _create_product(db_session, slug="my-figure", name="Original")
+        first = await client.get("/products/my-figure")
+
+        # Changed behind the service's back — the cached body is still served.
+        product.name = "Renamed"
+        await db_session.commit()
+
+        second = await client.get("/products/my-figure")
+        assert second.content == first.content
+        assert second.json()["name"] == "Original"
+
+    async def test_not_found_is_not_cached(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        assert (await client.get("/products/late-arrival")).status_code == 404
+
+        await _create_product(db_session, slug="late-arrival")
+        assert (await client.get("/products/late-arrival")).status_code == 200
+
+    async def test_list_key_normalizes_defaults(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        await _create_product(db_session, slug="first")
+        await client.get("/products")
+
+        await _create_product(db_session, slug="second")
+        # Same params once defaults are filled in → same cache entry.
+        response = await client.get("/products?page=1&per_page=20")
+        assert response.json()["total"] == 1
+
+
+class TestSummaryFields:
+    """`?fields=summary` returns slim card-sized items."""
+
+    async def test_summary_items_have_card_fields_only(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        product = await _create_product(db_session, slug="card")
+
+        response = await client.get("/products?fields=summary")
+        assert response.status_code == 200
+        expected = ProductSummaryResponse.model_validate(product).model_dump(mode="json")
+        assert response.json()["items"] == [expected]
+        assert "description" not in response.json()["items"][0]
+
+    @pytest.mark.commits
+    async def test_summary_cursor_pagination(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        for i in range(3):
+            await _create_product(db_session, slug=f"card-{i}")
+
+        first = (await client.get("/products?fields=summary&per_page=2")).json()
+        second = (
+            await client.get(f"/products?fields=summary&per_page=2&cursor={first['next_cursor']}")
+        ).json()
+        slugs = [item["slug"] for item in first["items"] + second["items"]]
+        assert slugs == ["card-2", "card-1", "card-0"]
+        assert second["next_cursor"] is None
+
+    async def test_summary_with_search(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        await _create_product(db_session, slug="miku", name="Hatsune Miku")
+
+        item = (await client.get("/products?fields=summary&search=miku")).json()["items"][0]
+        assert set(item) == set(ProductSummaryResponse.model_fields)
+
+    async def test_invalid_fields_rejected(self, client: AsyncClient) -> None:
+        response = await client.get("/products?fields=everything")
+        assert response.status_code == 422
+
+
+class TestFastSerialization:
+    """The orjson list path produces what the Pydantic path would."""
+
+    @pytest.mark.commits
+    async def test_list_matches_pydantic_serialization(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        await _create_product(db_session, slug="first", condition=ProductCondition.LIKE_NEW)
+        newest = await _create_product(db_session, slug="second", category=ProductCategory.PLUSH)
+
+        response = await client.get("/products?per_page=1")
+        expected = PaginatedProductResponse(
+            items=[ProductResponse.model_validate(newest)],
+            total=2,
+            page=1,
+            per_page=1,
+            pages=2,
+            next_cursor=response.json()["next_cursor"],
+        )
+        assert response.content == expected.model_dump_json().encode("utf-8")
+
+    async def test_search_rank_is_not_exposed(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        await _create_product(db_session, slug="miku", name="Hatsune Miku")
+
+        item = (await client.get("/products?search=miku")).json()["items"][0]
+        assert set(item) == set(ProductResponse.model_fields)
+
+
+class TestConditionalRequests:
+    """ETag / Last-Modified validators and 304 Not Modified responses."""
+
+    async def test_detail_sends_validators(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        await _create_product(db_session, slug="my-figure")
+
+        response = await client.get("/products/my-figure")
+        assert response.headers["etag"].startswith('"')
+        assert response.headers["last-modified"].endswith("GMT")
+        assert response.headers["cache-control"] == "no-cache"
+
+    async def test_detail_if_none_match(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        await _create_product(db_session, slug="my-figure")
+        etag = (await client.get("/products/my-figure")).headers["etag"]
+
+        # Served from the response cache...
+        cached = await client.get("/products/my-figure", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+        assert cached.headers["etag"] == etag
+
+        # ...and from the version probe when the cache is cold.
+        invalidate_product_caches()
+        probed = await client.get("/products/my-figure", headers={"If-None-Match": etag})
+        assert probed.status_code == 304
+
+    @pytest.mark.commits
+    async def test_detail_changed_after_update(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        product = await _create_product(db_session, slug="my-figure")
+        etag = (await client.get("/products/my-figure")).headers["etag"]
+
+        product.price_cents = 9900
+        await db_session.commit()
+        invalidate_product_caches()
+
+        response = await client.get("/products/my-figure", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        assert response.json()["price_cents"] == 9900
+
+    async def test_list_if_none_match(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        await _create_product(db_session, slug="figure-1")
+        etag = (await client.get("/products")).headers["etag"]
+
+        invalidate_product_caches()
+        response = await client.get("/products", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+    async def test_list_etag_changes_with_rows(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        await _create_product(db_session, slug="figure-1")
+        etag = (await client.get("/products")).headers["etag"]
+
+        await _create_product(db_session, slug="figure-2")
+        invalidate_product_caches()
+
+        response = await client.get("/products", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()["total"] == 2
+
+    async def test_list_etag_differs_per_page(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        for i in range(3):
+            await _create_product(db_session, slug=f"item-{i}")
+
+        page_1 = await client.get("/products?per_page=2")
+        page_2 = await client.get("/products?per_page=2&page=2")
+        assert page_1.headers["etag"] != page_2.headers["etag"]
+
+    async def test_list_miss_without_validators_skips_probe(
+        self, client: AsyncClient, db_session: AsyncSession, sql_statements: list[str]
+    ) -> None:
+        await _create_product(db_session, slug="figure-1")
+        sql_statements.clear()
+
+        response = await client.get("/products?include_total=false&fields=summary")
+        assert response.status_code == 200
+        assert response.headers["etag"].startswith('"')
+        # Just the page query: no version probe, no count.
+        assert len(sql_statements) == 1
+
+    async def test_summary_list_probe_matches_served_etag(
+        self, client: AsyncClient, db_session: AsyncSession, sql_statements: list[str]
+    ) -> None:
+        await _create_product(db_session, slug="figure-1")
+        url = "/products?include_total=false&fields=summary"
+        etag = (await client.get(url)).headers["etag"]
+
+        invalidate_product_caches()
+        sql_statements.clear()
+        response = await client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert len(sql_statements) == 1
+
+    async def test_list_etag_changes_when_page_row_updated(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        product = await _create_product(db_session, slug="figure-1")
+        etag = (await client.get("/products")).headers["etag"]
+
+        product.price_cents = 9900
+        product.updated_at = datetime(2030, 1, 1)
+        await db_session.commit()
+        invalidate_product_caches()
+
+        response = await client.get("/products", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()["items"][0]["price_cents"] == 9900
+
+    async def test_if_modified_since(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        await _create_product(db_session, slug="my-figure")
+        last_modified = (await client.get("/products/my-figure")).headers["last-modified"]
+
+        response = await client.get(
+            "/products/my-figure", headers={"If-Modified-Since": last_modified}
+        )
+        assert response.status_code == 304
+
+        stale = await client.get(
+            "/products/my-figure",
+            headers={"If-Modified-Since": "Mon, 01 Jan 2001 00:00:00 GMT"},
+        )
+        assert stale.status_code == 200
@@ -0,0 +1,87 @@
+"""Tests for the SQLite rate-limit storage (app/utils/rate_limit_storage.py)."""
+
+import multiprocessing
+import sqlite3
+import time
+from pathlib import Path
+
+import pytest
+from limits import parse
+from limits.storage import storage_from_string
+from limits.strategies import FixedWindowRateLimiter, SlidingWindowCounterRateLimiter
+
+from app.utils.rate_limit_storage import SQLiteStorage
+
+LOGIN_LIMIT = parse("5/minute")
+
+
+def _storage_uri(tmp_path: Path) -> str:
+    return f"sqlite:///{tmp_path / 'rate_limits.db'}"
+
+
+def _hit_login_limit(uri: str, attempts: int) -> int:
+    """Run in a child process, like a separate uvicorn worker."""
+    limiter = FixedWindowRateLimiter(storage_from_string(uri))
+    return sum(limiter.hit(LOGIN_LIMIT, "login", "10.0.0.1") for _ in range(attempts))
+
+
+class TestSQLiteStorage:
+    """Counters live in a SQLite file shared by every process that opens it."""
+
+    def test_scheme_is_registered(self, tmp_path: Path) -> None:
+        assert isinstance(storage_from_string(_storage_uri(tmp_path)), SQLiteStorage)
+
+    def test_fixed_window_enforces_limit(self, tmp_path: Path) -> None:
+        limiter = FixedWindowRateLimiter(storage_from_string(_storage_uri(tmp_path)))
+
+        results = [limiter.hit(LOGIN_LIMIT, "login", "10.0.0.1") for _ in range(6)]
+
+        assert results == [True] * 5 + [False]
+        # Other clients have their own counter.
+        assert limiter.hit(LOGIN_LIMIT, "login", "10.0.0.2")
+
+    def test_sliding_window_counter_enforces_limit(self, tmp_path: Path) -> None:
+        limiter = SlidingWindowCounterRateLimiter(storage_from_string(_storage_uri(tmp_path)))
+
+        results = [limiter.hit(LOGIN_LIMIT, "login", "10.0.0.1") for _ in range(6)]
+
+        assert results == [True] * 5 + [False]
+        assert limiter.get_window_stats(LOGIN_LIMIT, "login", "10.0.0.1").remaining == 0
+
+    def test_clear_resets_a_key(self, tmp_path: Path) -> None:
+        limiter = FixedWindowRateLimiter(storage_from_string(_storage_uri(tmp_path)))
+        for _ in range(5):
+            limiter.hit(LOGIN_LIMIT, "login", "10.0.0.1")
+
+        limiter.clear(LOGIN_LIMIT, "login", "10.0.0.1")
+
+        assert limiter.hit(LOGIN_LIMIT, "login", "10.0.0.1")
+
+    def test_lock_wait_is_bounded(self, tmp_path: Path) -> None:
+        uri = _storage_uri(tmp_path)
+        limiter = FixedWindowRateLimiter(storage_from_string(uri))
+        limiter.hit(LOGIN_LIMIT, "login", "10.0.0.1")  # creates the file
+        # Another worker stuck holding the write lock.
+        other = sqlite3.connect(uri.removeprefix("sqlite:///"), isolation_level=None)
+        other.execute("BEGIN IMMEDIATE")
+
+        start = time.perf_counter()
+        with pytest.raises(sqlite3.OperationalError, match="locked"):
+            limiter.hit(LOGIN_LIMIT, "login", "10.0.0.1")
+        waited = time.perf_counter() - start
+        other.close()
+
+        # The default wait is tens of ms: a stall this short doesn't hold up
+        # the event loop the check runs on.
+        assert waited < 0.5
+
+    def test_limit_is_shared_across_processes(self, tmp_path: Path) -> None:
+        uri = _storage_uri(tmp_path)
+        storage_from_string(uri).check()  # create the file before the workers race
+
+        ctx = multiprocessing.get_context("spawn")
+        with ctx.Pool(processes=3) as pool:
+            allowed = pool.starmap(_hit_login_limit, [(uri, 5)] * 3)
+
+        # 15 attempts across three "workers", but only 5 allowed in total.
+        assert sum(allowed) == 5
@@ -0,0 +1,157 @@
+"""Tests for the Server-Timing middleware and its SQL query hooks."""
+
+import asyncio
+import logging
+import re
+from collections.abc import AsyncGenerator
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.main import app
+from app.models.product import Product, ProductCategory, ProductCondition
+from app.utils.request_timing import (
+    RequestTimingMiddleware,
+    install_query_hooks,
+    remove_query_hooks,
+)
+from tests.conftest import test_engine
+
+SERVER_TIMING = re.compile(
+    r'db;dur=(?P<db>[\d.]+);desc="(?P<queries>\d+) quer(?:y|ies)", '
+    r"app;dur=(?P<app>[\d.]+), total;dur=(?P<total>[\d.]+)"
+)
+
+
+def _parse(header: str) -> dict[str, float]:
+    match = SERVER_TIMING.fullmatch(header)
+    assert match, header
+    return {key: float(value) for key, value in match.groupdict().items()}
+
+
+def _timed_client(log_min_ms: float = 0.0) -> AsyncClient:
+    return AsyncClient(
+        transport=ASGITransport(app=RequestTimingMiddleware(app, log_min_ms=log_min_ms)),
+        base_url=f"http://test{settings.api_v1_prefix}",
+    )
+
+
+@pytest.fixture
+async def timed_client(client: AsyncClient) -> AsyncGenerator[AsyncClient, None]:
+    """The app behind `RequestTimingMiddleware`, with hooks on the test engine.
+
+    Depends on `client` for its test DB overrides.
+    """
+    install_query_hooks(test_engine)
+    async with _timed_client() as ac:
+        yield ac
+    remove_query_hooks(test_engine)
+
+
+async def _create_product(session: AsyncSession) -> Product:
+    product = Product(
+        name="Timed Figure",
+        slug="timed-figure",
+        description="A figure for timing tests.",
+        price_cents=5000,
+        condition=ProductCondition.NEW,
+        category=ProductCategory.NENDOROID,
+        image_url="https://example.com/test.jpg",
+    )
+    session.add(product)
+    await session.commit()
+    return product
+
+
+class TestServerTimingHeader:
+    @pytest.mark.commits
+    async def test_counts_the_queries_a_request_runs(
+        self,
+        timed_client: AsyncClient,
+        db_session: AsyncSession,
+        sql_statements: list[str],
+    ) -> None:
+        await _create_product(db_session)
+        sql_statements.clear()
+
+        response = await timed_client.get("/products/timed-figure")
+
+        assert response.status_code == 200
+        timing = _parse(response.headers["server-timing"])
+        assert timing["queries"] == len(sql_statements) > 0
+        assert timing["db"] > 0
+        assert timing["total"] >= timing["db"]
+        assert timing["app"] == pytest.approx(timing["total"] - timing["db"], abs=0.11)
+
+    async def test_request_without_queries(self, timed_client: AsyncClient) -> None:
+        response = await timed_client.get("/health/live")
+
+        timing = _parse(response.headers["server-timing"])
+        assert timing["queries"] == 0
+        assert timing["db"] == 0
+
+    async def test_error_responses_are_timed(self, timed_client: AsyncClient) -> None:
+        response = await timed_client.get("/products/no-such-figure")
+
+        assert response.status_code == 404
+        assert _parse(response.headers["server-timing"])["queries"] >= 1
+
+    @pytest.mark.commits
+    async def test_concurrent_requests_keep_their_own_counts(
+        self, timed_client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        await _create_product(db_session)
+
+        responses = await asyncio.gather(
+            *(timed_client.get("/products/timed-figure") for _ in range(3)),
+            *(timed_client.get("/health/live") for _ in range(3)),
+        )
+
+        counts = [_parse(r.headers["server-timing"])["queries"] for r in responses]
+        assert counts[3:] == [0, 0, 0]
+        assert len(set(counts[:3])) == 1
+
+    async def test_queries_outside_requests_are_ignored(
+        self, timed_client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        await db_session.execute(text("SELECT 1"))
+
+        response = await timed_client.get("/health/live")
+
+        assert _parse(response.headers["server-timing"])["queries"] == 0
+
+
+class TestTimingLog:
+    async def test_logs_one_line_per_request(
+        self, timed_client: AsyncClient, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        with caplog.at_level(logging.INFO, logger="app.utils.request_timing"):
+            await timed_client.get("/health/live")
+
+        [record] = caplog.records
+        assert record.request_timing["path"] == f"{settings.api_v1_prefix}/health/live"
+        assert record.request_timing["status"] == 200
+        assert record.request_timing["queries"] == 0
+        assert "queries=0" in record.getMessage()
+
+    async def test_fast_requests_below_threshold_are_not_logged(
+        self, client: AsyncClient, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        with caplog.at_level(logging.INFO, logger="app.utils.request_timing"):
+            async with _timed_client(log_min_ms=60_000) as slow_only:
+                response = await slow_only.get("/health/live")
+
+        assert "server-timing" in response.headers
+        assert caplog.records == []
+
+
+class TestDisabled:
+    async def test_off_by_default(self, client: AsyncClient) -> None:
+        response = await client.get("/health/live")
+
+        assert settings.request_timing_enabled is False
+        assert "server-timing" not in response.headers
+        assert all(m.cls is not RequestTimingMiddleware for m in app.user_middleware)
@@ -0,0 +1,279 @@
+"""Tests for the reservation service and its expiry sweeper."""
+
+import asyncio
+import random
+import time
+import uuid
+from collections.abc import AsyncGenerator
+
+import pytest
+from sqlalchemy import func, select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.config import settings
+from app.models.product import Product, ProductCategory, ProductCondition
+from app.models.reservation import ProductReservation
+from app.services.reservation import (
+    ProductsUnavailableError,
+    ReservationBusyError,
+    ReservationSweeper,
+    release_hold,
+    reserve_products,
+)
+from tests.conftest import TestSessionFactory, test_engine
+
+
+async def _create_product(
+    session: AsyncSession, slug: str = "test-figure", quantity: int = 1
+) -> Product:
+    product = Product(
+        name=f"Figure {slug}",
+        slug=slug,
+        description="A test figurine.",
+        price_cents=5000,
+        condition=ProductCondition.NEW,
+        category=ProductCategory.NENDOROID,
+        image_url=f"https://example.com/{slug}.jpg",
+        quantity=quantity,
+    )
+    session.add(product)
+    await session.commit()
+    return product
+
+
+async def _quantity(session: AsyncSession, product: Product) -> int:
+    await session.refresh(product)
+    return product.quantity
+
+
+async def _reservation_count(session: AsyncSession) -> int:
+    return await session.scalar(select(func.count()).select_from(ProductReservation)) or 0
+
+
+class TestReserveProducts:
+    async def test_takes_one_unit_of_each(
+        self, db_session: AsyncSession, session_factory: TestSessionFactory
+    ) -> None:
+        first = await _create_product(db_session, "first", quantity=3)
+        second = await _create_product(db_session, "second")
+
+        async with session_factory() as session:
+            hold = await reserve_products(session, [first.id, second.id])
+
+        assert hold.product_ids == [first.id, second.id]
+        assert await _quantity(db_session, first) == 2
+        assert await _quantity(db_session, second) == 0
+        rows = (await db_session.scalars(select(ProductReservation))).all()
+        assert {row.product_id for row in rows} == {first.id, second.id}
+        assert {row.hold_id for row in rows} == {hold.hold_id}
+
+    async def test_all_or_nothing(
+        self, db_session: AsyncSession, session_factory: TestSessionFactory
+    ) -> None:
+        fine = await _create_product(db_session, "fine")
+        sold = await _create_product(db_session, "sold", quantity=0)
+        unknown = uuid.uuid4()
+
+        async with session_factory() as session:
+            with pytest.raises(ProductsUnavailableError) as exc_info:
+                await reserve_products(session, [fine.id, sold.id, unknown])
+
+        assert exc_info.value.product_ids == [sold.id, unknown]
+        assert await _quantity(db_session, fine) == 1
+        assert await _reservation_count(db_session) == 0
+
+    async def test_skips_products_taken_down(
+        self, db_session: AsyncSession, session_factory: TestSessionFactory
+    ) -> None:
+        product = await _create_product(db_session)
+        product.is_available = False
+        await db_session.commit()
+
+        async with session_factory() as session:
+            with pytest.raises(ProductsUnavailableError):
+                await reserve_products(session, [product.id])
+
+    async def test_release_hold_restocks(
+        self, db_session: AsyncSession, session_factory: TestSessionFactory
+    ) -> None:
+        product = await _create_product(db_session, quantity=2)
+        async with session_factory() as session:
+            hold = await reserve_products(session, [product.id])
+            other = await reserve_products(session, [product.id])
+
+            assert await release_hold(session, hold.hold_id) == 1
+
+        assert await _quantity(db_session, product) == 1
+        [remaining] = (await db_session.scalars(select(ProductReservation))).all()
+        assert remaining.hold_id == other.hold_id
+
+
+class TestReservationSweeper:
+    async def test_releases_only_expired_holds(
+        self, db_session: AsyncSession, session_factory: TestSessionFactory
+    ) -> None:
+        expiring = await _create_product(db_session, "expiring")
+        live = await _create_product(db_session, "live")
+        async with session_factory() as session:
+            await reserve_products(session, [expiring.id], ttl_seconds=0)
+            await reserve_products(session, [live.id])
+
+        sweeper = ReservationSweeper(session_factory, interval=60, batch_size=100)
+        assert await sweeper.sweep() == 1
+
+        assert await _quantity(db_session, expiring) == 1
+        assert await _quantity(db_session, live) == 0
+        [remaining] = (await db_session.scalars(select(ProductReservation))).all()
+        assert remaining.product_id == live.id
+
+    async def test_sweeps_in_batches(
+        self, db_session: AsyncSession, session_factory: TestSessionFactory
+    ) -> None:
+        product = await _create_product(db_session, quantity=5)
+        async with session_factory() as session:
+            for _ in range(5):
+                await reserve_products(session, [product.id], ttl_seconds=0)
+
+        sweeper = ReservationSweeper(session_factory, interval=60, batch_size=2)
+
+        assert await sweeper.sweep() == 5
+        assert await _quantity(db_session, product) == 5
+        assert await _reservation_count(db_session) == 0
+
+    @pytest.mark.commits
+    async def test_skips_reservations_locked_elsewhere(
+        self, db_session: AsyncSession, session_factory: TestSessionFactory
+    ) -> None:
+        product = await _create_product(db_session, quantity=2)
+        async with session_factory() as session:
+            busy = await reserve_products(session, [product.id], ttl_seconds=0)
+            await reserve_products(session, [product.id], ttl_seconds=0)
+
+        sweeper = ReservationSweeper(session_factory, interval=60, batch_size=100)
+        async with test_engine.connect() as conn, conn.begin():
+            # e.g. a webhook consuming this hold right now
+            await conn.execute(
+                select(ProductReservation.id)
+                .where(ProductReservation.hold_id == busy.hold_id)
+                .with_for_update()
+            )
+            assert await asyncio.wait_for(sweeper.sweep(), timeout=5) == 1
+
+        assert await sweeper.sweep() == 1
+        assert await _quantity(db_session, product) == 2
+
+    async def test_background_task(
+        self, db_session: AsyncSession, session_factory: TestSessionFactory
+    ) -> None:
+        product = await _create_product(db_session)
+        async with session_factory() as session:
+            await reserve_products(session, [product.id], ttl_seconds=0)
+
+        sweeper = ReservationSweeper(session_factory, interval=60, batch_size=100)
+        sweeper.start()
+        for _ in range(100):
+            if not await _reservation_count(db_session):
+                break
+            await asyncio.sleep(0.01)
+        await sweeper.stop()
+
+        assert await _reservation_count(db_session) == 0
+
+
+@pytest.mark.commits
+class TestContention:
+    """Many checkouts for the same rows at once, each on its own connection."""
+
+    ATTEMPTS = 500
+    CONNECTIONS = 50
+
+    @pytest.fixture
+    async def contended_sessions(self) -> AsyncGenerator[async_sessionmaker[AsyncSession], None]:
+        engine = create_async_engine(
+            settings.test_database_url, pool_size=self.CONNECTIONS, max_overflow=0
+        )
+        yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        await engine.dispose()
+
+    async def _attempt(
+        self, sessions: async_sessionmaker[AsyncSession], product_ids: list[uuid.UUID]
+    ) -> tuple[str, float]:
+        """Returns the outcome and the seconds spent in `reserve_products`."""
+        async with sessions() as session:
+            await session.connection()  # waiting for the pool isn't lock wait
+            start = time.perf_counter()
+            try:
+                await reserve_products(session, product_ids)
+            except ProductsUnavailableError:
+                outcome = "unavailable"
+            except ReservationBusyError:
+                outcome = "busy"
+            else:
+                outcome = "reserved"
+            return outcome, time.perf_counter() - start
+
+    async def test_no_oversell_and_bounded_lock_wait(
+        self,
+        db_session: AsyncSession,
+        contended_sessions: async_sessionmaker[AsyncSession],
+    ) -> None:
+        rare = await _create_product(db_session, "rare", quantity=3)
+
+        results = await asyncio.gather(
+            *(self._attempt(contended_sessions, [rare.id]) for _ in range(self.ATTEMPTS))
+        )
+
+        outcomes = [outcome for outcome, _ in results]
+        assert outcomes.count("reserved") == 3
+        assert outcomes.count("unavailable") == self.ATTEMPTS - 3
+        assert await _quantity(db_session, rare) == 0
+        assert await _reservation_count(db_session) == 3
+        # Every attempt finished well inside the lock timeout.
+        slowest = max(seconds for _, seconds in results)
+        assert slowest < settings.reservation_lock_timeout_ms / 1000
+
+    async def test_overlapping_carts_dont_deadlock(
+        self,
+        db_session: AsyncSession,
+        contended_sessions: async_sessionmaker[AsyncSession],
+    ) -> None:
+        products = [await _create_product(db_session, f"drop-{i}", quantity=20) for i in range(5)]
+        ids = [product.id for product in products]
+        rng = random.Random(7)
+        # Same products in different orders: locking in cart order would deadlock.
+        carts = [rng.sample(ids, 3) for _ in range(self.ATTEMPTS)]
+
+        results = await asyncio.gather(*(self._attempt(contended_sessions, cart) for cart in carts))
+
+        assert {outcome for outcome, _ in results} <= {"reserved", "unavailable"}
+        reserved = (
+            await db_session.execute(
+                select(ProductReservation.product_id, func.count()).group_by(
+                    ProductReservation.product_id
+                )
+            )
+        ).all()
+        for product in products:
+            held = dict(reserved).get(product.id, 0)
+            assert held + await _quantity(db_session, product) == 20
+
+    async def test_lock_timeout(
+        self,
+        db_session: AsyncSession,
+        session_factory: TestSessionFactory,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        product = await _create_product(db_session)
+        monkeypatch.setattr(settings, "reservation_lock_timeout_ms", 100)
+
+        async with test_engine.connect() as conn, conn.begin():
+            await conn.execute(
+                update(Product).where(Product.id == product.id).values(price_cents=1)
+            )
+            async with session_factory() as session:
+                with pytest.raises(ReservationBusyError):
+                    await reserve_products(session, [product.id])
+                # The timeout was transaction-local.
+                assert await session.scalar(text("SHOW lock_timeout")) == "0"
+
+        assert await _quantity(db_session, product) == 1
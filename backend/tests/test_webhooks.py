@@ -0,0 +1,404 @@
+"""Tests for POST /webhooks/stripe, the webhook workers, and order creation."""
+
+import asyncio
+import time
+import uuid
+from typing import Any
+
+import pytest
+from httpx import AsyncClient, Response
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.config import settings
+from app.models.order import Order, OrderStatus
+from app.models.product import Product, ProductCategory, ProductCondition
+from app.models.reservation import ProductReservation
+from app.models.webhook_event import WebhookEvent, WebhookEventStatus
+from app.services.order import create_order_from_checkout
+from app.services.reservation import reserve_products
+from app.services.webhook import HANDLERS, WebhookWorkerPool
+from scripts.stripe_events import checkout_session_event, sign_payload, signed_request
+from tests.conftest import TestSessionFactory
+
+WEBHOOK_SECRET = "whsec_test_secret"
+
+
+@pytest.fixture(autouse=True)
+def webhook_secret(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "stripe_webhook_secret", WEBHOOK_SECRET)
+
+
+def _pool(
+    session_factory: TestSessionFactory, handlers: dict[str, Any] = HANDLERS
+) -> WebhookWorkerPool:
+    return WebhookWorkerPool(
+        session_factory,
+        workers=2,
+        poll_interval=0.05,
+        max_attempts=3,
+        retry_base_seconds=2,
+        retry_max_seconds=60,
+        lease_seconds=300,
+        handlers=handlers,
+    )
+
+
+async def _post(client: AsyncClient, event: dict[str, Any]) -> Response:
+    body, headers = signed_request(event, WEBHOOK_SECRET)
+    return await client.post("/webhooks/stripe", content=body, headers=headers)
+
+
+async def _create_product(session: AsyncSession, slug: str, price_cents: int = 5000) -> Product:
+    product = Product(
+        name=f"Figure {slug}",
+        slug=slug,
+        description="A test figurine.",
+        price_cents=price_cents,
+        condition=ProductCondition.NEW,
+        category=ProductCategory.NENDOROID,
+        image_url=f"https://example.com/{slug}.jpg",
+    )
+    session.add(product)
+    await session.commit()
+    return product
+
+
+async def _events(session: AsyncSession) -> list[WebhookEvent]:
+    return list((await session.scalars(select(WebhookEvent))).all())
+
+
+async def _orders(session: AsyncSession) -> list[Order]:
+    result = await session.scalars(select(Order).options(selectinload(Order.items)))
+    return list(result.all())
+
+
+class TestReceiveWebhook:
+    """POST /webhooks/stripe — verify, store, acknowledge."""
+
+    async def test_stores_and_acknowledges(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        event = checkout_session_event(product_ids=[uuid.uuid4()])
+
+        response = await _post(client, event)
+
+        assert response.status_code == 200
+        [stored] = await _events(db_session)
+        assert stored.stripe_event_id == event["id"]
+        assert stored.status == WebhookEventStatus.PENDING
+        assert stored.payload == event
+        assert await _orders(db_session) == []  # handled later, by the workers
+
+    async def test_redelivery_is_stored_once(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        event = checkout_session_event()
+
+        first = await _post(client, event)
+        second = await _post(client, event)
+
+        assert first.status_code == second.status_code == 200
+        assert len(await _events(db_session)) == 1
+
+    async def test_one_statement_per_event(
+        self, client: AsyncClient, sql_statements: list[str]
+    ) -> None:
+        response = await _post(client, checkout_session_event())
+
+        assert response.status_code == 200
+        [statement] = sql_statements
+        assert "ON CONFLICT" in statement
+
+    async def test_unhandled_type_is_not_stored(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        event = checkout_session_event()
+        event["type"] = "customer.created"
+
+        response = await _post(client, event)
+
+        assert response.status_code == 200
+        assert await _events(db_session) == []
+
+    async def test_bad_signature(self, client: AsyncClient, db_session: AsyncSession) -> None:
+        body, headers = signed_request(checkout_session_event(), "whsec_wrong")
+
+        response = await client.post("/webhooks/stripe", content=body, headers=headers)
+
+        assert response.status_code == 400
+        assert await _events(db_session) == []
+
+    async def test_tampered_body(self, client: AsyncClient) -> None:
+        body, headers = signed_request(checkout_session_event(amount_total=100), WEBHOOK_SECRET)
+
+        response = await client.post(
+            "/webhooks/stripe", content=body.replace(b"100", b"1"), headers=headers
+        )
+
+        assert response.status_code == 400
+
+    async def test_stale_signature(self, client: AsyncClient) -> None:
+        body, headers = signed_request(checkout_session_event(), WEBHOOK_SECRET)
+        headers["stripe-signature"] = sign_payload(
+            body, WEBHOOK_SECRET, timestamp=int(time.time()) - 3600
+        )
+
+        response = await client.post("/webhooks/stripe", content=body, headers=headers)
+
+        assert response.status_code == 400
+
+    async def test_missing_signature(self, client: AsyncClient) -> None:
+        response = await client.post("/webhooks/stripe", json=checkout_session_event())
+
+        assert response.status_code == 400
+
+    async def test_not_configured(
+        self, client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(settings, "stripe_webhook_secret", "")
+
+        response = await _post(client, checkout_session_event())
+
+        assert response.status_code == 503
+
+
+class TestWebhookWorkers:
+    async def test_checkout_completed_creates_the_order(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        session_factory: TestSessionFactory,
+    ) -> None:
+        first = await _create_product(db_session, "first", price_cents=1200)
+        second = await _create_product(db_session, "second", price_cents=3400)
+        async with session_factory() as session:
+            hold = await reserve_products(session, [first.id, second.id])
+        event = checkout_session_event(
+            product_ids=[first.id, second.id], hold_id=hold.hold_id, amount_total=4600
+        )
+        await _post(client, event)
+
+        assert await _pool(session_factory).drain() == 1
+
+        [order] = await _orders(db_session)
+        assert order.stripe_checkout_session_id == event["data"]["object"]["id"]
+        assert order.status == OrderStatus.PAID
+        assert order.total_cents == 4600
+        assert order.customer_email == "buyer@example.com"
+        assert order.shipping_address_json["address"]["country"] == "US"
+        assert sorted((i.product_name, i.price_cents) for i in order.items) == [
+            ("Figure first", 1200),
+            ("Figure second", 3400),
+        ]
+        for product in (first, second):
+            await db_session.refresh(product)
+            assert not product.is_available
+            assert product.quantity == 0  # consumed, not restocked
+        assert (await db_session.scalars(select(ProductReservation))).all() == []
+        [stored] = await _events(db_session)
+        assert stored.status == WebhookEventStatus.PROCESSED
+        assert stored.attempts == 1
+
+    async def test_same_session_twice_makes_one_order(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        session_factory: TestSessionFactory,
+    ) -> None:
+        product = await _create_product(db_session, "figure")
+        event = checkout_session_event(product_ids=[product.id], session_id="cs_test_same")
+        retry = checkout_session_event(product_ids=[product.id], session_id="cs_test_same")
+        await _post(client, event)
+        await _post(client, retry)
+
+        assert await _pool(session_factory).drain() == 2
+
+        assert len(await _orders(db_session)) == 1
+        statuses = {stored.status for stored in await _events(db_session)}
+        assert statuses == {WebhookEventStatus.PROCESSED}
+
+    async def test_checkout_expired_releases_the_hold(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        session_factory: TestSessionFactory,
+    ) -> None:
+        product = await _create_product(db_session, "figure")
+        async with session_factory() as session:
+            hold = await reserve_products(session, [product.id])
+        await _post(
+            client,
+            checkout_session_event(
+                "checkout.session.expired", product_ids=[product.id], hold_id=hold.hold_id
+            ),
+        )
+
+        await _pool(session_factory).drain()
+
+        await db_session.refresh(product)
+        assert product.quantity == 1
+        assert product.is_available
+        assert await _orders(db_session) == []
+
+    async def test_failure_is_retried_with_backoff(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        session_factory: TestSessionFactory,
+    ) -> None:
+        calls = 0
+
+        async def flaky(session: AsyncSession, checkout: dict[str, Any]) -> None:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise RuntimeError("database hiccup")
+
+        pool = _pool(session_factory, {"checkout.session.completed": flaky})
+        await _post(client, checkout_session_event())
+
+        assert await pool.drain() == 1  # failed, and not due again yet
+
+        [stored] = await _events(db_session)
+        assert stored.status == WebhookEventStatus.PENDING
+        assert stored.attempts == 1
+        assert stored.last_error == "RuntimeError: database hiccup"
+        # Measured from when the worker recorded the failure (the same UPDATE
+        # sets updated_at), not from now(), so it holds under either isolation mode.
+        delay = await db_session.scalar(
+            select(func.extract("epoch", WebhookEvent.next_attempt_at - WebhookEvent.updated_at))
+        )
+        assert delay == pool.retry_delay(1) == 2
+
+        # Time passes...
+        await db_session.execute(update(WebhookEvent).values(next_attempt_at=func.now()))
+        await db_session.commit()
+        assert await pool.drain() == 1
+
+        await db_session.refresh(stored)
+        assert stored.status == WebhookEventStatus.PROCESSED
+        assert stored.attempts == 2
+        assert stored.last_error is None
+
+    async def test_gives_up_after_max_attempts(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        session_factory: TestSessionFactory,
+    ) -> None:
+        async def broken(session: AsyncSession, checkout: dict[str, Any]) -> None:
+            raise RuntimeError("always fails")
+
+        pool = _pool(session_factory, {"checkout.session.completed": broken})
+        await _post(client, checkout_session_event())
+
+        for _ in range(pool.max_attempts):
+            await db_session.execute(update(WebhookEvent).values(next_attempt_at=func.now()))
+            await db_session.commit()
+            await pool.drain()
+
+        [stored] = await _events(db_session)
+        await db_session.refresh(stored)
+        assert stored.status == WebhookEventStatus.FAILED
+        assert stored.attempts == pool.max_attempts
+
+    def test_backoff_is_capped(self, session_factory: TestSessionFactory) -> None:
+        pool = _pool(session_factory)
+
+        assert [pool.retry_delay(n) for n in (1, 2, 3, 10)] == [2, 4, 8, 60]
+
+    @pytest.mark.commits
+    async def test_background_workers_pick_up_new_events(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        session_factory: TestSessionFactory,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        product = await _create_product(db_session, "figure")
+        pool = _pool(session_factory)
+        pool.poll_interval = 60  # so only the request's wake-up can start the work
+        monkeypatch.setattr("app.routers.webhooks.webhook_workers", pool)
+        pool.start()
+        try:
+            response = await _post(client, checkout_session_event(product_ids=[product.id]))
+            assert response.status_code == 200
+            for _ in range(200):
+                if await _orders(db_session):
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await pool.stop()
+
+        assert len(await _orders(db_session)) == 1
+
+
+class TestCreateOrderFromCheckout:
+    """The order is written with the same four statements whatever the cart size."""
+
+    async def _checkout(
+        self, db_session: AsyncSession, session_factory: TestSessionFactory, size: int
+    ) -> tuple[list[Product], dict[str, Any]]:
+        products = [
+            await _create_product(db_session, f"item-{size}-{i}", price_cents=100 + i)
+            for i in range(size)
+        ]
+        ids = [product.id for product in reversed(products)]  # not in id or insert order
+        async with session_factory() as session:
+            hold = await reserve_products(session, ids)
+        event = checkout_session_event(product_ids=ids, hold_id=hold.hold_id)
+        return products, event["data"]["object"]
+
+    async def test_same_statements_for_any_cart_size(
+        self,
+        db_session: AsyncSession,
+        session_factory: TestSessionFactory,
+        sql_statements: list[str],
+    ) -> None:
+        statements_by_size = {}
+        for size in (1, 25):
+            products, checkout = await self._checkout(db_session, session_factory, size)
+            sql_statements.clear()
+
+            async with session_factory() as session:
+                order_id = await create_order_from_checkout(session, checkout)
+
+            statements_by_size[size] = list(sql_statements)
+            order = await db_session.scalar(
+                select(Order).where(Order.id == order_id).options(selectinload(Order.items))
+            )
+            assert order is not None
+            assert sorted(item.price_cents for item in order.items) == [
+                product.price_cents for product in products
+            ]
+            for product in products:
+                await db_session.refresh(product)
+                assert not product.is_available
+
+        insert_order, update_products, insert_items, consume = statements_by_size[25]
+        assert insert_order.startswith("INSERT INTO orders")
+        assert "UPDATE products" in update_products and "= ANY" in update_products
+        assert insert_items.startswith("INSERT INTO order_items") and "unnest" in insert_items
+        assert consume.startswith("DELETE FROM product_reservations")
+        # Same SQL text: prepared once, reused for every cart size.
+        assert statements_by_size[1] == statements_by_size[25]
+
+    async def test_already_recorded_session_stops_at_the_insert(
+        self,
+        db_session: AsyncSession,
+        session_factory: TestSessionFactory,
+        sql_statements: list[str],
+    ) -> None:
+        _, checkout = await self._checkout(db_session, session_factory, 3)
+        async with session_factory() as session:
+            assert await create_order_from_checkout(session, checkout) is not None
+        sql_statements.clear()
+
+        async with session_factory() as session:
+            assert await create_order_from_checkout(session, checkout) is None
+
+        [statement] = sql_statements
+        assert "ON CONFLICT" in statement
+        assert len(await _orders(db_session)) == 1
@@ -1,5 +1,5 @@
 import { api } from "@/lib/api";
-import { type PaginatedResponse, type Product } from "@/types";
+import { type PaginatedResponse, type ProductSummary } from "@/types";
 import { ProductGrid } from "@/components/product/ProductGrid";
 import { Button } from "@/components/ui/Button";
 
@@ -9,9 +9,10 @@ import { Button } from "@/components/ui/Button";
  */
 async function HomePage() {
   // Fetch first 8 products with ISR revalidation
-  const data = await api<PaginatedResponse<Product>>("/products?per_page=8", {
-    next: { revalidate: 60 },
-  });
+  const data = await api<PaginatedResponse<ProductSummary>>(
+    "/products?per_page=8&fields=summary",
+    { next: { revalidate: 60 } },
+  );
 
   return (
     <div className="min-h-screen">
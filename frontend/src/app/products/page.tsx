@@ -1,5 +1,5 @@
 import { api } from "@/lib/api";
-import { type PaginatedResponse, type Product } from "@/types";
+import { type PaginatedResponse, type ProductSummary } from "@/types";
 import { ProductGrid } from "@/components/product/ProductGrid";
 import { Button } from "@/components/ui/Button";
 
@@ -28,27 +28,33 @@ async function ProductsPage({ searchParams }: ProductsPageProps) {
   const queryParams = new URLSearchParams({
     page: page.toString(),
     per_page: "12",
+    fields: "summary",
   });
   if (category) queryParams.set("category", category);
   if (condition) queryParams.set("condition", condition);
   if (search) queryParams.set("search", search);
 
-  const data = await api<PaginatedResponse<Product>>(
+  const data = await api<PaginatedResponse<ProductSummary>>(
     `/products?${queryParams.toString()}`,
     { next: { revalidate: 60 } },
   );
 
   const hasPrev = page > 1;
-  const hasNext = page < data.pages;
+  // Without a total (`include_total=false`), next_cursor tells us whether
+  // another page exists.
+  const hasNext =
+    data.pages !== null ? page < data.pages : data.next_cursor !== null;
 
   return (
     <div className="mx-auto max-w-7xl px-4 py-12 sm:px-6 lg:px-8">
       {/* Header */}
       <div className="mb-8">
         <h1 className="text-3xl font-bold text-foreground">Shop All</h1>
-        <p className="mt-2 text-muted-foreground">
-          {data.total} {data.total === 1 ? "product" : "products"} available
-        </p>
+        {data.total !== null && (
+          <p className="mt-2 text-muted-foreground">
+            {data.total} {data.total === 1 ? "product" : "products"} available
+          </p>
+        )}
       </div>
 
       {/* Product Grid */}
@@ -58,7 +64,7 @@ async function ProductsPage({ searchParams }: ProductsPageProps) {
       />
 
       {/* Pagination */}
-      {data.pages > 1 && (
+      {(hasPrev || hasNext) && (
         <div className="mt-12 flex items-center justify-center gap-4">
           {hasPrev && (
             <Button
@@ -70,7 +76,8 @@ async function ProductsPage({ searchParams }: ProductsPageProps) {
             </Button>
           )}
           <span className="text-sm text-muted-foreground">
-            Page {page} of {data.pages}
+            Page {page}
+            {data.pages !== null && ` of ${data.pages}`}
           </span>
           {hasNext && (
             <Button
@@ -1,12 +1,12 @@
 import { Card, CardContent } from "@/components/ui/Card";
 import { formatPrice } from "@/lib/utils";
-import { type Product } from "@/types";
+import { type ProductSummary } from "@/types";
 import { ProductImage } from "./ProductImage";
 import { ConditionBadge } from "./ConditionBadge";
 import Link from "next/link";
 
 interface ProductCardProps {
-  product: Product;
+  product: ProductSummary;
 }
 
 /**
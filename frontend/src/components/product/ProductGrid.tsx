@@ -1,8 +1,8 @@
-import { type Product } from "@/types";
+import { type ProductSummary } from "@/types";
 import { ProductCard } from "./ProductCard";
 
 interface ProductGridProps {
-  products: Product[];
+  products: ProductSummary[];
   emptyMessage?: string;
 }
 
@@ -22,6 +22,26 @@ export interface Product {
   updated_at: string;
 }
 
+// Slim listing item from GET /products?fields=summary — what a card needs
+export type ProductSummary = Pick<
+  Product,
+  | "id"
+  | "name"
+  | "slug"
+  | "price_cents"
+  | "condition"
+  | "category"
+  | "image_url"
+  | "is_available"
+>;
+
+// Full-text search hit from GET /products/search
+export interface ProductSearchResult extends Product {
+  rank: number;
+  // Description excerpt with matches wrapped in <mark>...</mark>
+  snippet: string;
+}
+
 export interface OrderItem {
   id: string;
   order_id: string;
@@ -48,8 +68,11 @@ export interface Order {
 // Paginated response envelope from the API
 export interface PaginatedResponse<T> {
   items: T[];
-  total: number;
+  // null when requested with `include_total=false`
+  total: number | null;
   page: number;
   per_page: number;
-  pages: number;
+  pages: number | null;
+  // Opaque keyset cursor — pass back as `?cursor=` for the next page
+  next_cursor: string | null;
 }